@@ -0,0 +1,42 @@
+"""index income_entries.metadata_json for containment filters
+
+Revision ID: 1c2d3e4f5a6b
+Revises: a6b7c8d9e0f1
+Create Date: 2026-10-16
+
+``GET /finances/income?recurrence_type=`` filters with
+``metadata_json @> '{"recurrence_type": ...}'``. A ``jsonb_path_ops`` GIN
+index supports exactly that operator and is much smaller than the
+default ``jsonb_ops`` one. Built CONCURRENTLY so the income table stays
+writable during the deploy.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "1c2d3e4f5a6b"
+down_revision: Union[str, None] = "a6b7c8d9e0f1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_income_metadata_path_ops",
+            "income_entries",
+            ["metadata_json"],
+            postgresql_using="gin",
+            postgresql_ops={"metadata_json": "jsonb_path_ops"},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_income_metadata_path_ops",
+            table_name="income_entries",
+            postgresql_concurrently=True,
+        )
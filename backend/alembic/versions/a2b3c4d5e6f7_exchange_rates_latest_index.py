@@ -0,0 +1,36 @@
+"""covering index for latest exchange-rate lookups
+
+Revision ID: a2b3c4d5e6f7
+Revises: f1a2b3c4d5e6
+Create Date: 2026-10-16
+
+``SELECT rate ... WHERE from_currency = ? AND to_currency = ? ORDER BY
+effective_date DESC LIMIT 1`` runs before every USD conversion. With
+``rate`` INCLUDEd it is answered from the index alone.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "a2b3c4d5e6f7"
+down_revision: Union[str, None] = "f1a2b3c4d5e6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_exchange_rates_latest",
+            "exchange_rates",
+            ["from_currency", "to_currency", sa.text("effective_date DESC")],
+            postgresql_include=["rate"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_exchange_rates_latest", table_name="exchange_rates", postgresql_concurrently=True)
@@ -0,0 +1,40 @@
+"""index facturas for the newest-first listing
+
+Revision ID: a6b7c8d9e0f1
+Revises: z5a6b7c8d9e0
+Create Date: 2026-10-16
+
+``GET /facturas`` orders by ``created_at DESC`` with an optional
+``status = :status`` filter and now supports keyset paging on
+``created_at``. ``(status, created_at DESC)`` serves the filtered
+listing as an index range scan; ``created_at DESC`` serves the
+unfiltered one without a seq scan + sort.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "a6b7c8d9e0f1"
+down_revision: Union[str, None] = "z5a6b7c8d9e0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_INDEXES = (
+    ("ix_facturas_status_created_at", ["status", sa.text("created_at DESC")]),
+    ("ix_facturas_created_at", [sa.text("created_at DESC")]),
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, columns in _INDEXES:
+            op.create_index(name, "facturas", columns, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _columns in reversed(_INDEXES):
+            op.drop_index(name, table_name="facturas", postgresql_concurrently=True)
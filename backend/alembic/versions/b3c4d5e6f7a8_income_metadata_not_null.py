@@ -0,0 +1,41 @@
+"""make income_entries.metadata_json NOT NULL DEFAULT '{}'
+
+Revision ID: b3c4d5e6f7a8
+Revises: a2b3c4d5e6f7
+Create Date: 2026-10-16
+
+Rows without metadata now hold an empty object, so readers always get a
+dict and the recurrence helpers no longer need None/type guards.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "b3c4d5e6f7a8"
+down_revision: Union[str, None] = "a2b3c4d5e6f7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("UPDATE income_entries SET metadata_json = '{}'::jsonb WHERE metadata_json IS NULL")
+    op.alter_column(
+        "income_entries",
+        "metadata_json",
+        existing_type=postgresql.JSONB(),
+        nullable=False,
+        server_default=sa.text("'{}'::jsonb"),
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "income_entries",
+        "metadata_json",
+        existing_type=postgresql.JSONB(),
+        nullable=True,
+        server_default=None,
+    )
@@ -0,0 +1,48 @@
+"""store income_entries.monthly_amount_usd as a generated column
+
+Revision ID: c4d5e6f7a8b9
+Revises: b3c4d5e6f7a8
+Create Date: 2026-10-16
+
+The monthly USD equivalent used to be derived per row in Python on every
+listing and summary. It only depends on the row itself (amount_usd,
+is_recurring, metadata_json recurrence keys), so Postgres now computes
+it once at write time. Mirrors ``extract_income_recurrence`` +
+``income_monthly_equivalent``.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "c4d5e6f7a8b9"
+down_revision: Union[str, None] = "b3c4d5e6f7a8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_MONTHLY_AMOUNT_USD = """CASE COALESCE(
+    CASE WHEN lower(trim(metadata_json->>'recurrence_type')) IN ('monthly', 'one_time', 'custom')
+         THEN lower(trim(metadata_json->>'recurrence_type')) END,
+    CASE WHEN is_recurring THEN 'monthly' ELSE 'one_time' END)
+  WHEN 'one_time' THEN 0.00
+  WHEN 'custom' THEN round(amount_usd / GREATEST(
+    CASE WHEN trim(metadata_json->>'custom_interval_months') ~ '^-?[0-9]{1,9}$'
+         THEN trim(metadata_json->>'custom_interval_months')::integer ELSE 1 END, 1), 2)
+  ELSE round(amount_usd, 2)
+END"""
+
+
+def upgrade() -> None:
+    op.add_column(
+        "income_entries",
+        sa.Column(
+            "monthly_amount_usd",
+            sa.Numeric(12, 2),
+            sa.Computed(_MONTHLY_AMOUNT_USD, persisted=True),
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("income_entries", "monthly_amount_usd")
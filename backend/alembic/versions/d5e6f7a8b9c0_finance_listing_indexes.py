@@ -0,0 +1,41 @@
+"""indexes matching the finance listings' sort order
+
+Revision ID: d5e6f7a8b9c0
+Revises: c4d5e6f7a8b9
+Create Date: 2026-10-16
+
+``GET /finances/income``, ``/expenses`` and ``/invoices`` order by
+``(date DESC, id)`` and can now be paged with ``limit``/``offset``.
+Indexes in that exact order let a page stop after ``offset + limit``
+entries instead of sorting the table. ``(status, issue_date DESC)``
+serves the status-filtered invoice listing.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "d5e6f7a8b9c0"
+down_revision: Union[str, None] = "c4d5e6f7a8b9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_INDEXES = (
+    ("ix_income_date_desc_id", "income_entries", [sa.text("date DESC"), "id"]),
+    ("ix_expenses_date_desc_id", "expenses", [sa.text("date DESC"), "id"]),
+    ("ix_invoices_status_issue_date", "invoices", ["status", sa.text("issue_date DESC")]),
+    ("ix_invoices_issue_date_desc_id", "invoices", [sa.text("issue_date DESC"), "id"]),
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in _INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _columns in reversed(_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,42 @@
+"""composite indexes for finance reports
+
+Revision ID: d9e0f1a2b3c4
+Revises: c8d9e0f1a2b3
+Create Date: 2026-10-16
+
+Every income/expense report filters a ``date`` range, and the
+per-customer/per-partner timelines filter by owner and sort by date.
+The invoices ``(status, due_date)`` index serves the overdue check
+without scanning paid or cancelled rows.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "d9e0f1a2b3c4"
+down_revision: Union[str, None] = "c8d9e0f1a2b3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_INDEXES = (
+    ("ix_income_date_curr", "income_entries", ["date", "currency"]),
+    ("ix_income_customer_date", "income_entries", ["customer_id", sa.text("date DESC")]),
+    ("ix_expenses_date_category", "expenses", ["date", "category"]),
+    ("ix_expenses_paid_by_date", "expenses", ["paid_by", sa.text("date DESC")]),
+    ("ix_invoices_status_due_date", "invoices", ["status", "due_date"]),
+    ("ix_invoices_customer_issue_date", "invoices", ["customer_id", sa.text("issue_date DESC")]),
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in _INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _columns in reversed(_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
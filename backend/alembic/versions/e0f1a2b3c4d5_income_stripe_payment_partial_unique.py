@@ -0,0 +1,42 @@
+"""make income_entries.stripe_payment_id uniqueness a partial index
+
+Revision ID: e0f1a2b3c4d5
+Revises: d9e0f1a2b3c4
+Create Date: 2026-10-16
+
+Manual income rows have no Stripe id, yet the plain UNIQUE constraint
+indexes their NULLs too. A partial unique index over non-NULL ids keeps
+the same guarantee (NULLs never conflicted) with a smaller index. The
+new index is built CONCURRENTLY before the old constraint is dropped so
+uniqueness is enforced throughout.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "e0f1a2b3c4d5"
+down_revision: Union[str, None] = "d9e0f1a2b3c4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "uq_income_stripe_payment_id",
+            "income_entries",
+            ["stripe_payment_id"],
+            unique=True,
+            postgresql_where=sa.text("stripe_payment_id IS NOT NULL"),
+            postgresql_concurrently=True,
+        )
+    op.drop_constraint("income_entries_stripe_payment_id_key", "income_entries", type_="unique")
+
+
+def downgrade() -> None:
+    op.create_unique_constraint(
+        "income_entries_stripe_payment_id_key", "income_entries", ["stripe_payment_id"]
+    )
+    op.drop_index("uq_income_stripe_payment_id", table_name="income_entries")
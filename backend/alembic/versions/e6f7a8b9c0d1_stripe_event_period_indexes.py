@@ -0,0 +1,46 @@
+"""indexes for the Stripe ledger's month-window queries
+
+Revision ID: e6f7a8b9c0d1
+Revises: d5e6f7a8b9c0
+Create Date: 2026-10-16
+
+The reconciliation summary, parity check and dashboard all filter
+``stripe_payment_events`` by an ``occurred_at`` month window and
+``stripe_payout_events`` by ``created_at``/``paid_at``; the unlinked queue
+lists ``unlinked`` payment events newest first. Neither table had any
+index beyond its primary key and ``stripe_event_id``.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "e6f7a8b9c0d1"
+down_revision: Union[str, None] = "d5e6f7a8b9c0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_INDEXES = (
+    ("ix_stripe_payment_events_occurred_at", "stripe_payment_events", ["occurred_at"], None),
+    (
+        "ix_stripe_payment_events_unlinked_occurred",
+        "stripe_payment_events",
+        [sa.text("occurred_at DESC")],
+        sa.text("unlinked"),
+    ),
+    ("ix_stripe_payout_events_created_at", "stripe_payout_events", ["created_at"], None),
+    ("ix_stripe_payout_events_paid_at", "stripe_payout_events", ["paid_at"], sa.text("status = 'paid'")),
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in _INDEXES:
+            op.create_index(name, table, columns, postgresql_where=where, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _columns, _where in reversed(_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,46 @@
+"""maintain expenses/invoices updated_at with a trigger
+
+Revision ID: f1a2b3c4d5e6
+Revises: e0f1a2b3c4d5
+Create Date: 2026-10-16
+
+The models no longer declare ``onupdate=func.now()`` for these two
+tables, so ORM UPDATEs stop carrying the extra column; a BEFORE UPDATE
+trigger stamps ``updated_at`` instead, which also covers bulk/Core
+updates that bypassed the ORM hook.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "f1a2b3c4d5e6"
+down_revision: Union[str, None] = "e0f1a2b3c4d5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TABLES = ("expenses", "invoices")
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION touch_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at = now();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for table in _TABLES:
+        op.execute(
+            f"CREATE TRIGGER {table}_touch_updated_at BEFORE UPDATE ON {table} "
+            "FOR EACH ROW EXECUTE FUNCTION touch_updated_at()"
+        )
+
+
+def downgrade() -> None:
+    for table in _TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_touch_updated_at ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS touch_updated_at()")
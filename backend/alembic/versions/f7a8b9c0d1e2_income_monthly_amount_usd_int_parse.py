@@ -0,0 +1,70 @@
+"""parse income custom intervals in monthly_amount_usd like int()
+
+Revision ID: f7a8b9c0d1e2
+Revises: e6f7a8b9c0d1
+Create Date: 2026-10-16
+
+The generated ``monthly_amount_usd`` only accepted intervals matching
+``^-?[0-9]{1,9}$`` and fell back to 1 for anything else, while
+``extract_income_recurrence`` parses them with ``int()``: JSON numbers
+such as ``6.0`` and strings such as ``"+3"`` or ``" 4 "`` gave different
+MRR in Python and SQL. The expression now follows ``int()`` (and
+``str.strip()`` for the recurrence type). Postgres cannot change a
+generated column's expression in place before 17, so the column is
+dropped and re-added, which recomputes every row.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "f7a8b9c0d1e2"
+down_revision: Union[str, None] = "e6f7a8b9c0d1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_OLD_MONTHLY_AMOUNT_USD = """CASE COALESCE(
+    CASE WHEN lower(trim(metadata_json->>'recurrence_type')) IN ('monthly', 'one_time', 'custom')
+         THEN lower(trim(metadata_json->>'recurrence_type')) END,
+    CASE WHEN is_recurring THEN 'monthly' ELSE 'one_time' END)
+  WHEN 'one_time' THEN 0.00
+  WHEN 'custom' THEN round(amount_usd / GREATEST(
+    CASE WHEN trim(metadata_json->>'custom_interval_months') ~ '^-?[0-9]{1,9}$'
+         THEN trim(metadata_json->>'custom_interval_months')::integer ELSE 1 END, 1), 2)
+  ELSE round(amount_usd, 2)
+END"""
+
+_NEW_MONTHLY_AMOUNT_USD = """CASE COALESCE(
+    CASE WHEN lower(btrim(metadata_json->>'recurrence_type', E' \\t\\n\\r\\f\\013')) IN ('monthly', 'one_time', 'custom')
+         THEN lower(btrim(metadata_json->>'recurrence_type', E' \\t\\n\\r\\f\\013')) END,
+    CASE WHEN is_recurring THEN 'monthly' ELSE 'one_time' END)
+  WHEN 'one_time' THEN 0.00
+  WHEN 'custom' THEN round(amount_usd / GREATEST(
+    CASE jsonb_typeof(metadata_json->'custom_interval_months')
+      WHEN 'number' THEN trunc((metadata_json->>'custom_interval_months')::numeric)
+      WHEN 'string' THEN CASE WHEN metadata_json->>'custom_interval_months' ~ '^\\s*[+-]?[0-9]+\\s*$'
+                              THEN (metadata_json->>'custom_interval_months')::numeric END
+    END, 1), 2)
+  ELSE round(amount_usd, 2)
+END"""
+
+
+def _replace_column(expression: str) -> None:
+    op.drop_column("income_entries", "monthly_amount_usd")
+    op.add_column(
+        "income_entries",
+        sa.Column(
+            "monthly_amount_usd",
+            sa.Numeric(12, 2),
+            sa.Computed(expression, persisted=True),
+        ),
+    )
+
+
+def upgrade() -> None:
+    _replace_column(_NEW_MONTHLY_AMOUNT_USD)
+
+
+def downgrade() -> None:
+    _replace_column(_OLD_MONTHLY_AMOUNT_USD)
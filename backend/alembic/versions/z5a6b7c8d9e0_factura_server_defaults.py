@@ -0,0 +1,39 @@
+"""move facturas scalar defaults to the server
+
+Revision ID: z5a6b7c8d9e0
+Revises: y4z5a6b7c8d9
+Create Date: 2026-10-16
+
+``Factura.payment_method``, ``tax``, ``currency`` and ``status`` had
+Python-side ORM defaults only. They are now ``server_default`` so bulk
+``insert(Factura)`` paths that omit them get the value from Postgres
+instead of per-row default dispatch in SQLAlchemy.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "z5a6b7c8d9e0"
+down_revision: Union[str, None] = "y4z5a6b7c8d9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_DEFAULTS = (
+    ("payment_method", "'PUE'"),
+    ("tax", "0"),
+    ("currency", "'MXN'"),
+    ("status", "'draft'"),
+)
+
+
+def upgrade() -> None:
+    for column, default in _DEFAULTS:
+        op.alter_column("facturas", column, server_default=sa.text(default))
+
+
+def downgrade() -> None:
+    for column, _ in _DEFAULTS:
+        op.alter_column("facturas", column, server_default=None)
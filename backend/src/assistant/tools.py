@@ -7,7 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.customers.models import Customer
 from src.finances.models import CashBalance, Expense, IncomeEntry, Invoice
-from src.finances.recurrence import extract_income_recurrence, income_monthly_mrr_equivalent
+from src.finances.recurrence import extract_income_recurrence
 from src.kpis.models import KPISnapshot
 from src.meetings.models import Meeting
 from src.okrs.models import KeyResult, OKRPeriod, Objective
@@ -165,15 +165,17 @@ def _dec(v):
 async def execute_tool(name: str, args: dict, db: AsyncSession) -> str:
     """Execute a tool function and return JSON string result."""
     if name == "query_kpis":
-        from datetime import date as date_type
+        from datetime import date as date_type, timedelta
         today = date_type.today()
+        month_start = today.replace(day=1)
+        next_month_start = (month_start + timedelta(days=32)).replace(day=1)
         # MRR
         mrr_r = await db.execute(select(func.coalesce(func.sum(Customer.mrr_usd), 0)).where(Customer.status == "active"))
         mrr = float(mrr_r.scalar() or 0)
         # Revenue this month
         rev_r = await db.execute(
             select(func.coalesce(func.sum(IncomeEntry.amount_usd), 0))
-            .where(func.extract("year", IncomeEntry.date) == today.year, func.extract("month", IncomeEntry.date) == today.month)
+            .where(IncomeEntry.date >= month_start, IncomeEntry.date < next_month_start)
         )
         revenue = float(rev_r.scalar() or 0)
         # Expenses
@@ -226,9 +228,7 @@ async def execute_tool(name: str, args: dict, db: AsyncSession) -> str:
                     "category": i.category,
                     "recurrence_type": recurrence_type,
                     "custom_interval_months": custom_interval_months,
-                    "monthly_amount_usd": _dec(
-                        income_monthly_mrr_equivalent(i.amount_usd, recurrence_type, custom_interval_months)
-                    ),
+                    "monthly_amount_usd": _dec(i.monthly_amount_usd),
                 }
             )
         return json.dumps(payload)
@@ -6,9 +6,11 @@ from src.common.config import settings
 engine = create_async_engine(
     settings.database_url,
     echo=settings.environment == "development",
-    connect_args={"statement_cache_size": 0},
-    pool_size=5,
-    max_overflow=10,
+    connect_args={"statement_cache_size": settings.database_statement_cache_size},
+    pool_size=settings.database_pool_size,
+    max_overflow=settings.database_max_overflow,
+    pool_pre_ping=settings.database_pool_pre_ping,
+    pool_recycle=settings.database_pool_recycle,
 )
 
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
@@ -49,6 +51,8 @@ if settings.eva_database_url:
         connect_args={"statement_cache_size": 0},
         pool_size=3,
         max_overflow=5,
+        pool_pre_ping=settings.database_pool_pre_ping,
+        pool_recycle=settings.database_pool_recycle,
     )
     eva_async_session = async_sessionmaker(eva_engine, class_=AsyncSession, expire_on_commit=False)
 
@@ -15,7 +15,7 @@ from src.common.database import async_session, eva_async_session
 from src.customers.models import Customer
 from src.eva_platform.models import EvaAccount
 from src.eva_platform.pricing_models import AccountPricingProfile
-from src.facturas.models import Factura
+from src.facturas.models import SAT_VALID_STATUSES, Factura
 from src.finances.models import (
     CashBalance,
     ExchangeRate,
@@ -25,11 +25,7 @@ from src.finances.models import (
     StripePaymentEvent,
     StripePayoutEvent,
 )
-from src.finances.recurrence import (
-    extract_income_recurrence,
-    income_monthly_equivalent,
-    income_monthly_mrr_equivalent,
-)
+from src.finances.recurrence import income_monthly_equivalent_sql
 from src.meetings.models import Meeting
 from src.empresas.models import Empresa
 from src.tasks.models import Task
@@ -140,6 +136,10 @@ async def dashboard_summary(
     period_key, month_start, next_month_start, is_current_period = _resolve_period(period, today)
     period_end = next_month_start - timedelta(days=1)
     period_label = month_start.strftime("%B %Y")
+    income_monthly_native = income_monthly_equivalent_sql(
+        IncomeEntry.amount, IncomeEntry.metadata_json, IncomeEntry.is_recurring
+    )
+    income_in_period = IncomeEntry.date >= month_start
 
     active_customer_condition = and_(
         Customer.signup_date.isnot(None),
@@ -198,7 +198,12 @@ async def dashboard_summary(
             Task.due_date.isnot(None),
             Task.due_date <= period_end,
         ),
-        "all_income": select(IncomeEntry).where(IncomeEntry.date < next_month_start),
+        "income_by_currency": select(
+            IncomeEntry.currency,
+            func.sum(income_monthly_native).filter(income_monthly_native > 0),
+            func.sum(IncomeEntry.monthly_amount_usd),
+            func.sum(IncomeEntry.amount).filter(income_in_period),
+        ).where(IncomeEntry.date < next_month_start).group_by(IncomeEntry.currency),
         "all_expenses": select(Expense).where(Expense.date < next_month_start),
         # Pipeline stages that represent the pre-operativo funnel (legacy
         # prospect analogs). Operativo/churn_risk/inactivo are excluded.
@@ -226,7 +231,7 @@ async def dashboard_summary(
         .order_by(ExchangeRate.effective_date.desc())
         .limit(1),
         "sat_facturas_valid": select(Factura).where(
-            Factura.status == "valid",
+            Factura.status.in_(SAT_VALID_STATUSES),
             func.coalesce(Factura.issued_at, Factura.created_at) >= month_start,
             func.coalesce(Factura.issued_at, Factura.created_at) < next_month_start,
         ),
@@ -281,24 +286,15 @@ async def dashboard_summary(
     meetings_this_month = r["meetings_this_month"].scalar() or 0
 
     # Income MRR supports monthly/custom/one-time recurrence from metadata.
-    income_entries = r["all_income"].scalars().all()
     income_mrr = Decimal("0")
     income_mrr_by_currency: dict[str, Decimal] = {}
     income_total_period_by_currency: dict[str, Decimal] = {}
-    for income in income_entries:
-        recurrence_type, custom_interval_months = extract_income_recurrence(income.metadata_json, income.is_recurring)
-        monthly_native = income_monthly_equivalent(income.amount, recurrence_type, custom_interval_months)
-        if monthly_native > 0:
-            income_mrr_by_currency[income.currency] = (
-                income_mrr_by_currency.get(income.currency, Decimal("0")) + monthly_native
-            ).quantize(Decimal("0.01"))
-
-        if month_start <= income.date < next_month_start:
-            income_total_period_by_currency[income.currency] = (
-                income_total_period_by_currency.get(income.currency, Decimal("0")) + income.amount
-            ).quantize(Decimal("0.01"))
-
-        income_mrr += income_monthly_mrr_equivalent(income.amount_usd, recurrence_type, custom_interval_months)
+    for currency, native_mrr, usd_mrr, native_period in r["income_by_currency"].all():
+        if native_mrr is not None:
+            income_mrr_by_currency[currency] = native_mrr.quantize(Decimal("0.01"))
+        if native_period is not None:
+            income_total_period_by_currency[currency] = native_period.quantize(Decimal("0.01"))
+        income_mrr += usd_mrr or Decimal("0")
     income_mrr = income_mrr.quantize(Decimal("0.01"))
 
     # Process expenses
@@ -414,8 +410,7 @@ async def dashboard_summary(
 
     manual_adjustments_mxn = Decimal("0")
     for income in r["manual_income_period"].scalars().all():
-        metadata = income.metadata_json if isinstance(income.metadata_json, dict) else {}
-        manual_reason = str(metadata.get("manual_reason") or "offline_transfer").strip().lower()
+        manual_reason = str(income.metadata_json.get("manual_reason") or "offline_transfer").strip().lower()
         amount_mxn = _to_mxn(Decimal(income.amount or 0), income.currency, usd_to_mxn)
         if manual_reason in {"offline_transfer", "cash"}:
             payments_received_mxn += amount_mxn
@@ -33,7 +33,7 @@ from sqlalchemy import extract, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.declaracion.schemas import DeclaracionAlert, DeclaracionAlertsResponse
-from src.facturas.models import CfdiPayment, Factura
+from src.facturas.models import SAT_VALID_STATUSES, CfdiPayment, Factura
 
 
 def _prev_month(today: date) -> tuple[int, int]:
@@ -96,7 +96,7 @@ async def compute_alerts(
         (
             await db.execute(
                 select(func.count(Factura.id))
-                .where(Factura.status == "valid")
+                .where(Factura.status.in_(SAT_VALID_STATUSES))
                 .where(Factura.payment_method == "PUE")
                 .where(extract("year", Factura.issued_at) == prev_year)
                 .where(extract("month", Factura.issued_at) == prev_month)
@@ -31,7 +31,7 @@ from src.declaracion.schemas import (
     IvaSimplificado,
 )
 from src.declaracion.tables import resico_pf_rate_for
-from src.facturas.models import CfdiPayment, Factura
+from src.facturas.models import SAT_VALID_STATUSES, CfdiPayment, Factura
 from src.facturas_recibidas.models import FacturaRecibida
 
 logger = logging.getLogger(__name__)
@@ -57,7 +57,7 @@ async def _sum_pue_ingresos(
             func.coalesce(func.sum(Factura.isr_retention), 0),
             func.coalesce(func.sum(Factura.iva_retention), 0),
         )
-        .where(Factura.status == "valid")
+        .where(Factura.status.in_(SAT_VALID_STATUSES))
         .where(Factura.payment_method == "PUE")
         .where(extract("year", Factura.issued_at) == year)
         .where(extract("month", Factura.issued_at) == month)
@@ -26,6 +26,7 @@ from src.eva_billing.schemas import (
     EvaBillingStatusItem,
     EvaBillingStatusResponse,
 )
+from src.facturas import cache as factura_cache
 from src.facturas import service as facturapi
 from src.facturas.models import Factura
 from src.facturas.schemas import FacturaCreate, FacturaLineItem
@@ -364,6 +365,7 @@ class EvaBillingService:
         response_factura = factura
         if payload.refund_amount_minor >= payload.original_total_minor:
             response = await facturapi.cancel_invoice(factura.facturapi_id, motive="03")
+            factura_cache.invalidate_on_commit(db, factura.id)
             factura.status = "cancelled"
             factura.cancellation_status = response.get("cancellation_status") or response.get("status")
             record.status = "canceled"
@@ -543,9 +545,9 @@ class EvaBillingService:
         line_items_store = []
         for li in data.line_items:
             line_sub = li.unit_price * li.quantity
-            line_tax = line_sub * li.tax_rate
             subtotal += line_sub
-            tax_total += line_tax
+            if li.tax_rate:
+                tax_total += line_sub * li.tax_rate
             if li.isr_retention:
                 isr_ret_total += line_sub * li.isr_retention
             if li.iva_retention:
@@ -558,19 +560,7 @@ class EvaBillingService:
                 # localized/reworded and silently mis-persist the state).
                 if cedular_state is None:
                     cedular_state = state_from_zip(data.customer_zip)
-            line_items_store.append(
-                {
-                    "product_key": li.product_key,
-                    "description": li.description,
-                    "quantity": li.quantity,
-                    "unit_price": float(li.unit_price),
-                    "tax_rate": float(li.tax_rate),
-                    "isr_retention": float(li.isr_retention) if li.isr_retention else None,
-                    "iva_retention": float(li.iva_retention) if li.iva_retention else None,
-                    "cedular_rate": float(li.cedular_rate) if li.cedular_rate else None,
-                    "cedular_label": li.cedular_label,
-                }
-            )
+            line_items_store.append(facturapi.line_item_json(li))
         factura = Factura(
             facturapi_id=None,
             customer_name=data.customer_name or "",
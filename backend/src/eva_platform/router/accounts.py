@@ -614,9 +614,10 @@ async def approve_draft(
     normalized_billing_interval = normalize_billing_cycle(draft.billing_cycle)
     password = secrets.token_urlsafe(16)
 
-    # 1. Create Supabase user
+    # 1. Create (or reuse) Supabase user. Approvals are retried after
+    # failures that happen past auth user creation, so look up first.
     try:
-        sb_user = await SupabaseAdminClient.admin_create_user(
+        sb_user = await SupabaseAdminClient.get_or_create_user(
             email=normalized_owner_email,
             password=password,
             user_metadata={
@@ -7,6 +7,7 @@ import uuid
 
 import httpx
 from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import TypeAdapter
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -46,6 +47,11 @@ router = APIRouter(prefix="/infrastructure", tags=["infrastructure"])
 
 ACTIVE_ALLOCATION_STATES = ("placed", "running", "recovering", "error")
 
+# Prebuilt list validators: pydantic-core walks the rows in one pass instead
+# of constructing each response model from Python.
+_HOST_LIST = TypeAdapter(list[RuntimeHostResponse])
+_EMPLOYEE_LIST = TypeAdapter(list[RuntimeEmployeeResponse])
+
 
 # ── Helpers ──────────────────────────────────────────────
 
@@ -96,37 +102,30 @@ async def list_hosts(
     )
 
     query = (
-        select(EvaOpenclawRuntimeHost, func.coalesce(alloc_counts.c.tenant_count, 0).label("tenant_count"))
+        select(
+            EvaOpenclawRuntimeHost.id,
+            EvaOpenclawRuntimeHost.provider_host_id,
+            EvaOpenclawRuntimeHost.name,
+            EvaOpenclawRuntimeHost.region,
+            EvaOpenclawRuntimeHost.host_class,
+            EvaOpenclawRuntimeHost.state,
+            EvaOpenclawRuntimeHost.public_ip,
+            EvaOpenclawRuntimeHost.vcpu,
+            EvaOpenclawRuntimeHost.ram_mb,
+            EvaOpenclawRuntimeHost.disk_gb,
+            EvaOpenclawRuntimeHost.max_tenants,
+            func.coalesce(alloc_counts.c.tenant_count, 0).label("tenant_count"),
+            EvaOpenclawRuntimeHost.saturation,
+            EvaOpenclawRuntimeHost.last_heartbeat_at,
+            EvaOpenclawRuntimeHost.created_at,
+        )
         .outerjoin(alloc_counts, EvaOpenclawRuntimeHost.id == alloc_counts.c.runtime_host_id)
         .where(EvaOpenclawRuntimeHost.state != "released")
         .order_by(EvaOpenclawRuntimeHost.created_at)
     )
 
     result = await eva_db.execute(query)
-    hosts = []
-    for row in result.all():
-        host = row[0]
-        tenant_count = row[1]
-        hosts.append(
-            RuntimeHostResponse(
-                id=host.id,
-                provider_host_id=host.provider_host_id,
-                name=host.name,
-                region=host.region,
-                host_class=host.host_class,
-                state=host.state,
-                public_ip=host.public_ip,
-                vcpu=host.vcpu,
-                ram_mb=host.ram_mb,
-                disk_gb=host.disk_gb,
-                max_tenants=host.max_tenants,
-                tenant_count=tenant_count,
-                saturation=host.saturation,
-                last_heartbeat_at=host.last_heartbeat_at,
-                created_at=host.created_at,
-            )
-        )
-    return hosts
+    return _HOST_LIST.validate_python(result.all(), from_attributes=True)
 
 
 @router.get("/hosts/{host_id}/employees", response_model=list[RuntimeEmployeeResponse])
@@ -137,7 +136,24 @@ async def list_host_employees(
 ):
     """List employees allocated to a specific host."""
     query = (
-        select(EvaOpenclawAgent, EvaOpenclawRuntimeAllocation, EvaAccount.name.label("account_name"))
+        select(
+            EvaOpenclawAgent.id,
+            EvaOpenclawAgent.agent_id,
+            EvaOpenclawAgent.account_id,
+            EvaAccount.name.label("account_name"),
+            EvaOpenclawAgent.label,
+            EvaOpenclawAgent.status,
+            EvaOpenclawAgent.phone_number,
+            EvaOpenclawRuntimeAllocation.state.label("allocation_state"),
+            EvaOpenclawRuntimeAllocation.container_name,
+            EvaOpenclawRuntimeAllocation.gateway_port,
+            EvaOpenclawRuntimeAllocation.cpu_reservation_mcpu,
+            EvaOpenclawRuntimeAllocation.ram_reservation_mb,
+            EvaOpenclawRuntimeAllocation.reconnect_risk,
+            EvaOpenclawAgent.whatsapp_connected,
+            EvaOpenclawAgent.telegram_connected,
+            EvaOpenclawAgent.vps_ip,
+        )
         .outerjoin(
             EvaOpenclawRuntimeAllocation,
             EvaOpenclawAgent.id == EvaOpenclawRuntimeAllocation.openclaw_agent_id,
@@ -150,32 +166,7 @@ async def list_host_employees(
         .order_by(EvaOpenclawAgent.label)
     )
     result = await eva_db.execute(query)
-    employees = []
-    for row in result.all():
-        agent = row[0]
-        alloc = row[1]
-        account_name = row[2]
-        employees.append(
-            RuntimeEmployeeResponse(
-                id=agent.id,
-                agent_id=agent.agent_id,
-                account_id=agent.account_id,
-                account_name=account_name,
-                label=agent.label,
-                status=agent.status,
-                phone_number=agent.phone_number,
-                allocation_state=alloc.state if alloc else None,
-                container_name=alloc.container_name if alloc else None,
-                gateway_port=alloc.gateway_port if alloc else None,
-                cpu_reservation_mcpu=alloc.cpu_reservation_mcpu if alloc else None,
-                ram_reservation_mb=alloc.ram_reservation_mb if alloc else None,
-                reconnect_risk=alloc.reconnect_risk if alloc else None,
-                whatsapp_connected=agent.whatsapp_connected,
-                telegram_connected=agent.telegram_connected,
-                vps_ip=agent.vps_ip,
-            )
-        )
-    return employees
+    return _EMPLOYEE_LIST.validate_python(result.all(), from_attributes=True)
 
 
 @router.get("/employees/{openclaw_agent_id}", response_model=RuntimeEmployeeDetailResponse)
@@ -10,6 +10,8 @@ import os
 import re
 import stat
 import tempfile
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from pathlib import PurePosixPath
 
@@ -24,6 +26,10 @@ _CONTAINER_NAME_RE = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9_.-]*$")
 _IP_RE = re.compile(r"^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$")
 _MAX_OCTET = 255
 
+# Resolved once at startup by setup_ssh_key(); _connect reads it directly so
+# the per-request path skips the filesystem checks and fingerprint hashing.
+_SSH_KEY_PATH: str | None = None
+
 
 def _validate_container_name(name: str) -> str:
     if not _CONTAINER_NAME_RE.match(name) or len(name) > 128:
@@ -82,6 +88,91 @@ def _resolve_ssh_key_path() -> str:
     return key_path
 
 
+async def setup_ssh_key() -> None:
+    """Resolve the SSH key once during app startup.
+
+    No-op when SSH access isn't configured (local dev); a configured but
+    broken key raises here instead of on the first infrastructure request.
+    """
+    global _SSH_KEY_PATH
+    if not (os.environ.get("EVA_SSH_PRIVATE_KEY_PATH") or settings.eva_ssh_private_key_base64):
+        logger.info("SSH key not configured; infrastructure SSH endpoints disabled")
+        return
+    _SSH_KEY_PATH = os.path.abspath(_resolve_ssh_key_path())
+
+
+def _ssh_key_path() -> str:
+    global _SSH_KEY_PATH
+    if _SSH_KEY_PATH is None:
+        _SSH_KEY_PATH = os.path.abspath(_resolve_ssh_key_path())
+    return _SSH_KEY_PATH
+
+
+class _SFTPSession:
+    """File operations over an already-open SFTP channel.
+
+    Obtained from ``InfraSSHClient.sftp_session`` so a file-browser request
+    that lists a folder and previews files pays the connect + SFTP init
+    round trips once.
+    """
+
+    def __init__(self, sftp: asyncssh.SFTPClient) -> None:
+        self._sftp = sftp
+
+    async def stat(self, path: str) -> asyncssh.SFTPAttrs:
+        return await self._sftp.stat(_sanitize_path(path))
+
+    async def list_directory(self, path: str = "/root/.openclaw/") -> list[dict]:
+        """List directory contents."""
+        path = _sanitize_path(path)
+        entries = []
+        async for entry in self._sftp.scandir(path):
+            name = entry.filename
+            if name in (".", ".."):
+                continue
+            attrs = entry.attrs
+            is_dir = bool(attrs.permissions and stat.S_ISDIR(attrs.permissions))
+            modified_at = None
+            if attrs.mtime is not None:
+                modified_at = datetime.fromtimestamp(
+                    attrs.mtime, tz=timezone.utc
+                ).isoformat()
+            entries.append(
+                {
+                    "name": name,
+                    "path": f"{path.rstrip('/')}/{name}",
+                    "is_dir": is_dir,
+                    "size": attrs.size if not is_dir else None,
+                    "modified_at": modified_at,
+                }
+            )
+        # Sort: directories first, then alphabetically
+        entries.sort(key=lambda e: (not e["is_dir"], e["name"].lower()))
+        return entries
+
+    async def read_file(self, path: str, *, max_bytes: int = 1_048_576) -> dict:
+        """Read file content (capped at max_bytes)."""
+        path = _sanitize_path(path)
+        file_attrs = await self._sftp.stat(path)
+        file_size = file_attrs.size or 0
+        truncated = file_size > max_bytes
+
+        async with self._sftp.open(path, "rb") as f:
+            raw = await f.read(max_bytes)
+
+        try:
+            content = raw.decode("utf-8")
+        except UnicodeDecodeError:
+            content = f"[Binary file, {file_size} bytes]"
+
+        return {
+            "path": path,
+            "content": content,
+            "size": file_size,
+            "truncated": truncated,
+        }
+
+
 class InfraSSHClient:
     """Async SSH client for infrastructure operations on OpenClaw hosts.
 
@@ -91,7 +182,7 @@ class InfraSSHClient:
 
     async def _connect(self, host_ip: str) -> asyncssh.SSHClientConnection:
         _validate_ip(host_ip)
-        key_path = _resolve_ssh_key_path()
+        key_path = _ssh_key_path()
         return await asyncssh.connect(
             host_ip,
             username="root",
@@ -150,63 +241,28 @@ class InfraSSHClient:
             )
             return result.stdout or ""
 
+    @asynccontextmanager
+    async def sftp_session(self, host_ip: str) -> AsyncIterator[_SFTPSession]:
+        """Hold one SSH connection + SFTP channel open for several file ops."""
+        async with await self._connect(host_ip) as conn:
+            async with conn.start_sftp_client() as sftp:
+                yield _SFTPSession(sftp)
+
     async def list_directory(
         self, host_ip: str, path: str = "/root/.openclaw/"
     ) -> list[dict]:
         """List directory contents via SFTP."""
         path = _sanitize_path(path)
-        async with await self._connect(host_ip) as conn:
-            async with conn.start_sftp_client() as sftp:
-                entries = []
-                async for entry in sftp.scandir(path):
-                    name = entry.filename
-                    if name in (".", ".."):
-                        continue
-                    attrs = entry.attrs
-                    is_dir = bool(attrs.permissions and stat.S_ISDIR(attrs.permissions))
-                    modified_at = None
-                    if attrs.mtime is not None:
-                        modified_at = datetime.fromtimestamp(
-                            attrs.mtime, tz=timezone.utc
-                        ).isoformat()
-                    entries.append(
-                        {
-                            "name": name,
-                            "path": f"{path.rstrip('/')}/{name}",
-                            "is_dir": is_dir,
-                            "size": attrs.size if not is_dir else None,
-                            "modified_at": modified_at,
-                        }
-                    )
-                # Sort: directories first, then alphabetically
-                entries.sort(key=lambda e: (not e["is_dir"], e["name"].lower()))
-                return entries
+        async with self.sftp_session(host_ip) as session:
+            return await session.list_directory(path)
 
     async def read_file(
         self, host_ip: str, path: str, *, max_bytes: int = 1_048_576
     ) -> dict:
         """Read file content via SFTP (capped at max_bytes)."""
         path = _sanitize_path(path)
-        async with await self._connect(host_ip) as conn:
-            async with conn.start_sftp_client() as sftp:
-                file_attrs = await sftp.stat(path)
-                file_size = file_attrs.size or 0
-                truncated = file_size > max_bytes
-
-                async with sftp.open(path, "rb") as f:
-                    raw = await f.read(max_bytes)
-
-                try:
-                    content = raw.decode("utf-8")
-                except UnicodeDecodeError:
-                    content = f"[Binary file, {file_size} bytes]"
-
-                return {
-                    "path": path,
-                    "content": content,
-                    "size": file_size,
-                    "truncated": truncated,
-                }
+        async with self.sftp_session(host_ip) as session:
+            return await session.read_file(path, max_bytes=max_bytes)
 
 
 # Module-level singleton
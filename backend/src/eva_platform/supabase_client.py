@@ -1,22 +1,72 @@
 """Lightweight httpx client for Supabase Admin API.
 
-Only implements the two operations needed for Eva OPS:
+Implements the operations needed for Eva OPS:
 - admin_create_user: Provision a new Supabase auth user
+- get_or_create_user: Lookup-first variant for idempotent provisioning
 - admin_generate_link: Generate a magic link for impersonation
 """
 
 from __future__ import annotations
 
 import asyncio
+import functools
+import itertools
 import logging
-from typing import Any, TypedDict
+import random
+import re
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from types import MappingProxyType
+from typing import Any, NewType, TypedDict
 
 import httpx
+import orjson
 
 from src.common.config import settings
+from src.common.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Process-wide client so admin calls reuse warm keep-alive connections to
+# Supabase instead of paying TCP + TLS setup on every request. HTTP/2 lets the
+# concurrent lookup pages multiplex over a single connection. Created lazily
+# on first use and closed from the app lifespan via SupabaseAdminClient.aclose().
+_client: httpx.AsyncClient | None = None
+
+# Retry policy for admin calls. Backoff bounds are in seconds; SystemRandom
+# keeps concurrent workers from drawing correlated delays and retrying in
+# lockstep.
+_RETRYABLE_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+_RETRY_AFTER_STATUSES = frozenset({429, 503})
+_RETRY_BASE_SECONDS = 0.1
+_RETRY_CAP_SECONDS = 5.0
+_retry_rng = random.SystemRandom()
+
+# Email -> Supabase user for repeated lookups during provisioning and
+# onboarding (retries, create -> mark password change -> generate link).
+_USER_LOOKUP_NEGATIVE_TTL_SECONDS = 5.0
+_user_lookup_cache: TTLCache[str, dict[str, Any] | None] = TTLCache(maxsize=1024, ttl=60.0)
+_LOOKUP_MISS: Any = object()
+
+# Emails this process created successfully. Re-issued create intents
+# (retries, invite resends) for these go lookup-first instead of POSTing
+# into a guaranteed duplicate error. Bounded and in-memory only; rebuilt
+# from scratch on restart.
+_created_emails: TTLCache[str, bool] = TTLCache(maxsize=10_000, ttl=24 * 3600.0)
+
+# Concurrent page requests per wave in the paginated user lookup.
+_PAGINATED_LOOKUP_WAVE = 8
+
+
+# An email already passed through _normalize_email(). Public entry points
+# normalize once; internal helpers take this and never re-normalize.
+NormalizedEmail = NewType("NormalizedEmail", str)
+
+
+def _normalize_email(email: str) -> NormalizedEmail:
+    return NormalizedEmail(email.strip().lower())
+
 
 class SupabaseGenerateLinkResult(TypedDict):
     action_link: str
@@ -61,48 +111,135 @@ def map_supabase_error_to_http(exc: SupabaseAdminError) -> tuple[int, str]:
     return 400, str(exc)
 
 
+_DUPLICATE_USER_CODES = frozenset({"email_exists", "user_already_exists", "duplicate_email"})
+_DUPLICATE_USER_MESSAGE_RE = re.compile(
+    "|".join(
+        re.escape(marker)
+        for marker in (
+            "already been registered",
+            "already registered",
+            "already exists",
+            "email exists",
+            "usuario ya esta registrado",
+            "usuario ya está registrado",
+            "ya se encuentra registrado",
+        )
+    ),
+    re.IGNORECASE,
+)
+
+
 def _is_duplicate_user_error(status_code: int, message: str, code: str = "") -> bool:
     if status_code not in {400, 409, 422}:
         return False
-
-    normalized_message = (message or "").strip().lower()
-    normalized_code = (code or "").strip().lower()
-
-    duplicate_codes = {"email_exists", "user_already_exists", "duplicate_email"}
-    if normalized_code in duplicate_codes:
+    if (code or "").strip().lower() in _DUPLICATE_USER_CODES:
         return True
-
-    duplicate_markers = (
-        "already been registered",
-        "already registered",
-        "already exists",
-        "email exists",
-        "usuario ya esta registrado",
-        "usuario ya está registrado",
-        "ya se encuentra registrado",
-    )
-    return any(marker in normalized_message for marker in duplicate_markers)
+    return _DUPLICATE_USER_MESSAGE_RE.search(message or "") is not None
 
 
-class SupabaseAdminClient:
-    """Stateless Supabase Admin API client using httpx."""
-
-    @staticmethod
-    def _headers() -> dict[str, str]:
-        return {
+@functools.lru_cache(maxsize=1)
+def _supabase_headers() -> MappingProxyType[str, str]:
+    return MappingProxyType(
+        {
             "apikey": settings.supabase_service_role_key,
             "Authorization": f"Bearer {settings.supabase_service_role_key}",
             "Content-Type": "application/json",
         }
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _supabase_base_url() -> str:
+    # Misconfiguration raises, and lru_cache doesn't memoize exceptions, so a
+    # fixed config is picked up on the next call.
+    url = settings.supabase_url.rstrip("/")
+    if not url:
+        raise SupabaseConfigError("Provisioning is not configured (missing SUPABASE_URL)")
+    if not settings.supabase_service_role_key:
+        raise SupabaseConfigError("Provisioning is not configured (missing SUPABASE_SERVICE_ROLE_KEY)")
+    return url
+
+
+def _reset_config_cache() -> None:
+    """Drop memoized URL/headers/lookups after settings change (tests, reloads)."""
+    _supabase_headers.cache_clear()
+    _supabase_base_url.cache_clear()
+    _user_lookup_cache.clear()
+    _created_emails.clear()
+
+
+def _json(resp: httpx.Response) -> Any:
+    """Decode a JSON response body with orjson (raises ValueError on bad JSON)."""
+    return orjson.loads(resp.content)
+
+
+def _retry_after_seconds(resp: httpx.Response) -> float | None:
+    """Parse a Retry-After header given as delta-seconds or an HTTP-date."""
+    raw = resp.headers.get("retry-after")
+    if not raw:
+        return None
+    raw = raw.strip()
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(raw)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _next_backoff(prev_delay: float) -> float:
+    """AWS-style decorrelated jitter: uniform(base, prev * 3), capped."""
+    prev_delay = max(prev_delay, _RETRY_BASE_SECONDS)
+    return min(_RETRY_CAP_SECONDS, _retry_rng.uniform(_RETRY_BASE_SECONDS, prev_delay * 3))
+
+
+class SupabaseAdminClient:
+    """Supabase Admin API client sharing one pooled httpx.AsyncClient."""
+
+    @classmethod
+    def _get_client(cls) -> httpx.AsyncClient:
+        global _client
+        if _client is None or _client.is_closed:
+            _client = httpx.AsyncClient(
+                timeout=15,
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50, keepalive_expiry=30),
+            )
+        return _client
 
     @staticmethod
-    def _base_url() -> str:
-        url = settings.supabase_url.rstrip("/")
-        if not url:
-            raise SupabaseConfigError("Provisioning is not configured (missing SUPABASE_URL)")
-        if not settings.supabase_service_role_key:
-            raise SupabaseConfigError("Provisioning is not configured (missing SUPABASE_SERVICE_ROLE_KEY)")
-        return url
+    async def aclose() -> None:
+        global _client
+        if _client is not None:
+            await _client.aclose()
+            _client = None
+
+    @classmethod
+    async def warmup(cls) -> None:
+        """Best-effort startup probe that opens the pooled connection.
+
+        Pays the TLS + HTTP/2 handshake before real traffic arrives. Never
+        raises; failures (including missing config) are logged at DEBUG.
+        """
+        try:
+            resp = await cls._get_client().get(
+                f"{cls._base_url()}/auth/v1/admin/users",
+                params={"page": 1, "per_page": 1},
+                headers=cls._headers(),
+                timeout=5,
+            )
+        except (SupabaseAdminError, httpx.HTTPError) as exc:
+            logger.debug("Supabase admin warmup skipped: %s", exc)
+            return
+        logger.debug("Supabase admin warmup: %d over %s", resp.status_code, resp.http_version)
+
+    _headers = staticmethod(_supabase_headers)
+    _base_url = staticmethod(_supabase_base_url)
 
     @staticmethod
     def _extract_user_id(user_payload: dict[str, Any]) -> str:
@@ -121,14 +258,13 @@ class SupabaseAdminClient:
 
     @staticmethod
     def _extract_error(resp: httpx.Response) -> tuple[str, str]:
-        body: dict[str, Any] = {}
-        if resp.headers.get("content-type", "").startswith("application/json"):
-            try:
-                parsed = resp.json()
-                if isinstance(parsed, dict):
-                    body = parsed
-            except ValueError:
-                body = {}
+        # Supabase error bodies are JSON; just try to decode instead of
+        # checking Content-Type first.
+        try:
+            parsed = _json(resp)
+        except ValueError:
+            parsed = None
+        body: dict[str, Any] = parsed if isinstance(parsed, dict) else {}
         message = body.get("msg") or body.get("message") or body.get("error") or resp.text
         code = body.get("code") or ""
         return str(message), str(code)
@@ -141,49 +277,60 @@ class SupabaseAdminClient:
         url: str,
         **kwargs: Any,
     ) -> httpx.Response:
-        retryable_statuses = {408, 429, 500, 502, 503, 504}
         max_attempts = 3
+        delay = _RETRY_BASE_SECONDS
         for attempt in range(1, max_attempts + 1):
             try:
-                resp = await client.request(method, url, **kwargs)
+                # Headers go per request rather than onto the shared client
+                # so _reset_config_cache takes effect without rebuilding it.
+                resp = await client.request(method, url, headers=cls._headers(), **kwargs)
             except httpx.RequestError as exc:
                 if attempt == max_attempts:
                     raise SupabaseUpstreamUnavailableError(
                         "Provisioning service temporarily unavailable. Please try again."
                     ) from exc
-                await asyncio.sleep(0.25 * attempt)
-                continue
-
-            if resp.status_code in retryable_statuses and attempt < max_attempts:
-                await asyncio.sleep(0.25 * attempt)
+                delay = _next_backoff(delay)
+                await asyncio.sleep(delay)
                 continue
 
-            if resp.status_code in retryable_statuses and attempt == max_attempts:
+            if resp.status_code not in _RETRYABLE_STATUSES:
+                return resp
+            if attempt == max_attempts:
                 raise SupabaseUpstreamUnavailableError(
                     "Provisioning service temporarily unavailable. Please try again."
                 )
-            return resp
+            retry_after = _retry_after_seconds(resp) if resp.status_code in _RETRY_AFTER_STATUSES else None
+            if retry_after is not None:
+                delay = min(_RETRY_CAP_SECONDS, retry_after)
+            else:
+                delay = _next_backoff(delay)
+            await asyncio.sleep(delay)
 
         raise SupabaseUpstreamUnavailableError("Provisioning service temporarily unavailable. Please try again.")
 
     @staticmethod
-    def _parse_users_payload(payload: Any) -> list[dict[str, Any]]:
+    def _iter_users(payload: Any) -> Iterator[dict[str, Any]]:
         if isinstance(payload, dict):
-            users = payload.get("users", [])
-            if isinstance(users, list):
-                return [u for u in users if isinstance(u, dict)]
-            return []
+            payload = payload.get("users", [])
         if isinstance(payload, list):
-            return [u for u in payload if isinstance(u, dict)]
-        return []
+            return (u for u in payload if isinstance(u, dict))
+        return iter(())
+
+    @classmethod
+    def _parse_users_payload(cls, payload: Any) -> list[dict[str, Any]]:
+        return list(cls._iter_users(payload))
 
     @staticmethod
-    def _matching_user(users: list[dict[str, Any]], normalized_email: str) -> dict[str, Any] | None:
-        for user in users:
-            candidate_email = (user.get("email") or "").strip().lower()
-            if candidate_email == normalized_email:
-                return user
-        return None
+    def _index_users_by_email(users: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+        # reversed() so the first user wins if a page ever repeats an email.
+        return {(user.get("email") or "").strip().lower(): user for user in reversed(users)}
+
+    @staticmethod
+    def _matching_user(users: Iterable[dict[str, Any]], normalized_email: NormalizedEmail) -> dict[str, Any] | None:
+        return next(
+            (user for user in users if (user.get("email") or "").strip().lower() == normalized_email),
+            None,
+        )
 
     @classmethod
     async def admin_create_user(
@@ -196,7 +343,20 @@ class SupabaseAdminClient:
 
         Returns the user object dict with at least 'id' and 'email'.
         """
-        normalized_email = email.strip().lower()
+        normalized_email = _normalize_email(email)
+        if normalized_email in _created_emails:
+            # This process already created the user, so the POST would only
+            # come back as a duplicate; look it up first instead.
+            return await cls._get_or_create_user(normalized_email, password, user_metadata)
+        return await cls._create_user(normalized_email, password, user_metadata)
+
+    @classmethod
+    async def _create_user(
+        cls,
+        normalized_email: NormalizedEmail,
+        password: str,
+        user_metadata: dict[str, Any] | None,
+    ) -> dict[str, Any]:
         payload = {
             "email": normalized_email,
             "password": password,
@@ -204,18 +364,19 @@ class SupabaseAdminClient:
             "user_metadata": user_metadata or {},
         }
 
-        async with httpx.AsyncClient(timeout=15) as client:
-            resp = await cls._request_with_retries(
-                client,
-                "POST",
-                f"{cls._base_url()}/auth/v1/admin/users",
-                headers=cls._headers(),
-                json=payload,
-            )
+        client = cls._get_client()
+        resp = await cls._request_with_retries(
+            client,
+            "POST",
+            f"{cls._base_url()}/auth/v1/admin/users",
+            content=orjson.dumps(payload),
+        )
 
         if resp.status_code == 200:
-            data = resp.json()
+            data = _json(resp)
             cls._extract_user_id(data)
+            _user_lookup_cache.pop(normalized_email)
+            _created_emails.set(normalized_email, True)
             return data
 
         msg, error_code = cls._extract_error(resp)
@@ -229,9 +390,38 @@ class SupabaseAdminClient:
                 "Account owner email is already registered but could not be linked. Please retry."
             )
 
-        logger.error("Supabase admin_create_user failed: %s %s", resp.status_code, msg)
+        logger.error("Supabase admin_create_user failed: %d %s", resp.status_code, msg)
         raise SupabaseAdminError(f"Failed to create user: {msg}")
 
+    @classmethod
+    async def get_or_create_user(
+        cls,
+        email: str,
+        password: str,
+        user_metadata: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Return the existing Supabase user for ``email`` or create one.
+
+        Runs the cheap filtered lookup before the POST so flows that often
+        re-provision a known owner skip the create -> duplicate -> lookup
+        chain. Callers expecting a brand-new user should keep using
+        ``admin_create_user``.
+        """
+        return await cls._get_or_create_user(_normalize_email(email), password, user_metadata)
+
+    @classmethod
+    async def _get_or_create_user(
+        cls,
+        normalized_email: NormalizedEmail,
+        password: str,
+        user_metadata: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        existing = await cls._lookup_user_by_email_filtered(normalized_email)
+        if existing:
+            cls._extract_user_id(existing)
+            return existing
+        return await cls._create_user(normalized_email, password, user_metadata)
+
     @classmethod
     async def admin_generate_link(
         cls,
@@ -258,7 +448,7 @@ class SupabaseAdminClient:
         owner_name: str | None = None,
     ) -> None:
         """Ensure onboarding users are always forced to set a password on next login."""
-        normalized_email = email.strip().lower()
+        normalized_email = _normalize_email(email)
         existing = await cls._lookup_user_by_email(normalized_email)
         if not existing:
             raise SupabaseAdminError("Failed to locate owner user for onboarding.")
@@ -272,18 +462,22 @@ class SupabaseAdminClient:
         if not next_metadata.get("role"):
             next_metadata["role"] = "account"
 
-        async with httpx.AsyncClient(timeout=15) as client:
-            resp = await cls._request_with_retries(
-                client,
-                "PUT",
-                f"{cls._base_url()}/auth/v1/admin/users/{user_id}",
-                headers=cls._headers(),
-                json={"user_metadata": next_metadata},
-            )
+        client = cls._get_client()
+        resp = await cls._request_with_retries(
+            client,
+            "PUT",
+            f"{cls._base_url()}/auth/v1/admin/users/{user_id}",
+            content=orjson.dumps({"user_metadata": next_metadata}),
+        )
 
+        # The cached copy carries the old user_metadata either way.
+        _user_lookup_cache.pop(normalized_email)
         if resp.status_code != 200:
-            msg, _ = cls._extract_error(resp)
-            logger.error("Supabase admin_mark_password_change_required failed: %s %s", resp.status_code, msg)
+            # The upstream message is only logged, so skip parsing it when
+            # ERROR logging is off.
+            if logger.isEnabledFor(logging.ERROR):
+                msg, _ = cls._extract_error(resp)
+                logger.error("Supabase admin_mark_password_change_required failed: %d %s", resp.status_code, msg)
             raise SupabaseAdminError("Failed to prepare onboarding user metadata.")
 
     @classmethod
@@ -294,7 +488,7 @@ class SupabaseAdminClient:
         redirect_to: str | None = None,
     ) -> SupabaseGenerateLinkResult:
         """Generate a link and return all callback primitives needed by callers."""
-        normalized_email = email.strip().lower()
+        normalized_email = _normalize_email(email)
         payload = {
             "email": normalized_email,
             "type": link_type,
@@ -303,17 +497,16 @@ class SupabaseAdminClient:
         if redirect_url:
             payload["redirect_to"] = redirect_url
 
-        async with httpx.AsyncClient(timeout=15) as client:
-            resp = await cls._request_with_retries(
-                client,
-                "POST",
-                f"{cls._base_url()}/auth/v1/admin/generate_link",
-                headers=cls._headers(),
-                json=payload,
-            )
+        client = cls._get_client()
+        resp = await cls._request_with_retries(
+            client,
+            "POST",
+            f"{cls._base_url()}/auth/v1/admin/generate_link",
+            content=orjson.dumps(payload),
+        )
 
         if resp.status_code == 200:
-            data = resp.json()
+            data = _json(resp)
             properties = data.get("properties", {}) if isinstance(data, dict) else {}
             action_link = data.get("action_link") if isinstance(data, dict) else ""
             if not action_link:
@@ -329,89 +522,130 @@ class SupabaseAdminClient:
             }
 
         msg, _ = cls._extract_error(resp)
-        logger.error("Supabase admin_generate_link failed: %s %s", resp.status_code, msg)
+        logger.error("Supabase admin_generate_link failed: %d %s", resp.status_code, msg)
         raise SupabaseAdminError(f"Failed to generate link: {msg}")
 
     @classmethod
     async def send_recovery_email(cls, email: str, redirect_to: str | None = None) -> None:
         """Trigger Supabase Auth password recovery email for an existing user."""
-        normalized_email = email.strip().lower()
+        normalized_email = _normalize_email(email)
         payload = {"email": normalized_email}
         params: dict[str, str] = {}
         redirect_url = (redirect_to or "").strip()
         if redirect_url:
             params["redirect_to"] = redirect_url
 
-        async with httpx.AsyncClient(timeout=15) as client:
-            resp = await cls._request_with_retries(
-                client,
-                "POST",
-                f"{cls._base_url()}/auth/v1/recover",
-                headers=cls._headers(),
-                json=payload,
-                params=params or None,
-            )
+        client = cls._get_client()
+        resp = await cls._request_with_retries(
+            client,
+            "POST",
+            f"{cls._base_url()}/auth/v1/recover",
+            content=orjson.dumps(payload),
+            params=params or None,
+        )
 
         if resp.status_code in {200, 202}:
             return
 
         msg, _ = cls._extract_error(resp)
-        logger.error("Supabase send_recovery_email failed: %s %s", resp.status_code, msg)
+        logger.error("Supabase send_recovery_email failed: %d %s", resp.status_code, msg)
         raise SupabaseAdminError(f"Failed to send recovery email: {msg}")
 
     @classmethod
-    async def _lookup_user_by_email(cls, email: str) -> dict[str, Any] | None:
+    async def _lookup_user_by_email(cls, normalized: NormalizedEmail) -> dict[str, Any] | None:
         """Search Supabase admin users for matching email."""
-        normalized = email.strip().lower()
-        filtered = await cls._lookup_user_by_email_filtered(normalized)
-        if filtered:
-            return filtered
-        return await cls._lookup_user_by_email_paginated(normalized)
+        cached = _user_lookup_cache.get(normalized, _LOOKUP_MISS)
+        if cached is not _LOOKUP_MISS:
+            return cached
+
+        if settings.supabase_lookup_race_enabled:
+            user = await cls._race_lookups(normalized)
+        else:
+            user = await cls._lookup_user_by_email_filtered(normalized)
+            if not user:
+                user = await cls._lookup_user_by_email_paginated(normalized)
+        # Misses get a short TTL so a signup right after isn't hidden for long.
+        _user_lookup_cache.set(
+            normalized,
+            user,
+            ttl=None if user else _USER_LOOKUP_NEGATIVE_TTL_SECONDS,
+        )
+        return user
 
     @classmethod
-    async def _lookup_user_by_email_filtered(cls, normalized: str) -> dict[str, Any] | None:
+    async def _race_lookups(cls, normalized: NormalizedEmail) -> dict[str, Any] | None:
+        """Run filtered and paginated lookups concurrently; first hit wins."""
+        tasks = [
+            asyncio.create_task(cls._lookup_user_by_email_filtered(normalized)),
+            asyncio.create_task(cls._lookup_user_by_email_paginated(normalized)),
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                user = await next_done
+                if user:
+                    return user
+            return None
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    @classmethod
+    async def _lookup_user_by_email_filtered(cls, normalized: NormalizedEmail) -> dict[str, Any] | None:
         """Primary lookup using Supabase admin filter parameter."""
-        async with httpx.AsyncClient(timeout=15) as client:
+        client = cls._get_client()
+        resp = await cls._request_with_retries(
+            client,
+            "GET",
+            f"{cls._base_url()}/auth/v1/admin/users",
+            params={"page": 1, "per_page": 50, "filter": normalized},
+        )
+        if resp.status_code != 200:
+            return None
+        return cls._matching_user(cls._iter_users(_json(resp)), normalized)
+
+    @classmethod
+    async def _lookup_user_by_email_paginated(cls, normalized: NormalizedEmail) -> dict[str, Any] | None:
+        """Fallback lookup scanning all pages with bounded retries.
+
+        Pages are fetched in waves of ``_PAGINATED_LOOKUP_WAVE`` concurrent
+        requests; the remaining requests of a wave are cancelled as soon as a
+        page contains the user, and the walk stops after the wave that hits
+        the end of the list.
+        """
+        per_page = 50
+        client = cls._get_client()
+        url = f"{cls._base_url()}/auth/v1/admin/users"
+
+        async def scan_page(page: int) -> tuple[dict[str, Any] | None, int]:
+            # Decode and match inside the task so each page is dropped as soon
+            # as it's scanned; only (match, page size) outlives the request.
             resp = await cls._request_with_retries(
                 client,
                 "GET",
-                f"{cls._base_url()}/auth/v1/admin/users",
-                headers=cls._headers(),
-                params={"page": 1, "per_page": 50, "filter": normalized},
+                url,
+                params={"page": page, "per_page": per_page},
             )
             if resp.status_code != 200:
-                return None
-            users = cls._parse_users_payload(resp.json())
-            return cls._matching_user(users, normalized)
-
-    @classmethod
-    async def _lookup_user_by_email_paginated(cls, normalized: str) -> dict[str, Any] | None:
-        """Fallback lookup scanning all pages with bounded retries."""
-        page = 1
-        per_page = 50
+                return None, -1
+            users = cls._parse_users_payload(_json(resp))
+            return cls._index_users_by_email(users).get(normalized), len(users)
 
-        async with httpx.AsyncClient(timeout=15) as client:
-            while True:
-                resp = await cls._request_with_retries(
-                    client,
-                    "GET",
-                    f"{cls._base_url()}/auth/v1/admin/users",
-                    headers=cls._headers(),
-                    params={"page": page, "per_page": per_page},
-                )
-                if resp.status_code != 200:
-                    break
-
-                users = cls._parse_users_payload(resp.json())
-                if not users:
-                    break
-
-                user = cls._matching_user(users, normalized)
-                if user:
-                    return user
-
-                if len(users) < per_page:
-                    break
-                page += 1
+        for start in itertools.count(1, _PAGINATED_LOOKUP_WAVE):
+            tasks = [asyncio.create_task(scan_page(start + i)) for i in range(_PAGINATED_LOOKUP_WAVE)]
+            reached_end = False
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    user, page_size = await next_done
+                    if user:
+                        return user
+                    if page_size < per_page:
+                        reached_end = True
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+            if reached_end:
+                break
 
         return None
@@ -0,0 +1,76 @@
+"""Short-lived read-through cache for stamped factura rows.
+
+``GET /facturas/{id}`` and the PDF/XML downloads re-read the same row by
+id. Once a factura is stamped (``valid``) or ``cancelled`` it only changes
+through a handful of writers — cancellation, payment registration and its
+rollback, reconciliation heals — and each of those calls
+``invalidate_on_commit`` so the entry is dropped only once the write is
+committed; dropping it earlier would let a concurrent read re-cache the
+pre-write row. Drafts and outbox rows are never cached since the worker
+mutates them outside any request.
+
+Per-process only; the TTL bounds staleness across replicas.
+"""
+
+from __future__ import annotations
+
+import uuid
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+from src.common.ttl_cache import TTLCache
+from src.facturas.models import Factura
+from src.facturas.schemas import FacturaResponse
+
+_CACHEABLE_STATUSES = frozenset({"valid", "cancelled"})
+
+_cache: TTLCache[uuid.UUID, FacturaResponse] = TTLCache(maxsize=2048, ttl=30)
+
+# Session.info key holding the ids to drop when the session's transaction ends.
+_PENDING_KEY = "factura_cache.pending_invalidations"
+
+
+def get(factura_id: uuid.UUID) -> FacturaResponse | None:
+    return _cache.get(factura_id)
+
+
+def remember(factura: Factura) -> FacturaResponse:
+    """Serialize ``factura`` and cache it if its status is cacheable."""
+    response = FacturaResponse.model_validate(factura)
+    if factura.status in _CACHEABLE_STATUSES:
+        _cache.set(factura.id, response)
+    return response
+
+
+def invalidate(factura_id: uuid.UUID) -> None:
+    _cache.pop(factura_id)
+
+
+def invalidate_on_commit(db: AsyncSession | Session, factura_id: uuid.UUID) -> None:
+    """Drop ``factura_id`` once ``db``'s current transaction ends.
+
+    Objects without a session ``info`` dict have no transaction to wait
+    for, so the entry is dropped immediately.
+    """
+    info = getattr(getattr(db, "sync_session", db), "info", None)
+    if info is None:
+        invalidate(factura_id)
+        return
+    info.setdefault(_PENDING_KEY, set()).add(factura_id)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _drop_pending(session: Session, transaction: SessionTransaction) -> None:
+    # Outermost transaction only: savepoints end before the data is
+    # visible to other sessions. Rolled-back ids are dropped as well,
+    # which is merely a cache miss.
+    if transaction.parent is not None:
+        return
+    for factura_id in session.info.pop(_PENDING_KEY, ()):
+        _cache.pop(factura_id)
+
+
+def clear() -> None:
+    _cache.clear()
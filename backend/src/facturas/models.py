@@ -9,8 +9,17 @@ from sqlalchemy.orm import Mapped, mapped_column
 from src.common.database import Base
 
 
+# Statuses whose CFDI is still in force at SAT. A ``cancelling`` row stays
+# valid until SAT accepts the cancellation, so tax and revenue totals keep it.
+SAT_VALID_STATUSES = ("valid", "cancelling")
+
+
 class Factura(Base):
     __tablename__ = "facturas"
+    # Fetch server-generated columns (created_at/updated_at, server_default
+    # scalars) via RETURNING on the INSERT/UPDATE itself, so writers don't
+    # need a follow-up refresh() SELECT before serializing the row.
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     facturapi_id: Mapped[str | None] = mapped_column(String(255), unique=True, nullable=True)
@@ -27,14 +36,16 @@ class Factura(Base):
     # CFDI metadata
     use: Mapped[str] = mapped_column(String(10), nullable=False)  # Uso de CFDI e.g. G03
     payment_form: Mapped[str] = mapped_column(String(5), nullable=False)  # Forma de pago e.g. 28
-    payment_method: Mapped[str] = mapped_column(String(5), default="PUE")  # PUE / PPD
+    payment_method: Mapped[str] = mapped_column(String(5), server_default="PUE")  # PUE / PPD
 
     # Line items stored as JSON
     line_items_json: Mapped[list | None] = mapped_column(JSONB, nullable=True)
 
-    # Amounts
+    # Amounts. The plain scalar defaults on this model (payment_method, tax,
+    # currency, status) are server-side so bulk inserts don't run a Python
+    # default per row; every constructor sets them explicitly anyway.
     subtotal: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
-    tax: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False, default=0)
+    tax: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False, server_default="0")
     isr_retention: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False, default=0)
     iva_retention: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False, default=0)
     # State-level retention (e.g., Guanajuato cedular 2%). Lives in the CFDI's
@@ -45,15 +56,18 @@ class Factura(Base):
     local_retention_state: Mapped[str | None] = mapped_column(String(3), nullable=True)
     local_retention_rate: Mapped[Decimal | None] = mapped_column(Numeric(5, 4), nullable=True)
     total: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
-    currency: Mapped[str] = mapped_column(String(3), default="MXN")
+    currency: Mapped[str] = mapped_column(String(3), server_default="MXN")
 
     # Status — outbox lifecycle:
     #   draft          → not yet submitted for stamping (user is still editing)
     #   pending_stamp  → row committed, waiting for worker to call FacturAPI
     #   valid          → FacturAPI returned 200, CFDI signed by SAT
     #   stamp_failed   → exceeded max retries, needs human intervention
+    #   cancelling     → background SAT cancellation in flight (DELETE ?background=true)
     #   cancelled      → SAT cancellation accepted
-    status: Mapped[str] = mapped_column(String(20), default="draft")
+    # ``valid`` and ``cancelling`` rows are both in force at SAT (see
+    # SAT_VALID_STATUSES); ingresos totals must count both.
+    status: Mapped[str] = mapped_column(String(20), server_default="draft")
     cancellation_status: Mapped[str | None] = mapped_column(String(50), nullable=True)
 
     # Outbox pattern fields (see migration w2x3y4z5a6b7 for context).
@@ -58,9 +58,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.common.config import settings
 from src.common.database import async_session
+from src.facturas import cache as factura_cache
 from src.facturas import service as facturapi
 from src.facturas.models import CfdiPayment, Factura
-from src.facturas.schemas import FacturaCreate, FacturaLineItem
 
 logger = logging.getLogger(__name__)
 
@@ -111,41 +111,6 @@ def _next_retry_delay(retry_count: int) -> timedelta:
     return timedelta(seconds=_BACKOFF_SECONDS[idx])
 
 
-def _rebuild_factura_create(factura: Factura) -> FacturaCreate:
-    """Rebuild a FacturaCreate from the stored Factura row so we can
-    re-run ``build_facturapi_payload`` against it.
-    """
-    line_items = []
-    for li in (factura.line_items_json or []):
-        line_items.append(
-            FacturaLineItem(
-                product_key=li["product_key"],
-                description=li["description"],
-                quantity=li.get("quantity", 1),
-                unit_price=Decimal(str(li["unit_price"])),
-                tax_rate=Decimal(str(li.get("tax_rate", "0.16"))),
-                isr_retention=Decimal(str(li["isr_retention"])) if li.get("isr_retention") else None,
-                iva_retention=Decimal(str(li["iva_retention"])) if li.get("iva_retention") else None,
-                cedular_rate=Decimal(str(li["cedular_rate"])) if li.get("cedular_rate") else None,
-                cedular_label=li.get("cedular_label"),
-            )
-        )
-    return FacturaCreate(
-        customer_name=factura.customer_name,
-        customer_rfc=factura.customer_rfc,
-        customer_id=factura.customer_id,
-        account_id=factura.account_id,
-        customer_tax_system=factura.customer_tax_system,
-        customer_zip=factura.customer_zip,
-        use=factura.use,
-        payment_form=factura.payment_form,
-        payment_method=factura.payment_method,
-        line_items=line_items,
-        currency=factura.currency,
-        notes=factura.notes,
-    )
-
-
 async def _apply_facturapi_success(factura: Factura, api_result: dict) -> None:
     """Populate factura with the CFDI data returned by FacturAPI."""
     factura.facturapi_id = api_result["id"]
@@ -170,6 +135,16 @@ async def stamp_pending_factura(db: AsyncSession, factura: Factura) -> Factura:
     ``status='valid'``; on failure retry bookkeeping is updated but no
     exception is raised (the worker decides whether to retry).
     """
+    outcome = await _request_stamp(factura)
+    return await _record_stamp_outcome(db, factura, outcome)
+
+
+async def _request_stamp(factura: Factura) -> dict | Exception:
+    """POST the factura to FacturAPI; return the API result or the error.
+
+    Touches only the row's in-memory attributes — never the session — so
+    a batch of these can run concurrently on one AsyncSession.
+    """
     factura.stamp_attempted_at = datetime.now(timezone.utc)
 
     # idempotency_key is the row id — stable across retries, unique per row.
@@ -180,12 +155,18 @@ async def stamp_pending_factura(db: AsyncSession, factura: Factura) -> Factura:
         key = str(factura.id)
         factura.facturapi_idempotency_key = key
 
-    data = _rebuild_factura_create(factura)
-
     try:
-        payload = facturapi.build_facturapi_payload(data, idempotency_key=key)
-        api_result = await facturapi.create_invoice(payload)
-    except Exception as exc:  # pragma: no cover - branching per error type below
+        payload = facturapi.build_facturapi_payload_from_factura(factura, idempotency_key=key)
+        return await facturapi.create_invoice(payload)
+    except Exception as exc:  # branching per error type lives in _record_stamp_outcome
+        return exc
+
+
+async def _record_stamp_outcome(
+    db: AsyncSession, factura: Factura, outcome: dict | Exception
+) -> Factura:
+    if isinstance(outcome, Exception):
+        exc = outcome
         factura.stamp_retry_count = (factura.stamp_retry_count or 0) + 1
         factura.last_stamp_error = str(exc)[:2000]
         permanent = _is_permanent_facturapi_error(exc)
@@ -208,7 +189,7 @@ async def stamp_pending_factura(db: AsyncSession, factura: Factura) -> Factura:
         )
         return factura
 
-    await _apply_facturapi_success(factura, api_result)
+    await _apply_facturapi_success(factura, outcome)
     logger.info(
         "Outbox stamped factura %s on attempt %s (cfdi_uuid=%s)",
         factura.id,
@@ -362,6 +343,7 @@ async def _rollback_payment_optimistic_bump(
     ).quantize(Decimal("0.01"))
     if new_total < Decimal("0"):
         new_total = Decimal("0")
+    factura_cache.invalidate_on_commit(db, factura_locked.id)
     factura_locked.total_paid = new_total
     factura_locked.payment_status = _derive_payment_status(
         factura_locked.total, new_total
@@ -518,8 +500,12 @@ async def process_pending_facturas_once(db: AsyncSession) -> dict[str, int]:
         "payments_failed": 0,
     }
 
-    for factura in pending_facturas:
-        await stamp_pending_factura(db, factura)
+    # The FacturAPI POSTs are independent, so the batch goes out
+    # concurrently on the shared keep-alive client. Recording the outcomes
+    # touches the session (eva billing finalization), so that stays serial.
+    outcomes = await asyncio.gather(*(_request_stamp(f) for f in pending_facturas))
+    for factura, outcome in zip(pending_facturas, outcomes):
+        await _record_stamp_outcome(db, factura, outcome)
         if factura.status == "valid":
             stats["facturas_stamped"] += 1
         elif factura.status == "stamp_failed":
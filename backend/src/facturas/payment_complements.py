@@ -20,6 +20,7 @@ from fastapi import HTTPException
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.facturas import cache as factura_cache
 from src.facturas.models import CfdiPayment, Factura
 from src.facturas.schemas import CfdiPaymentCreate
 
@@ -105,6 +106,7 @@ async def register_payment(
     # later fails permanently, a reconciliation / admin action will roll back.
     # For the *common* case (stamping succeeds) these numbers match reality
     # without waiting for a roundtrip.
+    factura_cache.invalidate_on_commit(db, factura.id)
     factura.total_paid = (total_paid + payment.payment_amount).quantize(Decimal("0.01"))
     factura.payment_status = _derive_payment_status(factura.total, factura.total_paid)
     db.add(factura)
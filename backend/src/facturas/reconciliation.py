@@ -12,7 +12,9 @@ Two jobs:
    commit of the response failed, the row sits in ``pending_stamp``
    while FacturAPI already has a valid CFDI for that idempotency key.
    The next reconciliation pass detects this and promotes the row to
-   ``valid`` with the FacturAPI data.
+   ``valid`` with the FacturAPI data. Likewise a ``cancelling`` row whose
+   background cancellation died is put back to ``valid`` once FacturAPI
+   shows no cancellation in progress for it.
 
 Mirror of ``finances.stripe_service.reconcile_stripe_events`` / ``run_nightly_stripe_reconciliation_once`` / ``stripe_reconciliation_runner_loop`` —
 kept consistent so both loops use the same shutdown contract, config
@@ -27,15 +29,15 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import date, datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
 
-import httpx
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.common.config import settings
 from src.common.database import async_session
+from src.facturas import cache as factura_cache
 from src.facturas import service as facturapi
 from src.facturas.models import Factura
 
@@ -44,6 +46,10 @@ logger = logging.getLogger(__name__)
 
 _PAGE_SIZE = 50
 
+# A background cancellation finishes within seconds of the DELETE; a row
+# still ``cancelling`` after this long lost its task (worker restart).
+_STALE_CANCELLING_AFTER = timedelta(minutes=15)
+
 
 async def _fetch_facturapi_page(page: int) -> dict:
     """GET one page of /v2/invoices. Returns the raw JSON response.
@@ -51,10 +57,8 @@ async def _fetch_facturapi_page(page: int) -> dict:
     Uses the live API key from settings. Callers are expected to handle
     the missing-key case before entering the loop.
     """
-    url = f"{facturapi.FACTURAPI_BASE}/invoices"
     params = {"limit": _PAGE_SIZE, "page": page}
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        resp = await client.get(url, params=params, headers=facturapi._headers())
+    resp = await facturapi.get_client().get("/invoices", params=params)
     resp.raise_for_status()
     return resp.json()
 
@@ -231,6 +235,7 @@ async def _adopt_or_heal(db: AsyncSession, inv: dict, stats: dict) -> None:
         return
 
     # Heal: the row is in a bad state but FacturAPI has the truth.
+    factura_cache.invalidate_on_commit(db, existing.id)
     healed = False
     prev_status = existing.status
     if prev_status in ("pending_stamp", "stamp_failed") and fields["status"] == "valid":
@@ -252,7 +257,7 @@ async def _adopt_or_heal(db: AsyncSession, inv: dict, stats: dict) -> None:
             existing.id,
             prev_status,
         )
-    elif prev_status == "valid" and fields["status"] == "cancelled":
+    elif prev_status in ("valid", "cancelling") and fields["status"] == "cancelled":
         existing.status = "cancelled"
         existing.cancelled_at = existing.cancelled_at or datetime.now(timezone.utc)
         healed = True
@@ -263,6 +268,26 @@ async def _adopt_or_heal(db: AsyncSession, inv: dict, stats: dict) -> None:
             existing.cfdi_uuid,
         )
 
+    elif (
+        prev_status == "cancelling"
+        and fields["status"] == "valid"
+        and inv.get("cancellation_status") != "pending"
+        and existing.updated_at is not None
+        and existing.updated_at < datetime.now(timezone.utc) - _STALE_CANCELLING_AFTER
+    ):
+        # SAT still has it valid with nothing pending: the cancellation
+        # never went through, so it must count as an ingreso again.
+        cancellation_status = inv.get("cancellation_status")
+        existing.status = "valid"
+        existing.cancellation_status = None if cancellation_status in (None, "none") else cancellation_status
+        healed = True
+        stats["cancel_reverted"] += 1
+        logger.info(
+            "Reconciliation restored stale cancelling factura %s to valid (%s)",
+            existing.id,
+            existing.cfdi_uuid,
+        )
+
     if not healed:
         stats["matched"] += 1
 
@@ -282,6 +307,7 @@ async def reconcile_facturapi_once(
         "adopted": 0,
         "healed": 0,
         "cancelled_synced": 0,
+        "cancel_reverted": 0,
         "matched": 0,
         "skipped": 0,
         "failed": 0,
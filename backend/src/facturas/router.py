@@ -1,18 +1,22 @@
+import asyncio
+import logging
 import uuid
 from datetime import datetime, timezone
 from decimal import Decimal
 
-import httpx
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import Response
-from sqlalchemy import select
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from src.auth.dependencies import get_current_user
 from src.auth.models import User
 from src.common.config import settings
-from src.common.database import get_db
+from src.common.database import async_session, get_db
+from src.common.ttl_cache import TTLCache
 from src.customers.models import Customer
+from src.facturas import cache as factura_cache
 from src.facturas import payment_complements
 from src.facturas import reconciliation as facturapi_reconciliation
 from src.facturas.models import CfdiPayment, Factura
@@ -25,7 +29,22 @@ from src.facturas.schemas import (
 )
 from src.facturas import service as facturapi
 
-router = APIRouter(prefix="/facturas", tags=["facturas"])
+logger = logging.getLogger(__name__)
+
+# orjson encodes the validated response (list_facturas can be hundreds of
+# rows) in C instead of the stdlib json encoder; response_model validation
+# is unchanged. PDF/XML/204 endpoints return their own Response.
+router = APIRouter(prefix="/facturas", tags=["facturas"], default_response_class=ORJSONResponse)
+
+# Shared accumulator seed for create_factura's totals (Decimal is immutable,
+# so `+=` rebinds instead of mutating it).
+_DEC_ZERO = Decimal(0)
+
+# Built once so list_facturas doesn't reconstruct the Select (and recompute
+# its cache key) per request; the status filter is a bound parameter so both
+# variants stay single entries in SQLAlchemy's compiled-statement cache.
+_FACTURAS_NEWEST_FIRST = select(Factura).order_by(Factura.created_at.desc())
+_FACTURAS_BY_STATUS = _FACTURAS_NEWEST_FIRST.where(Factura.status == bindparam("status"))
 
 
 @router.post("/reconcile")
@@ -51,22 +70,43 @@ async def trigger_reconciliation(
     stats = await facturapi_reconciliation.run_facturapi_reconciliation_once()
     return {"max_invoices": max_invoices, "stats": stats}
 
+# The UI polls /api-status; a FacturAPI round trip per poll is wasted work
+# for a liveness probe. Keyed by API key so a rotated key re-probes; the
+# lock collapses concurrent misses into a single upstream call.
+_STATUS_TTL_SECONDS = 15
+_status_cache: TTLCache[str, dict] = TTLCache(maxsize=1, ttl=_STATUS_TTL_SECONDS)
+_status_lock = asyncio.Lock()
+
+
+async def _probe_facturapi() -> dict:
+    try:
+        resp = await facturapi.get_client().get(
+            "/invoices",
+            params={"limit": 1},
+            timeout=5,
+        )
+        if resp.status_code == 200:
+            return {"status": "ok"}
+        return {"status": "error", "detail": f"HTTP {resp.status_code}"}
+    except Exception:
+        return {"status": "error", "detail": "Connection failed"}
+
+
 @router.get("/api-status")
 async def facturapi_status(user: User = Depends(get_current_user)):
     """Check if FacturAPI key is configured and reachable."""
-    if not settings.facturapi_api_key:
+    key = settings.facturapi_api_key
+    if not key:
         return {"status": "not_configured"}
-    try:
-        async with httpx.AsyncClient(timeout=5) as client:
-            resp = await client.get(
-                f"{facturapi.FACTURAPI_BASE}/invoices?limit=1",
-                headers=facturapi._headers(),
-            )
-            if resp.status_code == 200:
-                return {"status": "ok"}
-            return {"status": "error", "detail": f"HTTP {resp.status_code}"}
-    except Exception:
-        return {"status": "error", "detail": "Connection failed"}
+    cached = _status_cache.get(key)
+    if cached is not None:
+        return cached
+    async with _status_lock:
+        cached = _status_cache.get(key)
+        if cached is None:
+            cached = await _probe_facturapi()
+            _status_cache.set(key, cached)
+    return cached
 
 
 @router.post("", response_model=FacturaResponse, status_code=201)
@@ -80,10 +120,21 @@ async def create_factura(
     Without draft flag, stores locally only; stamp later via POST /facturas/{id}/stamp."""
     # If customer_id provided, look up customer and fill fiscal fields
     if data.customer_id:
-        result = await db.execute(
-            select(Customer).where(Customer.id == data.customer_id)
+        # Identity-map hit when the customer is already loaded in this
+        # session; otherwise one SELECT of just the fiscal columns.
+        customer = await db.get(
+            Customer,
+            data.customer_id,
+            options=[
+                load_only(
+                    Customer.legal_name,
+                    Customer.rfc,
+                    Customer.tax_regime,
+                    Customer.fiscal_zip,
+                    Customer.default_cfdi_use,
+                )
+            ],
         )
-        customer = result.scalar_one_or_none()
         if not customer:
             raise HTTPException(status_code=404, detail="Customer not found")
         if not customer.legal_name or not customer.rfc:
@@ -106,34 +157,24 @@ async def create_factura(
             )
 
     # Calculate local totals from line items
-    subtotal = Decimal(0)
-    tax_total = Decimal(0)
-    isr_ret_total = Decimal(0)
-    iva_ret_total = Decimal(0)
+    subtotal = tax_total = isr_ret_total = iva_ret_total = _DEC_ZERO
     line_items_store = []
     for li in data.line_items:
         line_sub = li.unit_price * li.quantity
-        line_tax = line_sub * li.tax_rate
         subtotal += line_sub
-        tax_total += line_tax
+        # Exempt / 0% lines skip the multiply, same as the retentions below.
+        if li.tax_rate:
+            tax_total += line_sub * li.tax_rate
         if li.isr_retention:
             isr_ret_total += line_sub * li.isr_retention
         if li.iva_retention:
             iva_ret_total += line_sub * li.iva_retention
-        line_items_store.append({
-            "product_key": li.product_key,
-            "description": li.description,
-            "quantity": li.quantity,
-            "unit_price": float(li.unit_price),
-            "tax_rate": float(li.tax_rate),
-            "isr_retention": float(li.isr_retention) if li.isr_retention else None,
-            "iva_retention": float(li.iva_retention) if li.iva_retention else None,
-        })
+        line_items_store.append(facturapi.line_item_json(li))
 
     facturapi_id: str | None = None
     total_amount = round(subtotal + tax_total - isr_ret_total - iva_ret_total, 2)
     if draft:
-        payload = facturapi.build_facturapi_payload(data)
+        payload = facturapi.build_facturapi_payload(data, line_items=line_items_store)
         api_result = await facturapi.create_draft_invoice(payload)
         facturapi_id = api_result.get("id")
         api_total = api_result.get("total")
@@ -165,7 +206,6 @@ async def create_factura(
     )
     db.add(factura)
     await db.flush()
-    await db.refresh(factura)
     return factura
 
 
@@ -192,8 +232,7 @@ async def stamp_factura(
     failure silently lost the row. The outbox refactor eliminates that
     class of failure.
     """
-    result = await db.execute(select(Factura).where(Factura.id == factura_id))
-    factura = result.scalar_one_or_none()
+    factura = await db.get(Factura, factura_id)
     if not factura:
         raise HTTPException(status_code=404, detail="Factura not found")
     if factura.status != "draft":
@@ -215,36 +254,53 @@ async def stamp_factura(
     factura.next_retry_at = None
     factura.stamp_attempted_at = None
 
-    db.add(factura)
     await db.flush()
-    await db.refresh(factura)
     return factura
 
 
 @router.get("", response_model=list[FacturaResponse])
 async def list_facturas(
     status: str | None = None,
+    limit: int | None = Query(None, ge=1, le=500),
+    cursor: datetime | None = None,
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    q = select(Factura).order_by(Factura.created_at.desc())
+    """Newest first. Pass ``limit`` (and the last row's ``created_at`` as
+    ``cursor`` for the next page) to page through; without ``limit`` the
+    full list is returned as before."""
+    params: dict = {}
     if status:
-        q = q.where(Factura.status == status)
-    result = await db.execute(q)
+        q = _FACTURAS_BY_STATUS
+        params["status"] = status
+    else:
+        q = _FACTURAS_NEWEST_FIRST
+    if cursor is not None:
+        q = q.where(Factura.created_at < cursor)
+    if limit is not None:
+        q = q.limit(limit)
+    result = await db.execute(q, params)
     return result.scalars().all()
 
 
+async def _get_factura_view(db: AsyncSession, factura_id: uuid.UUID) -> FacturaResponse:
+    """Read-only view of a factura, served from ``factura_cache`` when stamped."""
+    cached = factura_cache.get(factura_id)
+    if cached is not None:
+        return cached
+    factura = await db.get(Factura, factura_id)
+    if not factura:
+        raise HTTPException(status_code=404, detail="Factura not found")
+    return factura_cache.remember(factura)
+
+
 @router.get("/{factura_id}", response_model=FacturaResponse)
 async def get_factura(
     factura_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    result = await db.execute(select(Factura).where(Factura.id == factura_id))
-    factura = result.scalar_one_or_none()
-    if not factura:
-        raise HTTPException(status_code=404, detail="Factura not found")
-    return factura
+    return await _get_factura_view(db, factura_id)
 
 
 @router.get("/{factura_id}/pdf")
@@ -253,17 +309,16 @@ async def download_pdf(
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    result = await db.execute(select(Factura).where(Factura.id == factura_id))
-    factura = result.scalar_one_or_none()
-    if not factura:
-        raise HTTPException(status_code=404, detail="Factura not found")
+    factura = await _get_factura_view(db, factura_id)
     if not factura.facturapi_id:
         raise HTTPException(status_code=400, detail="Draft must be pushed to Facturapi first")
 
-    pdf_bytes = await facturapi.download_pdf(factura.facturapi_id)
+    pdf_chunks = await facturapi.download_pdf(
+        factura.facturapi_id, cacheable=factura.status == "valid"
+    )
     filename = f"CFDI_{factura.cfdi_uuid or factura.facturapi_id}.pdf"
-    return Response(
-        content=pdf_bytes,
+    return StreamingResponse(
+        pdf_chunks,
         media_type="application/pdf",
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
@@ -275,17 +330,16 @@ async def download_xml(
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    result = await db.execute(select(Factura).where(Factura.id == factura_id))
-    factura = result.scalar_one_or_none()
-    if not factura:
-        raise HTTPException(status_code=404, detail="Factura not found")
+    factura = await _get_factura_view(db, factura_id)
     if not factura.facturapi_id:
         raise HTTPException(status_code=400, detail="Draft facturas have no XML — stamp first")
 
-    xml_bytes = await facturapi.download_xml(factura.facturapi_id)
+    xml_chunks = await facturapi.download_xml(
+        factura.facturapi_id, cacheable=factura.status == "valid"
+    )
     filename = f"CFDI_{factura.cfdi_uuid or factura.facturapi_id}.xml"
-    return Response(
-        content=xml_bytes,
+    return StreamingResponse(
+        xml_chunks,
         media_type="application/xml",
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
@@ -340,15 +394,28 @@ async def list_payments(
 @router.delete("/{factura_id}", response_model=FacturaResponse)
 async def delete_or_cancel_factura(
     factura_id: uuid.UUID,
+    response: Response,
+    background_tasks: BackgroundTasks,
     motive: str = "02",
+    background: bool = False,
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    result = await db.execute(select(Factura).where(Factura.id == factura_id))
-    factura = result.scalar_one_or_none()
+    """Hard-delete a draft, or cancel a stamped CFDI with SAT.
+
+    With ``?background=true`` the SAT cancellation runs after the response:
+    the row is committed as ``status='cancelling'`` /
+    ``cancellation_status='pending'`` and 202 is returned immediately;
+    poll ``GET /facturas/{id}`` for the outcome. Only stamped (``valid``)
+    facturas qualify; any other status gets 409. A ``cancelling`` row can
+    be re-submitted, and reconciliation syncs it if FacturAPI already
+    cancelled it.
+    """
+    factura = await db.get(Factura, factura_id)
     if not factura:
         raise HTTPException(status_code=404, detail="Factura not found")
 
+    factura_cache.invalidate_on_commit(db, factura.id)
     if factura.status == "draft":
         # If pushed to Facturapi, remove the draft there too before hard-deleting locally.
         if factura.facturapi_id:
@@ -360,12 +427,55 @@ async def delete_or_cancel_factura(
     if factura.status == "cancelled":
         raise HTTPException(status_code=400, detail="Factura already cancelled")
 
+    if background:
+        # Only a stamped CFDI can be cancelled with SAT; a ``cancelling`` row
+        # is always a stamped one being re-submitted.
+        if factura.status not in ("valid", "cancelling") or not factura.facturapi_id:
+            raise HTTPException(
+                status_code=409,
+                detail=f"Cannot cancel a factura in status '{factura.status}' in the background",
+            )
+        factura.status = "cancelling"
+        factura.cancellation_status = "pending"
+        # Commit before scheduling so the task always sees the claimed row.
+        await db.commit()
+        background_tasks.add_task(
+            _finish_background_cancel, factura.id, factura.facturapi_id, motive
+        )
+        response.status_code = 202
+        return factura
+
     # Valid factura — SAT cancellation
     cancel_result = await facturapi.cancel_invoice(factura.facturapi_id, motive)
     factura.status = "cancelled"
     factura.cancellation_status = cancel_result.get("cancellation_status", "accepted")
     factura.cancelled_at = datetime.now(timezone.utc)
-    db.add(factura)
     await db.flush()
-    await db.refresh(factura)
     return factura
+
+
+async def _finish_background_cancel(
+    factura_id: uuid.UUID, facturapi_id: str, motive: str
+) -> None:
+    """Run a deferred SAT cancellation and record the outcome on the row."""
+    try:
+        cancel_result = await facturapi.cancel_invoice(facturapi_id, motive)
+    except Exception:
+        logger.exception("Background cancellation failed for factura %s", factura_id)
+        cancel_result = None
+
+    async with async_session() as db:
+        factura = await db.get(Factura, factura_id)
+        if factura is None or factura.status != "cancelling":
+            return
+        if cancel_result is None:
+            # Only valid rows are claimed as ``cancelling``, so it is still a
+            # stamped CFDI; the operator sees the rejection and can retry.
+            factura.status = "valid"
+            factura.cancellation_status = "rejected"
+        else:
+            factura.status = "cancelled"
+            factura.cancellation_status = cancel_result.get("cancellation_status", "accepted")
+            factura.cancelled_at = datetime.now(timezone.utc)
+        factura_cache.invalidate_on_commit(db, factura_id)
+        await db.commit()
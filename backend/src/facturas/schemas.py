@@ -7,12 +7,15 @@ from typing import Annotated
 from pydantic import BaseModel, Field, model_validator
 
 
+_DEFAULT_TAX_RATE = Decimal("0.16")  # IVA general
+
+
 class FacturaLineItem(BaseModel):
     product_key: str  # SAT clave de producto e.g. "43232408"
     description: str
     quantity: int = 1
     unit_price: Decimal
-    tax_rate: Decimal = Decimal("0.16")
+    tax_rate: Decimal = _DEFAULT_TAX_RATE
     isr_retention: Decimal | None = None   # e.g. 0.0125 for RESICO
     iva_retention: Decimal | None = None   # e.g. 0.106667 for 2/3 IVA
     # State-level cedular retention (e.g., Guanajuato 2%). Emitted in the
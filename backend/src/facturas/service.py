@@ -1,25 +1,116 @@
+from collections.abc import AsyncIterator
 from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
+from types import MappingProxyType
 
 import httpx
 from fastapi import HTTPException
 
 from src.common.config import settings
-from src.facturas.schemas import FacturaCreate
+from src.common.ttl_cache import TTLCache
+from src.facturas.models import Factura
+from src.facturas.schemas import FacturaCreate, FacturaLineItem
 
 FACTURAPI_BASE = "https://www.facturapi.io/v2"
 
+# Shared FacturAPI client: stamp/cancel/download calls reuse pooled keep-alive
+# (HTTP/2) connections instead of a fresh TCP + TLS handshake per request.
+# Created lazily on first use (the outbox worker and scripts call in here
+# outside a request) and closed from the app lifespan via aclose_client().
+client: httpx.AsyncClient | None = None
+
+
+@lru_cache(maxsize=1)
+def _headers() -> MappingProxyType[str, str]:
+    # Built once and installed as the shared client's default headers;
+    # read-only so no caller can mutate the cached mapping. Every caller
+    # has already checked that the API key is configured.
+    return MappingProxyType(
+        {
+            "Authorization": f"Bearer {settings.facturapi_api_key}",
+            "Content-Type": "application/json",
+        }
+    )
+
+
+def get_client() -> httpx.AsyncClient:
+    global client
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            base_url=FACTURAPI_BASE,
+            headers=_headers(),
+            timeout=30,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+    return client
+
+
+async def aclose_client() -> None:
+    global client
+    if client is not None:
+        await client.aclose()
+        client = None
 
-def _headers() -> dict[str, str]:
+
+def line_item_json(li: FacturaLineItem) -> dict:
+    """Float-converted line item, as persisted in ``Factura.line_items_json``.
+
+    Also the input ``facturapi_item`` reads, so each Decimal is converted
+    to float once per line no matter how many times the line is used.
+    """
     return {
-        "Authorization": f"Bearer {settings.facturapi_api_key}",
-        "Content-Type": "application/json",
+        "product_key": li.product_key,
+        "description": li.description,
+        "quantity": li.quantity,
+        "unit_price": float(li.unit_price),
+        "tax_rate": float(li.tax_rate),
+        "isr_retention": float(li.isr_retention) if li.isr_retention else None,
+        "iva_retention": float(li.iva_retention) if li.iva_retention else None,
+        "cedular_rate": float(li.cedular_rate) if li.cedular_rate else None,
+        "cedular_label": li.cedular_label,
     }
 
 
+def facturapi_item(line: dict) -> dict:
+    """Build one Facturapi ``items[]`` entry from a ``line_item_json`` dict."""
+    # Rows written before every key was persisted fall back to the
+    # FacturaLineItem defaults.
+    taxes = [{"type": "IVA", "rate": line.get("tax_rate", 0.16)}]
+    if line.get("isr_retention"):
+        taxes.append({"type": "ISR", "rate": line["isr_retention"], "withholding": True})
+    if line.get("iva_retention"):
+        taxes.append({"type": "IVA", "rate": line["iva_retention"], "withholding": True})
+
+    product: dict = {
+        "description": line["description"],
+        "product_key": line["product_key"],
+        "price": line["unit_price"],
+        "tax_included": False,
+        "taxes": taxes,
+    }
+
+    if line.get("cedular_rate"):
+        # Facturapi accepts ``type`` as a free-form label that SAT will
+        # render in ``implocal:ImpLocRetenido`` on the CFDI. Use the
+        # human-readable cedular label when provided so the PDF line
+        # reads e.g. "Cedular GTO 2.00%".
+        product["local_taxes"] = [
+            {
+                "type": line.get("cedular_label") or "Cedular",
+                "rate": line["cedular_rate"],
+                "withholding": True,
+            }
+        ]
+
+    return {"product": product, "quantity": line.get("quantity", 1)}
+
+
 def build_facturapi_payload(
     data: FacturaCreate,
     *,
     idempotency_key: str | None = None,
+    line_items: list[dict] | None = None,
 ) -> dict:
     """Transform our schema into Facturapi's expected payload.
 
@@ -31,49 +122,59 @@ def build_facturapi_payload(
     per Facturapi's async-safe retry protocol. Required by the outbox
     worker so a retry after a "stamped but not committed" crash returns
     the same CFDI instead of creating a duplicate.
+
+    ``line_items`` takes already-converted ``line_item_json`` dicts (e.g.
+    the list a caller is about to persist) so they aren't rebuilt here.
     """
-    items = []
-    for li in data.line_items:
-        taxes = [{"type": "IVA", "rate": float(li.tax_rate)}]
-        if li.isr_retention:
-            taxes.append({"type": "ISR", "rate": float(li.isr_retention), "withholding": True})
-        if li.iva_retention:
-            taxes.append({"type": "IVA", "rate": float(li.iva_retention), "withholding": True})
-
-        product: dict = {
-            "description": li.description,
-            "product_key": li.product_key,
-            "price": float(li.unit_price),
-            "tax_included": False,
-            "taxes": taxes,
-        }
+    if line_items is None:
+        line_items = [line_item_json(li) for li in data.line_items]
+    return _assemble_payload(
+        data, line_items, exchange_rate=data.exchange_rate, idempotency_key=idempotency_key
+    )
+
+
+def build_facturapi_payload_from_factura(
+    factura: Factura,
+    *,
+    idempotency_key: str | None = None,
+) -> dict:
+    """Payload for a stored ``Factura`` row, straight from ``line_items_json``.
 
-        if li.cedular_rate:
-            # Facturapi accepts ``type`` as a free-form label that SAT will
-            # render in ``implocal:ImpLocRetenido`` on the CFDI. Use the
-            # human-readable cedular label when provided so the PDF line
-            # reads e.g. "Cedular GTO 2.00%".
-            product["local_taxes"] = [
-                {
-                    "type": li.cedular_label or "Cedular",
-                    "rate": float(li.cedular_rate),
-                    "withholding": True,
-                }
-            ]
-
-        items.append({"product": product, "quantity": li.quantity})
+    The stored lines are already ``line_item_json`` floats, so the outbox
+    doesn't rebuild ``FacturaCreate``/``FacturaLineItem`` (Pydantic
+    validation + Decimal parsing per line) only to convert back to float.
+    """
+    if (factura.currency or "MXN").upper() != "MXN":
+        # Factura rows don't persist a TipoCambio. Refuse instead of stamping
+        # at the implicit 1.0 — the guarantee FacturaCreate's validator gave
+        # when the outbox rebuilt the schema.
+        raise ValueError("exchange_rate is required for non-MXN facturas")
+    return _assemble_payload(
+        factura,
+        factura.line_items_json or [],
+        exchange_rate=None,
+        idempotency_key=idempotency_key,
+    )
 
+
+def _assemble_payload(
+    source: FacturaCreate | Factura,
+    line_items: list[dict],
+    *,
+    exchange_rate: Decimal | None,
+    idempotency_key: str | None,
+) -> dict:
     payload: dict = {
         "customer": {
-            "legal_name": data.customer_name,
-            "tax_id": data.customer_rfc,
-            "tax_system": data.customer_tax_system,
-            "address": {"zip": data.customer_zip},
+            "legal_name": source.customer_name,
+            "tax_id": source.customer_rfc,
+            "tax_system": source.customer_tax_system,
+            "address": {"zip": source.customer_zip},
         },
-        "items": items,
-        "use": data.use,
-        "payment_form": data.payment_form,
-        "payment_method": data.payment_method,
+        "items": [facturapi_item(line) for line in line_items],
+        "use": source.use,
+        "payment_form": source.payment_form,
+        "payment_method": source.payment_method,
     }
     # Only emit `currency` + `exchange` when the caller picked a non-MXN
     # invoice. SAT defaults to MXN at exchange 1.0, so adding them for
@@ -83,11 +184,11 @@ def build_facturapi_payload(
     # requires ``exchange_rate`` at the schema layer when currency is
     # non-MXN, so by the time we reach here it's guaranteed to be set.
     # (Codex round-5/round-6 P2, 2026-04-18.)
-    invoice_currency = (data.currency or "MXN").upper()
+    invoice_currency = (source.currency or "MXN").upper()
     if invoice_currency != "MXN":
         payload["currency"] = invoice_currency
-        if data.exchange_rate is not None:
-            payload["exchange"] = float(data.exchange_rate)
+        if exchange_rate is not None:
+            payload["exchange"] = float(exchange_rate)
     if idempotency_key:
         payload["idempotency_key"] = idempotency_key
     # Note: Facturapi no longer accepts the "comments" field.
@@ -107,103 +208,139 @@ def _check_key():
 async def create_invoice(payload: dict) -> dict:
     """POST /v2/invoices — create and stamp a CFDI."""
     _check_key()
-    async with httpx.AsyncClient(timeout=30) as client:
-        resp = await client.post(
-            f"{FACTURAPI_BASE}/invoices",
-            json=payload,
-            headers=_headers(),
-        )
-        if resp.status_code >= 400:
-            detail = resp.json() if resp.headers.get("content-type", "").startswith("application/json") else resp.text
-            raise HTTPException(status_code=502, detail={"facturapi_error": detail})
-        return resp.json()
+    resp = await get_client().post(
+        "/invoices",
+        json=payload,
+    )
+    if resp.status_code >= 400:
+        detail = resp.json() if resp.headers.get("content-type", "").startswith("application/json") else resp.text
+        raise HTTPException(status_code=502, detail={"facturapi_error": detail})
+    return resp.json()
 
 
 async def create_draft_invoice(payload: dict) -> dict:
     """POST /v2/invoices with status:"draft" — create a preview invoice without SAT stamping."""
     _check_key()
     draft_payload = {**payload, "status": "draft"}
-    async with httpx.AsyncClient(timeout=30) as client:
-        resp = await client.post(
-            f"{FACTURAPI_BASE}/invoices",
-            json=draft_payload,
-            headers=_headers(),
-        )
-        if resp.status_code >= 400:
-            detail = resp.json() if resp.headers.get("content-type", "").startswith("application/json") else resp.text
-            raise HTTPException(status_code=502, detail={"facturapi_error": detail})
-        return resp.json()
+    resp = await get_client().post(
+        "/invoices",
+        json=draft_payload,
+    )
+    if resp.status_code >= 400:
+        detail = resp.json() if resp.headers.get("content-type", "").startswith("application/json") else resp.text
+        raise HTTPException(status_code=502, detail={"facturapi_error": detail})
+    return resp.json()
 
 
 async def stamp_draft_invoice(facturapi_id: str) -> dict:
     """POST /v2/invoices/{id}/stamp — promote a draft to a valid stamped CFDI."""
     _check_key()
-    async with httpx.AsyncClient(timeout=30) as client:
-        resp = await client.post(
-            f"{FACTURAPI_BASE}/invoices/{facturapi_id}/stamp",
-            headers=_headers(),
-        )
-        if resp.status_code >= 400:
-            detail = resp.json() if resp.headers.get("content-type", "").startswith("application/json") else resp.text
-            status = 400 if resp.status_code == 400 else 502
-            raise HTTPException(status_code=status, detail={"facturapi_error": detail})
-        return resp.json()
+    resp = await get_client().post(
+        f"/invoices/{facturapi_id}/stamp",
+    )
+    if resp.status_code >= 400:
+        detail = resp.json() if resp.headers.get("content-type", "").startswith("application/json") else resp.text
+        status = 400 if resp.status_code == 400 else 502
+        raise HTTPException(status_code=status, detail={"facturapi_error": detail})
+    return resp.json()
 
 
 async def delete_draft_invoice(facturapi_id: str) -> None:
     """DELETE /v2/invoices/{id} — remove a draft from Facturapi (no motive for drafts)."""
     _check_key()
-    async with httpx.AsyncClient(timeout=30) as client:
-        resp = await client.delete(
-            f"{FACTURAPI_BASE}/invoices/{facturapi_id}",
-            headers=_headers(),
-        )
-        if resp.status_code >= 400 and resp.status_code != 404:
-            detail = resp.json() if resp.headers.get("content-type", "").startswith("application/json") else resp.text
-            raise HTTPException(status_code=502, detail={"facturapi_error": detail})
+    resp = await get_client().delete(
+        f"/invoices/{facturapi_id}",
+    )
+    if resp.status_code >= 400 and resp.status_code != 404:
+        detail = resp.json() if resp.headers.get("content-type", "").startswith("application/json") else resp.text
+        raise HTTPException(status_code=502, detail={"facturapi_error": detail})
 
 
 async def create_egreso_invoice(payload: dict) -> dict:
     """POST /v2/invoices — create and stamp an egreso CFDI."""
     _check_key()
-    async with httpx.AsyncClient(timeout=30) as client:
-        resp = await client.post(
-            f"{FACTURAPI_BASE}/invoices",
-            json=payload,
-            headers=_headers(),
-        )
-        if resp.status_code >= 400:
-            detail = resp.json() if resp.headers.get("content-type", "").startswith("application/json") else resp.text
-            raise HTTPException(status_code=502, detail={"facturapi_error": detail})
-        return resp.json()
+    resp = await get_client().post(
+        "/invoices",
+        json=payload,
+    )
+    if resp.status_code >= 400:
+        detail = resp.json() if resp.headers.get("content-type", "").startswith("application/json") else resp.text
+        raise HTTPException(status_code=502, detail={"facturapi_error": detail})
+    return resp.json()
 
 
 async def cancel_invoice(facturapi_id: str, motive: str = "02") -> dict:
     """DELETE /v2/invoices/{id} — cancel a stamped CFDI."""
     _check_key()
-    async with httpx.AsyncClient(timeout=30) as client:
-        resp = await client.delete(
-            f"{FACTURAPI_BASE}/invoices/{facturapi_id}",
-            params={"motive": motive},
-            headers=_headers(),
-        )
-        if resp.status_code >= 400:
-            detail = resp.json() if resp.headers.get("content-type", "").startswith("application/json") else resp.text
-            raise HTTPException(status_code=502, detail={"facturapi_error": detail})
-        return resp.json()
-
-
-async def download_pdf(facturapi_id: str) -> bytes:
-    """GET /v2/invoices/{id}/pdf — download CFDI PDF."""
+    resp = await get_client().delete(
+        f"/invoices/{facturapi_id}",
+        params={"motive": motive},
+    )
+    if resp.status_code >= 400:
+        detail = resp.json() if resp.headers.get("content-type", "").startswith("application/json") else resp.text
+        raise HTTPException(status_code=502, detail={"facturapi_error": detail})
+    return resp.json()
+
+
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# A stamped CFDI's PDF/XML never changes, and the UI re-downloads the same
+# file on refresh/print/email. Bounded by count: PDFs run ~50-200 KB, so
+# this caps out in the tens of MB. Only callers that know the row is
+# stamped opt in via ``cacheable``.
+_download_cache: TTLCache[tuple[str, str], bytes] = TTLCache(maxsize=256, ttl=3600)
+
+
+async def _relay_body(
+    resp: httpx.Response, cache_key: tuple[str, str] | None = None
+) -> AsyncIterator[bytes]:
+    chunks: list[bytes] = []
+    try:
+        async for chunk in resp.aiter_bytes(_DOWNLOAD_CHUNK_SIZE):
+            if cache_key is not None:
+                chunks.append(chunk)
+            yield chunk
+    finally:
+        await resp.aclose()
+    # Only reached when the body was relayed in full.
+    if cache_key is not None:
+        _download_cache.set(cache_key, b"".join(chunks))
+
+
+async def _replay_body(body: bytes) -> AsyncIterator[bytes]:
+    yield body
+
+
+async def _open_download(
+    path: str, error_detail: str, cache_key: tuple[str, str] | None = None
+) -> AsyncIterator[bytes]:
+    """Start a streamed GET and return its body as an async chunk iterator.
+
+    The upstream status is checked before returning, so a Facturapi error
+    still surfaces as a 502 instead of a truncated 200 body. The upstream
+    response is closed once the iterator is exhausted or abandoned. With a
+    ``cache_key`` a cached body is replayed, and a fully relayed one stored.
+    """
+    if cache_key is not None:
+        body = _download_cache.get(cache_key)
+        if body is not None:
+            return _replay_body(body)
     _check_key()
-    async with httpx.AsyncClient(timeout=30) as client:
-        resp = await client.get(
-            f"{FACTURAPI_BASE}/invoices/{facturapi_id}/pdf",
-            headers=_headers(),
-        )
-        if resp.status_code >= 400:
-            raise HTTPException(status_code=502, detail="Failed to download PDF from Facturapi")
-        return resp.content
+    http = get_client()
+    resp = await http.send(http.build_request("GET", path), stream=True)
+    if resp.status_code >= 400:
+        await resp.aclose()
+        raise HTTPException(status_code=502, detail=error_detail)
+    return _relay_body(resp, cache_key)
+
+
+async def download_pdf(facturapi_id: str, *, cacheable: bool = False) -> AsyncIterator[bytes]:
+    """GET /v2/invoices/{id}/pdf — stream CFDI PDF."""
+    return await _open_download(
+        f"/invoices/{facturapi_id}/pdf",
+        "Failed to download PDF from Facturapi",
+        (facturapi_id, "pdf") if cacheable else None,
+    )
 
 
 def build_payment_complement_payload(
@@ -375,14 +512,10 @@ def build_payment_complement_payload(
     return payload
 
 
-async def download_xml(facturapi_id: str) -> bytes:
-    """GET /v2/invoices/{id}/xml — download CFDI XML."""
-    _check_key()
-    async with httpx.AsyncClient(timeout=30) as client:
-        resp = await client.get(
-            f"{FACTURAPI_BASE}/invoices/{facturapi_id}/xml",
-            headers=_headers(),
-        )
-        if resp.status_code >= 400:
-            raise HTTPException(status_code=502, detail="Failed to download XML from Facturapi")
-        return resp.content
+async def download_xml(facturapi_id: str, *, cacheable: bool = False) -> AsyncIterator[bytes]:
+    """GET /v2/invoices/{id}/xml — stream CFDI XML."""
+    return await _open_download(
+        f"/invoices/{facturapi_id}/xml",
+        "Failed to download XML from Facturapi",
+        (facturapi_id, "xml") if cacheable else None,
+    )
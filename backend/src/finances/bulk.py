@@ -0,0 +1,43 @@
+"""Batched writers for finance rows.
+
+The ORM unit of work flushes pending rows whenever a later query
+autoflushes. In the Stripe reconcile/backfill loop that happens once per
+event, so each IncomeEntry goes out as its own INSERT. These helpers
+send accumulated rows as multi-row INSERTs instead.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.finances.models import IncomeEntry
+
+BULK_INSERT_CHUNK = 1000
+
+
+async def bulk_insert_income(
+    db: AsyncSession,
+    rows: list[dict[str, Any]],
+    *,
+    chunk: int = BULK_INSERT_CHUNK,
+) -> int:
+    """Insert ``rows`` (IncomeEntry column dicts) in chunks of ``chunk``.
+
+    Runs inside the caller's transaction. Every row must carry the same
+    keys; ``render_nulls`` keeps rows with NULLs in the same batch. Rows
+    whose stripe_payment_id already exists are skipped.
+    """
+    stmt = (
+        pg_insert(IncomeEntry)
+        .on_conflict_do_nothing(
+            index_elements=[IncomeEntry.stripe_payment_id],
+            index_where=IncomeEntry.stripe_payment_id.isnot(None),
+        )
+        .execution_options(render_nulls=True)
+    )
+    for start in range(0, len(rows), chunk):
+        await db.execute(stmt, rows[start:start + chunk])
+    return len(rows)
@@ -0,0 +1,74 @@
+"""Per-process cache of the latest stored exchange rate.
+
+Every income/expense/cash-balance write and each Stripe event converts
+to USD with the newest ``exchange_rates`` row. That row only changes
+through ``PATCH /finances/exchange-rates``, which calls
+``invalidate_on_commit``; the TTL bounds staleness across replicas.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+from sqlalchemy import bindparam, event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+from src.common.ttl_cache import TTLCache
+from src.finances.models import ExchangeRate
+
+_MISSING = object()
+_PENDING_KEY = "fx_cache.pending_invalidation"
+
+# Served index-only by ix_exchange_rates_latest (rate is INCLUDEd).
+_LATEST_RATE = (
+    select(ExchangeRate.rate)
+    .where(
+        ExchangeRate.from_currency == bindparam("from_currency"),
+        ExchangeRate.to_currency == bindparam("to_currency"),
+    )
+    .order_by(ExchangeRate.effective_date.desc())
+    .limit(1)
+)
+
+_cache: TTLCache[tuple[str, str], Decimal | None] = TTLCache(maxsize=16, ttl=60)
+
+
+async def latest_rate(db: AsyncSession, from_currency: str, to_currency: str) -> Decimal | None:
+    """Newest stored ``from_currency``→``to_currency`` rate, or None if none exists."""
+    key = (from_currency, to_currency)
+    cached = _cache.get(key, _MISSING)  # type: ignore[arg-type]
+    if cached is not _MISSING:
+        return cached
+    result = await db.execute(_LATEST_RATE, {"from_currency": from_currency, "to_currency": to_currency})
+    rate = result.scalar_one_or_none()
+    _cache.set(key, rate)
+    return rate
+
+
+def invalidate() -> None:
+    _cache.clear()
+
+
+def invalidate_on_commit(db: AsyncSession | Session) -> None:
+    """Clear the cache once ``db``'s current transaction ends.
+
+    Clearing right after the flush would let a concurrent reader re-cache
+    the old committed rate for a full TTL. Objects without a session
+    ``info`` dict have no transaction to wait for, so the cache is cleared
+    immediately.
+    """
+    info = getattr(getattr(db, "sync_session", db), "info", None)
+    if info is None:
+        invalidate()
+        return
+    info[_PENDING_KEY] = True
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _clear_pending(session: Session, transaction: SessionTransaction) -> None:
+    # Outermost transaction only, as in facturas.cache.
+    if transaction.parent is not None:
+        return
+    if session.info.pop(_PENDING_KEY, False):
+        invalidate()
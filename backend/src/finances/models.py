@@ -6,14 +6,17 @@ from decimal import Decimal
 
 from sqlalchemy import (
     Boolean,
+    Computed,
     Date,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
     Text,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
@@ -23,6 +26,18 @@ from src.common.database import Base
 
 class ExchangeRate(Base):
     __tablename__ = "exchange_rates"
+    # Load server defaults (created_at) via INSERT ... RETURNING on flush.
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        # Latest-rate lookups become an index-only scan.
+        Index(
+            "ix_exchange_rates_latest",
+            "from_currency",
+            "to_currency",
+            text("effective_date DESC"),
+            postgresql_include=["rate"],
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     from_currency: Mapped[str] = mapped_column(String(3), nullable=False)
@@ -33,12 +48,57 @@ class ExchangeRate(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
 
+# Stored monthly USD equivalent, the DDL twin of
+# recurrence.income_monthly_equivalent_sql(amount_usd, ...). Generated
+# columns need a literal immutable expression; keep the two in sync
+# (tests/test_finances_recurrence.py checks both against the Python helpers).
+INCOME_MONTHLY_AMOUNT_USD_SQL = """CASE COALESCE(
+    CASE WHEN lower(btrim(metadata_json->>'recurrence_type', E' \\t\\n\\r\\f\\013')) IN ('monthly', 'one_time', 'custom')
+         THEN lower(btrim(metadata_json->>'recurrence_type', E' \\t\\n\\r\\f\\013')) END,
+    CASE WHEN is_recurring THEN 'monthly' ELSE 'one_time' END)
+  WHEN 'one_time' THEN 0.00
+  WHEN 'custom' THEN round(amount_usd / GREATEST(
+    CASE jsonb_typeof(metadata_json->'custom_interval_months')
+      WHEN 'number' THEN trunc((metadata_json->>'custom_interval_months')::numeric)
+      WHEN 'string' THEN CASE WHEN metadata_json->>'custom_interval_months' ~ '^\\s*[+-]?[0-9]+\\s*$'
+                              THEN (metadata_json->>'custom_interval_months')::numeric END
+    END, 1), 2)
+  ELSE round(amount_usd, 2)
+END"""
+
+
 class IncomeEntry(Base):
     __tablename__ = "income_entries"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        # Manual rows have no Stripe id; keep their NULLs out of the index.
+        Index(
+            "uq_income_stripe_payment_id",
+            "stripe_payment_id",
+            unique=True,
+            postgresql_where=text("stripe_payment_id IS NOT NULL"),
+        ),
+        # Serves ``metadata_json @> {...}`` containment filters (recurrence_type).
+        Index(
+            "ix_income_metadata_path_ops",
+            "metadata_json",
+            postgresql_using="gin",
+            postgresql_ops={"metadata_json": "jsonb_path_ops"},
+        ),
+        # Plain equality on the one JSON key that gets filtered/grouped on.
+        Index("ix_income_recurrence_type_expr", text("(metadata_json->>'recurrence_type')")),
+        Index("ix_income_is_recurring_true", "is_recurring", postgresql_where=text("is_recurring = true")),
+        # Month/period range reports and per-customer revenue timelines.
+        Index("ix_income_date_curr", "date", "currency"),
+        Index("ix_income_customer_date", "customer_id", text("date DESC")),
+        # Matches the listing's ORDER BY date DESC, id so pages stop early.
+        Index("ix_income_date_desc_id", text("date DESC"), "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     source: Mapped[str] = mapped_column(String(20), nullable=False)  # stripe / manual
-    stripe_payment_id: Mapped[str | None] = mapped_column(String(255), unique=True, nullable=True)
+    # Unique via the partial uq_income_stripe_payment_id index below.
+    stripe_payment_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
     stripe_invoice_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
     customer_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("customers.id"), nullable=True)
     account_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
@@ -49,13 +109,28 @@ class IncomeEntry(Base):
     category: Mapped[str] = mapped_column(String(50), default="subscription")
     date: Mapped[date] = mapped_column(Date, nullable=False)
     is_recurring: Mapped[bool] = mapped_column(Boolean, default=False)
-    metadata_json: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    metadata_json: Mapped[dict] = mapped_column(
+        JSONB, nullable=False, default=dict, server_default=text("'{}'::jsonb")
+    )
+    monthly_amount_usd: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2), Computed(INCOME_MONTHLY_AMOUNT_USD_SQL, persisted=True)
+    )
     created_by: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
 
 class StripePaymentEvent(Base):
     __tablename__ = "stripe_payment_events"
+    __table_args__ = (
+        # Month-window scans: reconciliation, parity check, dashboard.
+        Index("ix_stripe_payment_events_occurred_at", "occurred_at"),
+        # Unlinked queue, newest first.
+        Index(
+            "ix_stripe_payment_events_unlinked_occurred",
+            text("occurred_at DESC"),
+            postgresql_where=text("unlinked"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     stripe_event_id: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
@@ -80,6 +155,11 @@ class StripePaymentEvent(Base):
 
 class StripePayoutEvent(Base):
     __tablename__ = "stripe_payout_events"
+    __table_args__ = (
+        Index("ix_stripe_payout_events_created_at", "created_at"),
+        # Paid-in-period total of the reconciliation summary.
+        Index("ix_stripe_payout_events_paid_at", "paid_at", postgresql_where=text("status = 'paid'")),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     stripe_event_id: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
@@ -103,6 +183,7 @@ class StripePayoutEvent(Base):
 
 class ManualDepositEntry(Base):
     __tablename__ = "manual_deposit_entries"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     account_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
@@ -117,6 +198,12 @@ class ManualDepositEntry(Base):
 
 class Expense(Base):
     __tablename__ = "expenses"
+    __table_args__ = (
+        Index("ix_expenses_date_category", "date", "category"),
+        Index("ix_expenses_paid_by_date", "paid_by", text("date DESC")),
+        Index("ix_expenses_date_desc_id", text("date DESC"), "id"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -134,11 +221,19 @@ class Expense(Base):
     vault_credential_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("credentials.id"), nullable=True)
     created_by: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    # Maintained by the touch_updated_at BEFORE UPDATE trigger.
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
 
 class Invoice(Base):
     __tablename__ = "invoices"
+    __table_args__ = (
+        # Status-leading so the overdue check skips paid/cancelled rows.
+        Index("ix_invoices_status_due_date", "status", "due_date"),
+        Index("ix_invoices_customer_issue_date", "customer_id", text("issue_date DESC")),
+        Index("ix_invoices_status_issue_date", "status", text("issue_date DESC")),
+        Index("ix_invoices_issue_date_desc_id", text("issue_date DESC"), "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     invoice_number: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
@@ -159,11 +254,13 @@ class Invoice(Base):
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
     created_by: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    # Maintained by the touch_updated_at BEFORE UPDATE trigger.
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
 
 class CashBalance(Base):
     __tablename__ = "cash_balances"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     amount: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
@@ -1,21 +1,35 @@
 from __future__ import annotations
 
 from decimal import Decimal, ROUND_HALF_UP
-from typing import cast
+
+import sqlalchemy as sa
+from sqlalchemy.sql.elements import ColumnElement
 
 from src.finances.schemas import IncomeRecurrenceType
 
-ALLOWED_RECURRENCE_TYPES: set[str] = {"monthly", "one_time", "custom"}
+ALLOWED_RECURRENCE_TYPES: frozenset[str] = frozenset({"monthly", "one_time", "custom"})
 DEFAULT_CUSTOM_INTERVAL_MONTHS = 1
 
+# Parsed once; income_monthly_equivalent runs per row in MRR rollups.
+_ZERO = Decimal("0.00")
+_CENT = Decimal("0.01")
+# Decimal divisors for the common 1-24 month intervals.
+_MONTHS_DEC = tuple(Decimal(i) for i in range(25))
+
+_ONE_TIME_DEFAULT: tuple[IncomeRecurrenceType, int | None, bool] = ("one_time", None, False)
+
 
 def extract_income_recurrence(metadata_json: dict | None, is_recurring: bool) -> tuple[IncomeRecurrenceType, int | None]:
-    metadata = metadata_json if isinstance(metadata_json, dict) else {}
+    # Most rows carry no metadata; answer those before any string work.
+    if not metadata_json:
+        return ("monthly" if is_recurring else "one_time"), None
+    metadata = metadata_json
 
-    raw_type = str(metadata.get("recurrence_type") or "").strip().lower()
+    raw_type = metadata.get("recurrence_type")
+    raw_type = raw_type.strip().lower() if isinstance(raw_type, str) else ""
     if raw_type not in ALLOWED_RECURRENCE_TYPES:
         raw_type = "monthly" if is_recurring else "one_time"
-    recurrence_type = cast(IncomeRecurrenceType, raw_type)
+    recurrence_type: IncomeRecurrenceType = raw_type  # type: ignore[assignment]
 
     interval: int | None = None
     if recurrence_type == "custom":
@@ -37,30 +51,40 @@ def normalize_income_recurrence_payload(
     existing_metadata: dict | None = None,
     existing_is_recurring: bool | None = None,
 ) -> tuple[IncomeRecurrenceType, int | None, bool]:
+    # Nothing chosen and nothing to inherit: always a one-time entry.
+    if recurrence_type is None and is_recurring is None and existing_is_recurring is None:
+        return _ONE_TIME_DEFAULT
+
+    # Parse the stored recurrence at most once, and only when it is used.
+    existing: tuple[IncomeRecurrenceType, int | None] | None = None
     if recurrence_type is not None:
         chosen_type = recurrence_type.strip().lower()
     elif is_recurring is not None:
         chosen_type = "monthly" if is_recurring else "one_time"
     elif existing_is_recurring is not None:
-        chosen_type, _ = extract_income_recurrence(existing_metadata, existing_is_recurring)
+        existing = extract_income_recurrence(existing_metadata, existing_is_recurring)
+        chosen_type = existing[0]
     else:
         chosen_type = "one_time"
 
     if chosen_type not in ALLOWED_RECURRENCE_TYPES:
         raise ValueError(f"Invalid recurrence_type: {chosen_type}")
 
-    existing_type, existing_interval = extract_income_recurrence(existing_metadata, bool(existing_is_recurring))
     interval: int | None = None
     if chosen_type == "custom":
         interval = custom_interval_months
-        if interval is None and existing_type == "custom":
-            interval = existing_interval
+        if interval is None and (existing_metadata is not None or existing_is_recurring is not None):
+            if existing is None:
+                existing = extract_income_recurrence(existing_metadata, bool(existing_is_recurring))
+            existing_type, existing_interval = existing
+            if existing_type == "custom":
+                interval = existing_interval
         if interval is None:
             interval = DEFAULT_CUSTOM_INTERVAL_MONTHS
         if interval < 1:
             raise ValueError("custom_interval_months must be >= 1")
 
-    normalized = cast(IncomeRecurrenceType, chosen_type)
+    normalized: IncomeRecurrenceType = chosen_type  # type: ignore[assignment]
     return normalized, interval, normalized != "one_time"
 
 
@@ -69,7 +93,16 @@ def build_income_metadata(
     recurrence_type: IncomeRecurrenceType,
     custom_interval_months: int | None,
 ) -> dict:
-    metadata = dict(existing_metadata) if isinstance(existing_metadata, dict) else {}
+    if not existing_metadata:
+        # Nothing to preserve; skip the copy (the common non-recurring save).
+        if recurrence_type == "custom":
+            return {
+                "recurrence_type": recurrence_type,
+                "custom_interval_months": int(custom_interval_months or DEFAULT_CUSTOM_INTERVAL_MONTHS),
+            }
+        return {"recurrence_type": recurrence_type}
+
+    metadata = existing_metadata.copy()
     metadata["recurrence_type"] = recurrence_type
     if recurrence_type == "custom":
         metadata["custom_interval_months"] = int(custom_interval_months or DEFAULT_CUSTOM_INTERVAL_MONTHS)
@@ -92,10 +125,109 @@ def income_monthly_equivalent(
     custom_interval_months: int | None,
 ) -> Decimal:
     if recurrence_type == "one_time":
-        return Decimal("0.00")
+        return _ZERO
     if recurrence_type == "custom":
         months = int(custom_interval_months or DEFAULT_CUSTOM_INTERVAL_MONTHS)
         if months < 1:
             months = DEFAULT_CUSTOM_INTERVAL_MONTHS
-        return (amount / Decimal(months)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-    return amount.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        divisor = _MONTHS_DEC[months] if months < len(_MONTHS_DEC) else Decimal(months)
+        return (amount / divisor).quantize(_CENT, rounding=ROUND_HALF_UP)
+    return amount.quantize(_CENT, rounding=ROUND_HALF_UP)
+
+
+# ``str.strip()``'s ASCII whitespace; Postgres ``trim()`` only strips spaces.
+_SQL_WHITESPACE = " \t\n\r\f\v"
+# Largest interval the projected INTEGER column can carry.
+_SQL_INT_MAX = 2_147_483_647
+
+
+def _income_recurrence_parts_sql(
+    metadata_json: ColumnElement,
+    is_recurring: ColumnElement,
+) -> tuple[ColumnElement, ColumnElement]:
+    """``(recurrence_type, interval)`` with ``interval`` as NUMERIC >= 1.
+
+    Mirrors ``extract_income_recurrence`` value for value: the type is
+    stripped and lowercased; the interval follows ``int()``, which
+    truncates JSON numbers and accepts strings holding only an optional
+    sign, digits and surrounding whitespace. Anything else is NULL, which
+    ``GREATEST`` turns into the default along with values below 1.
+    """
+    raw_type = sa.func.lower(sa.func.btrim(metadata_json["recurrence_type"].astext, _SQL_WHITESPACE))
+    recurrence_type = sa.case(
+        (raw_type.in_(sorted(ALLOWED_RECURRENCE_TYPES)), raw_type),
+        (is_recurring, sa.literal("monthly")),
+        else_=sa.literal("one_time"),
+    )
+    interval_json = metadata_json["custom_interval_months"]
+    interval_text = interval_json.astext
+    interval_type = sa.func.jsonb_typeof(interval_json)
+    interval = sa.func.greatest(
+        sa.case(
+            (interval_type == "number", sa.func.trunc(sa.cast(interval_text, sa.Numeric))),
+            (
+                (interval_type == "string") & interval_text.regexp_match(r"^\s*[+-]?[0-9]+\s*$"),
+                sa.cast(interval_text, sa.Numeric),
+            ),
+            else_=sa.null(),
+        ),
+        DEFAULT_CUSTOM_INTERVAL_MONTHS,
+    )
+    return recurrence_type, interval
+
+
+def income_recurrence_sql(
+    metadata_json: ColumnElement,
+    is_recurring: ColumnElement,
+) -> tuple[ColumnElement, ColumnElement]:
+    """SQL twin of ``extract_income_recurrence``.
+
+    Returns ``(recurrence_type, custom_interval_months)`` expressions so read
+    paths can have Postgres pull the two keys out of the JSONB instead of
+    shipping the whole blob and parsing it per row.
+    """
+    recurrence_type, interval = _income_recurrence_parts_sql(metadata_json, is_recurring)
+    custom_interval_months = sa.case(
+        (recurrence_type == "custom", sa.cast(sa.func.least(interval, _SQL_INT_MAX), sa.Integer)),
+        else_=sa.null(),
+    )
+    return recurrence_type, custom_interval_months
+
+
+def income_monthly_equivalent_sql(
+    amount: ColumnElement,
+    metadata_json: ColumnElement,
+    is_recurring: ColumnElement,
+) -> ColumnElement:
+    """SQL twin of ``extract_income_recurrence`` + ``income_monthly_equivalent``.
+
+    Lets MRR rollups ``SUM()`` the monthly equivalent in Postgres instead of
+    loading every income row and doing the Decimal math per row in Python.
+    """
+    recurrence_type, interval = _income_recurrence_parts_sql(metadata_json, is_recurring)
+    return sa.case(
+        (recurrence_type == "one_time", sa.literal(_ZERO, sa.Numeric(12, 2))),
+        (recurrence_type == "custom", sa.func.round(amount / interval, 2)),
+        else_=sa.func.round(amount, 2),
+    )
+
+
+def income_recurrence_filter_sql(
+    metadata_json: ColumnElement,
+    is_recurring: ColumnElement,
+    recurrence_type: IncomeRecurrenceType,
+) -> ColumnElement:
+    """Rows whose ``income_recurrence_sql`` type is ``recurrence_type``.
+
+    Canonically tagged rows match through ``@>`` containment, which the
+    jsonb_path_ops GIN index serves. Untagged rows and non-canonical tags
+    (``" Custom "``, ``"weekly"``, non-strings) are compared on the
+    normalized type so the filter agrees with what the listing returns.
+    """
+    tagged = metadata_json.contains({"recurrence_type": recurrence_type})
+    raw_tag = sa.func.coalesce(metadata_json["recurrence_type"].astext, "")
+    normalized_type, _ = _income_recurrence_parts_sql(metadata_json, is_recurring)
+    return sa.or_(
+        tagged,
+        sa.and_(raw_tag.not_in(sorted(ALLOWED_RECURRENCE_TYPES)), normalized_type == recurrence_type),
+    )
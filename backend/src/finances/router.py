@@ -1,15 +1,19 @@
+import asyncio
 import uuid
-from datetime import date
+from datetime import date, timedelta
 from decimal import Decimal
 
 import stripe
-from fastapi import APIRouter, Depends, Header, HTTPException, Request
-from sqlalchemy import func, select
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from sqlalchemy import and_, case, event, func, literal, or_, select, true, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
 
 from src.auth.dependencies import get_current_user, require_admin
 from src.auth.models import User
-from src.common.database import get_db
+from src.common.database import async_session, get_db
+from src.common.ttl_cache import TTLCache
+from src.finances import fx_cache
 from src.finances.models import (
     CashBalance,
     ExchangeRate,
@@ -23,8 +27,9 @@ from src.finances.models import (
 from src.finances.recurrence import (
     build_income_metadata,
     extract_income_recurrence,
-    income_monthly_equivalent,
-    income_monthly_mrr_equivalent,
+    income_monthly_equivalent_sql,
+    income_recurrence_filter_sql,
+    income_recurrence_sql,
     normalize_income_recurrence_payload,
 )
 from src.finances.schemas import (
@@ -37,6 +42,7 @@ from src.finances.schemas import (
     ExpenseSummary,
     ExpenseUpdate,
     IncomeCreate,
+    IncomeRecurrenceType,
     IncomeResponse,
     IncomeSummary,
     IncomeUpdate,
@@ -63,21 +69,72 @@ DEFAULT_RATE = Decimal("0.05")
 ALLOWED_MANUAL_PAYMENT_REASONS = {"offline_transfer", "cash", "adjustment", "correction"}
 ALLOWED_MANUAL_DEPOSIT_REASONS = {"manual_bank_deposit", "adjustment"}
 
+# GET /exchange-rates/current is read on most finance page loads; update_rate
+# clears it once its transaction commits, the TTL covers other workers.
+_CURRENT_RATE_TTL_SECONDS = 30
+_current_rate_cache: TTLCache[str, ExchangeRateResponse] = TTLCache(maxsize=1, ttl=_CURRENT_RATE_TTL_SECONDS)
+_CURRENT_RATE_PENDING_KEY = "finances.current_rate_pending_clear"
+_CURRENT_RATE_STMT = (
+    select(ExchangeRate)
+    .where(ExchangeRate.from_currency == "USD", ExchangeRate.to_currency == "MXN")
+    .order_by(ExchangeRate.effective_date.desc())
+    .limit(1)
+)
+
+
+def _clear_current_rate_on_commit(db: AsyncSession | Session) -> None:
+    # Same contract as fx_cache.invalidate_on_commit: a reader landing
+    # between the flush and the commit would re-cache the old row.
+    info = getattr(getattr(db, "sync_session", db), "info", None)
+    if info is None:
+        _current_rate_cache.clear()
+        return
+    info[_CURRENT_RATE_PENDING_KEY] = True
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _clear_pending_current_rate(session: Session, transaction: SessionTransaction) -> None:
+    if transaction.parent is not None:
+        return
+    if session.info.pop(_CURRENT_RATE_PENDING_KEY, False):
+        _current_rate_cache.clear()
+
 
 async def _get_mxn_to_usd(db: AsyncSession) -> Decimal:
     """Get MXN→USD rate. Looks up stored USD→MXN rate and inverts it."""
-    result = await db.execute(
-        select(ExchangeRate)
-        .where(ExchangeRate.from_currency == "USD", ExchangeRate.to_currency == "MXN")
-        .order_by(ExchangeRate.effective_date.desc())
-        .limit(1)
-    )
-    rate = result.scalar_one_or_none()
-    if rate and rate.rate > 0:
-        return round(Decimal("1") / rate.rate, 6)
+    rate = await fx_cache.latest_rate(db, "USD", "MXN")
+    if rate and rate > 0:
+        return round(Decimal("1") / rate, 6)
     return DEFAULT_RATE
 
 
+async def _run_query(query):
+    """Run a read-only query in its own session so independent reads can be
+    awaited concurrently (same pattern as the dashboard)."""
+    async with async_session() as session:
+        return await session.execute(query)
+
+
+def _paginate(q, limit: int | None, offset: int):
+    # Optional so existing clients that expect the full list keep working.
+    if offset:
+        q = q.offset(offset)
+    if limit is not None:
+        q = q.limit(limit)
+    return q
+
+
+def _after_cursor(q, date_col, id_col, cursor_date: date | None, cursor_id: uuid.UUID | None):
+    # Keyset continuation for the ``ORDER BY date DESC, id`` listings: rows
+    # after the last one seen. Served by the (date DESC, id) listing indexes,
+    # so deep pages don't scan past skipped rows the way ``offset`` does.
+    if cursor_date is None:
+        return q
+    if cursor_id is None:
+        return q.where(date_col < cursor_date)
+    return q.where(or_(date_col < cursor_date, and_(date_col == cursor_date, id_col > cursor_id)))
+
+
 def _to_usd(amount: Decimal, currency: str, rate: Decimal) -> Decimal:
     if currency == "USD":
         return amount
@@ -97,6 +154,15 @@ def _normalize_manual_payment_reason(value: str | None) -> str:
     return reason
 
 
+def _manual_payment_reason_sql(metadata_json):
+    """SQL twin of ``_extract_manual_payment_reason``."""
+    raw = func.lower(func.trim(metadata_json["manual_reason"].astext))
+    return case(
+        (raw.in_(sorted(ALLOWED_MANUAL_PAYMENT_REASONS)), raw),
+        else_=literal("offline_transfer"),
+    )
+
+
 def _extract_manual_payment_reason(metadata_json: dict | None) -> str:
     if isinstance(metadata_json, dict):
         raw = str(metadata_json.get("manual_reason") or "offline_transfer").strip().lower()
@@ -135,8 +201,9 @@ def _income_key_for_payment_event(event: StripePaymentEvent) -> str:
 
 def _serialize_income(entry: IncomeEntry) -> IncomeResponse:
     recurrence_type, custom_interval_months = extract_income_recurrence(entry.metadata_json, entry.is_recurring)
-    monthly_amount_usd = income_monthly_mrr_equivalent(entry.amount_usd, recurrence_type, custom_interval_months)
-    return IncomeResponse(
+    # The ORM row is already typed and FastAPI validates the response_model
+    # again on the way out, so skip the constructor's validation pass here.
+    return IncomeResponse.model_construct(
         id=entry.id,
         source=entry.source,
         stripe_payment_id=entry.stripe_payment_id,
@@ -152,7 +219,7 @@ def _serialize_income(entry: IncomeEntry) -> IncomeResponse:
         recurrence_type=recurrence_type,
         custom_interval_months=custom_interval_months,
         manual_reason=_extract_manual_payment_reason(entry.metadata_json),
-        monthly_amount_usd=monthly_amount_usd,
+        monthly_amount_usd=entry.monthly_amount_usd,
         created_at=entry.created_at,
     )
 
@@ -161,12 +228,10 @@ def _serialize_income(entry: IncomeEntry) -> IncomeResponse:
 
 @router.get("/exchange-rates/current", response_model=ExchangeRateResponse)
 async def get_current_rate(db: AsyncSession = Depends(get_db), user: User = Depends(get_current_user)):
-    result = await db.execute(
-        select(ExchangeRate)
-        .where(ExchangeRate.from_currency == "USD", ExchangeRate.to_currency == "MXN")
-        .order_by(ExchangeRate.effective_date.desc())
-        .limit(1)
-    )
+    cached = _current_rate_cache.get("USD:MXN")
+    if cached is not None:
+        return cached
+    result = await db.execute(_CURRENT_RATE_STMT)
     rate = result.scalar_one_or_none()
     if not rate:
         # Return default
@@ -174,7 +239,10 @@ async def get_current_rate(db: AsyncSession = Depends(get_db), user: User = Depe
             from_currency="USD", to_currency="MXN",
             rate=DEFAULT_RATE, effective_date=date.today(), source="default"
         )
-    return rate
+        return rate
+    response = ExchangeRateResponse.model_validate(rate)
+    _current_rate_cache.set("USD:MXN", response)
+    return response
 
 
 @router.patch("/exchange-rates", response_model=ExchangeRateResponse)
@@ -191,7 +259,8 @@ async def update_rate(
     )
     db.add(rate)
     await db.flush()
-    await db.refresh(rate)
+    fx_cache.invalidate_on_commit(db)
+    _clear_current_rate_on_commit(db)
     return rate
 
 
@@ -204,10 +273,28 @@ async def list_income(
     source: str | None = None,
     category: str | None = None,
     account_id: uuid.UUID | None = None,
+    recurrence_type: IncomeRecurrenceType | None = None,
+    limit: int | None = Query(None, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    cursor_date: date | None = None,
+    cursor_id: uuid.UUID | None = None,
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    q = select(IncomeEntry).order_by(IncomeEntry.date.desc())
+    """Newest first. Pass ``limit`` to page, continuing either with
+    ``offset`` or with the last row's ``date``/``id`` as
+    ``cursor_date``/``cursor_id``; without ``limit`` the full list is
+    returned as before."""
+    # Plain table rows: read-only listing, no ORM instances or identity map.
+    # The JSONB blob itself stays in Postgres; only the keys the response
+    # needs come back, already normalized, under the response field names.
+    recurrence, interval = income_recurrence_sql(IncomeEntry.metadata_json, IncomeEntry.is_recurring)
+    q = select(
+        *(c for c in IncomeEntry.__table__.c if c.key in IncomeResponse.model_fields),
+        recurrence.label("recurrence_type"),
+        interval.label("custom_interval_months"),
+        _manual_payment_reason_sql(IncomeEntry.metadata_json).label("manual_reason"),
+    ).order_by(IncomeEntry.date.desc(), IncomeEntry.id)
     if start_date:
         q = q.where(IncomeEntry.date >= start_date)
     if end_date:
@@ -218,9 +305,14 @@ async def list_income(
         q = q.where(IncomeEntry.category == category)
     if account_id:
         q = q.where(IncomeEntry.account_id == account_id)
+    if recurrence_type:
+        q = q.where(
+            income_recurrence_filter_sql(IncomeEntry.metadata_json, IncomeEntry.is_recurring, recurrence_type)
+        )
+    q = _after_cursor(q, IncomeEntry.date, IncomeEntry.id, cursor_date, cursor_id)
+    q = _paginate(q, limit, offset)
     result = await db.execute(q)
-    entries = result.scalars().all()
-    return [_serialize_income(entry) for entry in entries]
+    return [IncomeResponse.model_construct(**row._mapping) for row in result.all()]
 
 
 @router.post("/income", response_model=IncomeResponse, status_code=201)
@@ -256,7 +348,6 @@ async def create_income(
     )
     db.add(entry)
     await db.flush()
-    await db.refresh(entry)
     return _serialize_income(entry)
 
 
@@ -267,8 +358,7 @@ async def update_income(
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    result = await db.execute(select(IncomeEntry).where(IncomeEntry.id == income_id))
-    entry = result.scalar_one_or_none()
+    entry = await db.get(IncomeEntry, income_id)
     if not entry:
         raise HTTPException(status_code=404, detail="Income entry not found")
     if entry.source != "manual":
@@ -302,13 +392,15 @@ async def update_income(
 
     if "manual_reason" in data.model_fields_set:
         normalized_reason = _normalize_manual_payment_reason(manual_reason)
-        metadata = dict(entry.metadata_json or {})
+        metadata = dict(entry.metadata_json)
         metadata["manual_reason"] = normalized_reason
         entry.metadata_json = metadata
 
     # Recalculate USD
     entry.amount_usd = _to_usd(entry.amount, entry.currency, rate)
     db.add(entry)
+    # Flush so UPDATE ... RETURNING (eager_defaults) reloads monthly_amount_usd.
+    await db.flush()
     return _serialize_income(entry)
 
 
@@ -318,8 +410,7 @@ async def delete_income(
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    result = await db.execute(select(IncomeEntry).where(IncomeEntry.id == income_id))
-    entry = result.scalar_one_or_none()
+    entry = await db.get(IncomeEntry, income_id)
     if not entry:
         raise HTTPException(status_code=404, detail="Income entry not found")
     if entry.source != "manual":
@@ -333,38 +424,43 @@ async def income_summary(
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    # MRR: monthly-equivalent income from recurring entries.
+    # MRR: monthly-equivalent income from recurring entries, aggregated in
+    # Postgres per currency instead of loading every income row.
     now = date.today()
-    result = await db.execute(select(IncomeEntry))
-    entries = result.scalars().all()
+    month_start = now.replace(day=1)
+    next_month_start = (month_start + timedelta(days=32)).replace(day=1)
+    in_period = (IncomeEntry.date >= month_start) & (IncomeEntry.date < next_month_start)
+    monthly_native = income_monthly_equivalent_sql(
+        IncomeEntry.amount, IncomeEntry.metadata_json, IncomeEntry.is_recurring
+    )
+    result = await db.execute(
+        select(
+            IncomeEntry.currency,
+            func.sum(monthly_native).filter(monthly_native > 0),
+            func.sum(IncomeEntry.monthly_amount_usd),
+            func.sum(IncomeEntry.amount).filter(in_period),
+            func.sum(IncomeEntry.amount_usd).filter(in_period),
+        ).group_by(IncomeEntry.currency)
+    )
 
     mrr = Decimal("0")
     mrr_by_currency: dict[str, Decimal] = {}
-    for entry in entries:
-        recurrence_type, custom_interval_months = extract_income_recurrence(entry.metadata_json, entry.is_recurring)
-        monthly_native = income_monthly_equivalent(entry.amount, recurrence_type, custom_interval_months)
-        if monthly_native > 0:
-            mrr_by_currency[entry.currency] = (
-                mrr_by_currency.get(entry.currency, Decimal("0")) + monthly_native
-            ).quantize(Decimal("0.01"))
-        mrr += income_monthly_mrr_equivalent(entry.amount_usd, recurrence_type, custom_interval_months)
+    # Total this month (native currency map + legacy USD total)
+    total_period = Decimal("0")
+    total_period_by_currency: dict[str, Decimal] = {}
+    for currency, native_mrr, usd_mrr, native_period, usd_period in result.all():
+        if native_mrr is not None:
+            mrr_by_currency[currency] = native_mrr.quantize(Decimal("0.01"))
+        mrr += usd_mrr or Decimal("0")
+        if native_period is not None:
+            total_period_by_currency[currency] = native_period.quantize(Decimal("0.01"))
+            total_period += usd_period
     mrr = mrr.quantize(Decimal("0.01"))
     arr = mrr * 12
     arr_by_currency = {
         currency: (value * 12).quantize(Decimal("0.01"))
         for currency, value in mrr_by_currency.items()
     }
-
-    # Total this month (native currency map + legacy USD total)
-    total_period = Decimal("0")
-    total_period_by_currency: dict[str, Decimal] = {}
-    for entry in entries:
-        if entry.date.year != now.year or entry.date.month != now.month:
-            continue
-        total_period += entry.amount_usd
-        total_period_by_currency[entry.currency] = (
-            total_period_by_currency.get(entry.currency, Decimal("0")) + entry.amount
-        ).quantize(Decimal("0.01"))
     total_period = total_period.quantize(Decimal("0.01"))
 
     return IncomeSummary(
@@ -387,10 +483,15 @@ async def list_expenses(
     category: str | None = None,
     paid_by: uuid.UUID | None = None,
     recurring: bool | None = None,
+    limit: int | None = Query(None, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    cursor_date: date | None = None,
+    cursor_id: uuid.UUID | None = None,
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    q = select(Expense).order_by(Expense.date.desc())
+    """Newest first; pages as in ``list_income``."""
+    q = select(Expense.__table__).order_by(Expense.date.desc(), Expense.id)
     if start_date:
         q = q.where(Expense.date >= start_date)
     if end_date:
@@ -401,8 +502,10 @@ async def list_expenses(
         q = q.where(Expense.paid_by == paid_by)
     if recurring is not None:
         q = q.where(Expense.is_recurring == recurring)
+    q = _after_cursor(q, Expense.date, Expense.id, cursor_date, cursor_id)
+    q = _paginate(q, limit, offset)
     result = await db.execute(q)
-    return result.scalars().all()
+    return result.all()
 
 
 @router.post("/expenses", response_model=ExpenseResponse, status_code=201)
@@ -429,7 +532,6 @@ async def create_expense(
     )
     db.add(expense)
     await db.flush()
-    await db.refresh(expense)
     return expense
 
 
@@ -440,8 +542,7 @@ async def update_expense(
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    result = await db.execute(select(Expense).where(Expense.id == expense_id))
-    expense = result.scalar_one_or_none()
+    expense = await db.get(Expense, expense_id)
     if not expense:
         raise HTTPException(status_code=404, detail="Expense not found")
 
@@ -459,8 +560,7 @@ async def delete_expense(
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    result = await db.execute(select(Expense).where(Expense.id == expense_id))
-    expense = result.scalar_one_or_none()
+    expense = await db.get(Expense, expense_id)
     if not expense:
         raise HTTPException(status_code=404, detail="Expense not found")
     await db.delete(expense)
@@ -472,25 +572,34 @@ async def expense_summary(
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    result = await db.execute(select(Expense))
-    expenses = result.scalars().all()
+    # One pass grouped by (category, payer); folded into the three views here.
+    result = await db.execute(
+        select(
+            Expense.category,
+            Expense.paid_by,
+            func.sum(Expense.amount_usd),
+            func.sum(Expense.amount_usd).filter(Expense.is_recurring.is_(True)),
+        ).group_by(Expense.category, Expense.paid_by)
+    )
 
-    total_usd = sum(float(e.amount_usd) for e in expenses)
-    by_category: dict[str, float] = {}
-    by_person: dict[str, float] = {}
+    # Sum in Decimal; the schema's float maps only see the final totals.
+    total_usd = Decimal("0")
+    by_category: dict[str, Decimal] = {}
+    by_person: dict[str, Decimal] = {}
     recurring_total = Decimal("0")
 
-    for e in expenses:
-        by_category[e.category] = by_category.get(e.category, 0) + float(e.amount_usd)
-        pid = str(e.paid_by)
-        by_person[pid] = by_person.get(pid, 0) + float(e.amount_usd)
-        if e.is_recurring:
-            recurring_total += e.amount_usd
+    for category, paid_by, amount_usd, recurring_usd in result.all():
+        total_usd += amount_usd
+        by_category[category] = by_category.get(category, Decimal("0")) + amount_usd
+        pid = str(paid_by)
+        by_person[pid] = by_person.get(pid, Decimal("0")) + amount_usd
+        if recurring_usd is not None:
+            recurring_total += recurring_usd
 
     return ExpenseSummary(
-        total_usd=Decimal(str(total_usd)),
-        by_category=by_category,
-        by_person=by_person,
+        total_usd=total_usd,
+        by_category={key: float(value) for key, value in by_category.items()},
+        by_person={key: float(value) for key, value in by_person.items()},
         recurring_total_usd=recurring_total,
     )
 
@@ -500,20 +609,19 @@ async def partner_summary(
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    result = await db.execute(select(Expense))
-    expenses = result.scalars().all()
-
-    # Get user names
-    from src.auth.models import User as UserModel
-    users_result = await db.execute(select(UserModel))
-    users = {str(u.id): u.name for u in users_result.scalars().all()}
+    result = await db.execute(
+        select(User.name, Expense.paid_by, func.sum(Expense.amount_usd))
+        .select_from(Expense)
+        .outerjoin(User, User.id == Expense.paid_by)
+        .group_by(Expense.paid_by, User.name)
+    )
 
-    totals: dict[str, float] = {}
-    for e in expenses:
-        name = users.get(str(e.paid_by), str(e.paid_by))
-        totals[name] = totals.get(name, 0) + float(e.amount_usd)
+    totals: dict[str, Decimal] = {}
+    for name, paid_by, amount_usd in result.all():
+        key = name if name is not None else str(paid_by)
+        totals[key] = totals.get(key, Decimal("0")) + amount_usd
 
-    return PartnerSummary(partner_totals=totals)
+    return PartnerSummary(partner_totals={key: float(value) for key, value in totals.items()})
 
 
 # ─── Stripe Ingestion + Reconciliation ────────────────────────────
@@ -571,87 +679,81 @@ async def stripe_reconciliation_summary(
 ):
     period_key, month_start, next_month = _resolve_period(period)
 
-    payments_received = (
-        await db.execute(
-            select(func.coalesce(func.sum(StripePaymentEvent.amount), 0)).where(
-                StripePaymentEvent.stripe_event_type == "payment_intent.succeeded",
-                StripePaymentEvent.occurred_at >= month_start,
-                StripePaymentEvent.occurred_at < next_month,
-            )
-        )
-    ).scalar() or Decimal("0")
-
-    refunds = (
-        await db.execute(
-            select(func.coalesce(func.sum(func.abs(StripePaymentEvent.amount)), 0)).where(
-                StripePaymentEvent.stripe_event_type == "charge.refunded",
-                StripePaymentEvent.occurred_at >= month_start,
-                StripePaymentEvent.occurred_at < next_month,
-            )
-        )
-    ).scalar() or Decimal("0")
-
-    payouts_paid = (
-        await db.execute(
-            select(func.coalesce(func.sum(StripePayoutEvent.amount), 0)).where(
-                StripePayoutEvent.status == "paid",
-                StripePayoutEvent.paid_at.isnot(None),
-                StripePayoutEvent.paid_at >= month_start,
-                StripePayoutEvent.paid_at < next_month,
-            )
-        )
-    ).scalar() or Decimal("0")
-
-    payouts_failed = (
-        await db.execute(
-            select(func.coalesce(func.sum(StripePayoutEvent.amount), 0)).where(
-                StripePayoutEvent.status == "failed",
-                StripePayoutEvent.failed_at.isnot(None),
-                StripePayoutEvent.failed_at >= month_start,
-                StripePayoutEvent.failed_at < next_month,
-            )
-        )
-    ).scalar() or Decimal("0")
-
-    manual_deposits = (
-        await db.execute(
-            select(func.coalesce(func.sum(ManualDepositEntry.amount), 0)).where(
-                ManualDepositEntry.reason == "manual_bank_deposit",
-                ManualDepositEntry.date >= month_start,
-                ManualDepositEntry.date < next_month,
-            )
-        )
-    ).scalar() or Decimal("0")
-
-    manual_adjustments = (
-        await db.execute(
-            select(func.coalesce(func.sum(ManualDepositEntry.amount), 0)).where(
-                ManualDepositEntry.reason == "adjustment",
-                ManualDepositEntry.date >= month_start,
-                ManualDepositEntry.date < next_month,
-            )
+    # One round trip: a single-row aggregate per table, each summing its
+    # buckets with FILTER, cross-joined into one result row.
+    payments = (
+        select(
+            func.coalesce(
+                func.sum(StripePaymentEvent.amount).filter(
+                    StripePaymentEvent.stripe_event_type == "payment_intent.succeeded"
+                ),
+                0,
+            ).label("payments_received"),
+            func.coalesce(
+                func.sum(func.abs(StripePaymentEvent.amount)).filter(
+                    StripePaymentEvent.stripe_event_type == "charge.refunded"
+                ),
+                0,
+            ).label("refunds"),
+            func.count(StripePaymentEvent.id).filter(StripePaymentEvent.unlinked == True).label(
+                "unlinked_payment_events"
+            ),
+        ).where(
+            StripePaymentEvent.occurred_at >= month_start,
+            StripePaymentEvent.occurred_at < next_month,
         )
-    ).scalar() or Decimal("0")
-
-    unlinked_payment_events = (
-        await db.execute(
-            select(func.count(StripePaymentEvent.id)).where(
-                StripePaymentEvent.unlinked == True,
-                StripePaymentEvent.occurred_at >= month_start,
-                StripePaymentEvent.occurred_at < next_month,
-            )
+    ).subquery()
+
+    paid_in_period = and_(StripePayoutEvent.paid_at >= month_start, StripePayoutEvent.paid_at < next_month)
+    failed_in_period = and_(StripePayoutEvent.failed_at >= month_start, StripePayoutEvent.failed_at < next_month)
+    created_in_period = and_(StripePayoutEvent.created_at >= month_start, StripePayoutEvent.created_at < next_month)
+    payouts = (
+        select(
+            func.coalesce(
+                func.sum(StripePayoutEvent.amount).filter(StripePayoutEvent.status == "paid", paid_in_period),
+                0,
+            ).label("payouts_paid"),
+            func.coalesce(
+                func.sum(StripePayoutEvent.amount).filter(StripePayoutEvent.status == "failed", failed_in_period),
+                0,
+            ).label("payouts_failed"),
+            func.count(StripePayoutEvent.id).filter(StripePayoutEvent.unlinked == True, created_in_period).label(
+                "unlinked_payout_events"
+            ),
+        ).where(or_(paid_in_period, failed_in_period, created_in_period))
+    ).subquery()
+
+    deposits = (
+        select(
+            func.coalesce(
+                func.sum(ManualDepositEntry.amount).filter(ManualDepositEntry.reason == "manual_bank_deposit"),
+                0,
+            ).label("manual_deposits"),
+            func.coalesce(
+                func.sum(ManualDepositEntry.amount).filter(ManualDepositEntry.reason == "adjustment"),
+                0,
+            ).label("manual_adjustments"),
+        ).where(
+            ManualDepositEntry.date >= month_start,
+            ManualDepositEntry.date < next_month,
         )
-    ).scalar() or 0
+    ).subquery()
 
-    unlinked_payout_events = (
+    totals = (
         await db.execute(
-            select(func.count(StripePayoutEvent.id)).where(
-                StripePayoutEvent.unlinked == True,
-                StripePayoutEvent.created_at >= month_start,
-                StripePayoutEvent.created_at < next_month,
+            select(payments, payouts, deposits).select_from(
+                payments.join(payouts, true()).join(deposits, true())
             )
         )
-    ).scalar() or 0
+    ).one()
+    payments_received = totals.payments_received or Decimal("0")
+    refunds = totals.refunds or Decimal("0")
+    payouts_paid = totals.payouts_paid or Decimal("0")
+    payouts_failed = totals.payouts_failed or Decimal("0")
+    manual_deposits = totals.manual_deposits or Decimal("0")
+    manual_adjustments = totals.manual_adjustments or Decimal("0")
+    unlinked_payment_events = totals.unlinked_payment_events or 0
+    unlinked_payout_events = totals.unlinked_payout_events or 0
 
     net_received = (Decimal(payments_received) - Decimal(refunds)).quantize(Decimal("0.01"))
     gap_to_deposit = (net_received - Decimal(payouts_paid) - Decimal(manual_deposits)).quantize(Decimal("0.01"))
@@ -702,8 +804,9 @@ async def list_unlinked_stripe_events(
         .limit(safe_limit)
     )
 
-    payment_rows = (await db.execute(payment_query)).scalars().all()
-    payout_rows = (await db.execute(payout_query)).scalars().all()
+    payment_result, payout_result = await asyncio.gather(_run_query(payment_query), _run_query(payout_query))
+    payment_rows = payment_result.scalars().all()
+    payout_rows = payout_result.scalars().all()
     return StripeUnlinkedEventsResponse(
         payment_events=payment_rows,
         payout_events=payout_rows,
@@ -731,23 +834,23 @@ async def link_unlinked_payment_event(
     event.unlinked = False
     db.add(event)
 
-    income_key = _income_key_for_payment_event(event)
-    income_rows = await db.execute(
-        select(IncomeEntry).where(IncomeEntry.stripe_payment_id == income_key)
+    # One UPDATE for every income row booked from this event.
+    income_values = {"account_id": data.account_id}
+    if data.customer_id is not None:
+        income_values["customer_id"] = data.customer_id
+    income_update = await db.execute(
+        update(IncomeEntry)
+        .where(IncomeEntry.stripe_payment_id == _income_key_for_payment_event(event))
+        .values(**income_values)
+        .execution_options(synchronize_session=False)
     )
-    incomes = income_rows.scalars().all()
-    for income in incomes:
-        income.account_id = data.account_id
-        if data.customer_id is not None:
-            income.customer_id = data.customer_id
-        db.add(income)
 
     return StripeLinkEventResponse(
         linked=True,
         stripe_event_id=event.stripe_event_id,
         account_id=event.account_id,
         customer_id=event.customer_id,
-        updated_income_rows=len(incomes),
+        updated_income_rows=income_update.rowcount,
     )
 
 
@@ -785,39 +888,34 @@ async def rollout_parity_check(
     user: User = Depends(require_admin),
 ):
     period_key, month_start, next_month = _resolve_period(period)
-    rate_row = await db.execute(
-        select(ExchangeRate.rate)
-        .where(ExchangeRate.from_currency == "USD", ExchangeRate.to_currency == "MXN")
-        .order_by(ExchangeRate.effective_date.desc())
-        .limit(1)
-    )
-    usd_to_mxn = Decimal(str(rate_row.scalar() or 20))
+    usd_to_mxn = Decimal(str(await fx_cache.latest_rate(db, "USD", "MXN") or 20))
 
-    stripe_events = (
-        await db.execute(
-            select(StripePaymentEvent).where(
-                StripePaymentEvent.occurred_at >= month_start,
-                StripePaymentEvent.occurred_at < next_month,
-            )
+    # Sum per currency in Postgres and convert each total once, rather than
+    # converting (and rounding) every row in Python.
+    stripe_events = await db.execute(
+        select(StripePaymentEvent.currency, func.sum(StripePaymentEvent.amount))
+        .where(
+            StripePaymentEvent.occurred_at >= month_start,
+            StripePaymentEvent.occurred_at < next_month,
         )
-    ).scalars().all()
-
+        .group_by(StripePaymentEvent.currency)
+    )
     lifecycle_payments_mxn = Decimal("0")
-    for event in stripe_events:
-        lifecycle_payments_mxn += _to_mxn(Decimal(event.amount or 0), event.currency, usd_to_mxn)
+    for currency, amount in stripe_events.all():
+        lifecycle_payments_mxn += _to_mxn(Decimal(amount or 0), currency, usd_to_mxn)
     lifecycle_payments_mxn = lifecycle_payments_mxn.quantize(Decimal("0.01"))
 
-    incomes = (
-        await db.execute(
-            select(IncomeEntry).where(
-                IncomeEntry.date >= month_start,
-                IncomeEntry.date < next_month,
-            )
+    incomes = await db.execute(
+        select(IncomeEntry.currency, func.sum(IncomeEntry.amount))
+        .where(
+            IncomeEntry.date >= month_start,
+            IncomeEntry.date < next_month,
         )
-    ).scalars().all()
+        .group_by(IncomeEntry.currency)
+    )
     legacy_income_mxn = Decimal("0")
-    for income in incomes:
-        legacy_income_mxn += _to_mxn(Decimal(income.amount or 0), income.currency, usd_to_mxn)
+    for currency, amount in incomes.all():
+        legacy_income_mxn += _to_mxn(Decimal(amount or 0), currency, usd_to_mxn)
     legacy_income_mxn = legacy_income_mxn.quantize(Decimal("0.01"))
 
     difference_mxn = (lifecycle_payments_mxn - legacy_income_mxn).quantize(Decimal("0.01"))
@@ -849,7 +947,6 @@ async def create_manual_deposit(
     )
     db.add(entry)
     await db.flush()
-    await db.refresh(entry)
     return entry
 
 
@@ -875,16 +972,20 @@ async def list_manual_deposits(
 async def list_invoices(
     status: str | None = None,
     customer_id: uuid.UUID | None = None,
+    limit: int | None = Query(None, ge=1, le=500),
+    offset: int = Query(0, ge=0),
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    q = select(Invoice).order_by(Invoice.issue_date.desc())
+    """Newest first; ``limit``/``offset`` page as in ``list_income``."""
+    q = select(Invoice.__table__).order_by(Invoice.issue_date.desc(), Invoice.id)
     if status:
         q = q.where(Invoice.status == status)
     if customer_id:
         q = q.where(Invoice.customer_id == customer_id)
+    q = _paginate(q, limit, offset)
     result = await db.execute(q)
-    return result.scalars().all()
+    return result.all()
 
 
 @router.post("/invoices", response_model=InvoiceResponse, status_code=201)
@@ -905,8 +1006,7 @@ async def get_invoice(
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    result = await db.execute(select(Invoice).where(Invoice.id == invoice_id))
-    invoice = result.scalar_one_or_none()
+    invoice = await db.get(Invoice, invoice_id)
     if not invoice:
         raise HTTPException(status_code=404, detail="Invoice not found")
     return invoice
@@ -967,5 +1067,4 @@ async def update_cash_balance(
     )
     db.add(balance)
     await db.flush()
-    await db.refresh(balance)
     return balance
@@ -9,12 +9,15 @@ from typing import Any
 
 import stripe
 from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.common.config import settings
 from src.common.database import async_session
 from src.customers.models import Customer
-from src.finances.models import ExchangeRate, IncomeEntry, StripePaymentEvent, StripePayoutEvent
+from src.finances.bulk import bulk_insert_income
+from src.finances import fx_cache
+from src.finances.models import IncomeEntry, StripePaymentEvent, StripePayoutEvent
 from src.finances.recurrence import build_income_metadata
 
 logger = logging.getLogger(__name__)
@@ -105,15 +108,9 @@ async def _resolve_links(
 
 
 async def _get_mxn_to_usd(db: AsyncSession) -> Decimal:
-    result = await db.execute(
-        select(ExchangeRate)
-        .where(ExchangeRate.from_currency == "USD", ExchangeRate.to_currency == "MXN")
-        .order_by(ExchangeRate.effective_date.desc())
-        .limit(1)
-    )
-    rate = result.scalar_one_or_none()
-    if rate and rate.rate > 0:
-        return round(Decimal("1") / rate.rate, 6)
+    rate = await fx_cache.latest_rate(db, "USD", "MXN")
+    if rate and rate > 0:
+        return round(Decimal("1") / rate, 6)
     return DEFAULT_MXN_TO_USD
 
 
@@ -146,7 +143,14 @@ async def apply_stripe_event(
     event: dict[str, Any],
     *,
     source: str = "webhook",
+    income_rows: dict[str, dict[str, Any]] | None = None,
 ) -> str:
+    """Record one Stripe event and its income side effect.
+
+    When ``income_rows`` is given, the IncomeEntry is collected there
+    (keyed by stripe_payment_id) for a later ``bulk_insert_income``
+    instead of being added to the session.
+    """
     event_id = str(event.get("id") or "")
     event_type = str(event.get("type") or "")
     if not event_id:
@@ -160,7 +164,7 @@ async def apply_stripe_event(
         )
         if existing.scalar_one_or_none() is not None:
             return "duplicate"
-        return await _process_payment_event(db, event=event, source=source)
+        return await _process_payment_event(db, event=event, source=source, income_rows=income_rows)
 
     existing = await db.execute(
         select(StripePayoutEvent.id).where(StripePayoutEvent.stripe_event_id == event_id)
@@ -170,7 +174,13 @@ async def apply_stripe_event(
     return await _process_payout_event(db, event=event, source=source)
 
 
-async def _process_payment_event(db: AsyncSession, *, event: dict[str, Any], source: str) -> str:
+async def _process_payment_event(
+    db: AsyncSession,
+    *,
+    event: dict[str, Any],
+    source: str,
+    income_rows: dict[str, dict[str, Any]] | None = None,
+) -> str:
     event_id = str(event.get("id") or "")
     event_type = str(event.get("type") or "")
     event_created_at = _to_datetime(event.get("created"))
@@ -240,6 +250,7 @@ async def _process_payment_event(db: AsyncSession, *, event: dict[str, Any], sou
         account_id=account_id,
         amount=amount,
         currency=currency,
+        income_rows=income_rows,
     )
     return "processed"
 
@@ -257,6 +268,7 @@ async def _sync_income_from_payment_event(
     account_id: uuid.UUID | None,
     amount: Decimal,
     currency: str,
+    income_rows: dict[str, dict[str, Any]] | None = None,
 ) -> None:
     if event_type == "payment_intent.succeeded":
         stripe_payment_key = f"pi:{stripe_payment_intent_id or event_id}"
@@ -268,10 +280,7 @@ async def _sync_income_from_payment_event(
         description = f"Stripe refund {refund_key}"
         category = "refund"
 
-    existing = await db.execute(
-        select(IncomeEntry.id).where(IncomeEntry.stripe_payment_id == stripe_payment_key)
-    )
-    if existing.scalar_one_or_none() is not None:
+    if income_rows is not None and stripe_payment_key in income_rows:
         return
 
     mxn_to_usd = await _get_mxn_to_usd(db)
@@ -285,7 +294,8 @@ async def _sync_income_from_payment_event(
         None,
     )
 
-    income = IncomeEntry(
+    row = dict(
+        id=uuid.uuid4(),
         source="stripe",
         stripe_payment_id=stripe_payment_key,
         stripe_invoice_id=None,
@@ -301,7 +311,19 @@ async def _sync_income_from_payment_event(
         metadata_json=metadata,
         created_by=None,
     )
-    db.add(income)
+    if income_rows is not None:
+        income_rows[stripe_payment_key] = row
+        return
+    # Retried/duplicate deliveries are deduped by the unique index in the
+    # same round trip instead of a SELECT-then-INSERT.
+    await db.execute(
+        pg_insert(IncomeEntry)
+        .values(**row)
+        .on_conflict_do_nothing(
+            index_elements=[IncomeEntry.stripe_payment_id],
+            index_where=IncomeEntry.stripe_payment_id.isnot(None),
+        )
+    )
 
 
 async def _process_payout_event(db: AsyncSession, *, event: dict[str, Any], source: str) -> str:
@@ -414,9 +436,10 @@ async def reconcile_stripe_events(
         "failed_events": 0,
     }
 
+    income_rows: dict[str, dict[str, Any]] = {}
     for event in sorted_events:
         try:
-            status = await apply_stripe_event(db, event, source="reconcile")
+            status = await apply_stripe_event(db, event, source="reconcile", income_rows=income_rows)
         except Exception:
             logger.exception("Failed to process stripe event %s", event.get("id"))
             status = "failed"
@@ -430,6 +453,7 @@ async def reconcile_stripe_events(
         else:
             stats["failed_events"] += 1
 
+    await bulk_insert_income(db, list(income_rows.values()))
     return stats
 
 
@@ -1,5 +1,5 @@
 import uuid
-from datetime import date
+from datetime import date, timedelta
 from decimal import Decimal
 
 from fastapi import APIRouter, Depends
@@ -33,13 +33,12 @@ async def current_kpis(
     mrr = mrr_result.scalar() or Decimal("0")
     arr = mrr * 12
 
-    # Total revenue this month
+    # Total revenue this month (a plain date range so the date index applies)
+    month_start = today.replace(day=1)
+    next_month_start = (month_start + timedelta(days=32)).replace(day=1)
     rev_result = await db.execute(
         select(func.coalesce(func.sum(IncomeEntry.amount_usd), 0))
-        .where(
-            func.extract("year", IncomeEntry.date) == today.year,
-            func.extract("month", IncomeEntry.date) == today.month,
-        )
+        .where(IncomeEntry.date >= month_start, IncomeEntry.date < next_month_start)
     )
     total_revenue = rev_result.scalar() or Decimal("0")
 
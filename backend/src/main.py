@@ -9,6 +9,9 @@ from sqlalchemy import text
 from src.common.config import settings
 from src.common.database import engine, eva_engine
 from src.eva_platform.monitoring_service import FAILURE_STATES, monitoring_runner_loop, run_live_checks
+from src.eva_platform.ssh_client import setup_ssh_key
+from src.eva_platform.supabase_client import SupabaseAdminClient
+from src.facturas import service as facturapi
 from src.facturas.outbox import facturas_outbox_runner_loop
 from src.facturas.reconciliation import facturapi_reconciliation_runner_loop
 from src.finances.stripe_service import stripe_reconciliation_runner_loop
@@ -16,6 +19,13 @@ from src.finances.stripe_service import stripe_reconciliation_runner_loop
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # Resolve the infrastructure SSH key up front so a bad key fails the
+    # deploy instead of the first SSH request.
+    await setup_ssh_key()
+    # Open the pooled Supabase admin connection before the first provisioning
+    # request needs it. Best-effort; never blocks startup on failure.
+    await SupabaseAdminClient.warmup()
+
     # Background loops. Each owns a stop_event + task. On shutdown we set
     # the events, then cancel to unblock any in-flight awaits.
     loops: list[tuple[asyncio.Event, asyncio.Task]] = []
@@ -50,6 +60,9 @@ async def lifespan(app: FastAPI):
         except asyncio.CancelledError:
             pass
 
+    await SupabaseAdminClient.aclose()
+    await facturapi.aclose_client()
+
 
 app = FastAPI(
     title="EVA ERP",
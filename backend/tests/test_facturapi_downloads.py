@@ -0,0 +1,63 @@
+"""Streamed CFDI downloads and the stamped-file cache in facturas.service."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from src.facturas import service as facturapi
+
+
+async def _drain(chunks) -> bytes:
+    return b"".join([chunk async for chunk in chunks])
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    calls: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if request.url.path.endswith("/missing/pdf"):
+            return httpx.Response(404)
+        return httpx.Response(200, content=b"%PDF-1.4 body")
+
+    monkeypatch.setattr(facturapi.settings, "facturapi_api_key", "sk_test")
+    monkeypatch.setattr(
+        facturapi,
+        "client",
+        httpx.AsyncClient(
+            base_url=facturapi.FACTURAPI_BASE, transport=httpx.MockTransport(_handler)
+        ),
+    )
+    facturapi._download_cache.clear()
+    yield calls
+    facturapi._download_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_cacheable_download_is_fetched_once(upstream):
+    first = await _drain(await facturapi.download_pdf("fac_1", cacheable=True))
+    second = await _drain(await facturapi.download_pdf("fac_1", cacheable=True))
+
+    assert first == second == b"%PDF-1.4 body"
+    assert len(upstream) == 1
+
+
+@pytest.mark.asyncio
+async def test_uncacheable_download_always_hits_upstream(upstream):
+    await _drain(await facturapi.download_pdf("fac_1"))
+    await _drain(await facturapi.download_pdf("fac_1"))
+
+    assert len(upstream) == 2
+
+
+@pytest.mark.asyncio
+async def test_upstream_error_is_502_and_not_cached(upstream):
+    from fastapi import HTTPException
+
+    with pytest.raises(HTTPException) as exc_info:
+        await facturapi.download_pdf("missing", cacheable=True)
+
+    assert exc_info.value.status_code == 502
+    assert ("missing", "pdf") not in facturapi._download_cache
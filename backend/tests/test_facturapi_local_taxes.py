@@ -169,3 +169,12 @@ class TestFacturaStateDerivation:
         # Customer in CDMX — no cedular state should be persisted even if
         # someone accidentally passes a cedular_rate on a line item.
         assert state_from_zip("06600") is None
+
+
+def test_prebuilt_line_items_match_schema_conversion():
+    """Passing the persisted line_items_json dicts yields the same payload."""
+    from src.facturas.service import line_item_json
+
+    data = _factura(_line_item(cedular_rate=Decimal("0.02"), cedular_label="Cedular GTO"))
+    stored = [line_item_json(li) for li in data.line_items]
+    assert build_facturapi_payload(data, line_items=stored) == build_facturapi_payload(data)
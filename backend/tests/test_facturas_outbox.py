@@ -244,11 +244,10 @@ def test_backoff_delays_grow_monotonically():
     assert outbox._next_retry_delay(len(outbox._BACKOFF_SECONDS) - 1) <= timedelta(hours=24)
 
 
-def test_rebuild_factura_create_preserves_all_fields():
-    """The outbox re-derives a FacturaCreate from the Factura row when
-    rebuilding the FacturAPI payload. Dropping a field (e.g., cedular
-    rate) would silently emit a wrong CFDI, so this is a load-bearing
-    test."""
+def test_payload_from_factura_preserves_all_fields():
+    """The outbox builds the FacturAPI payload straight from the Factura
+    row's stored line items. Dropping a field (e.g., cedular rate) would
+    silently emit a wrong CFDI, so this is a load-bearing test."""
 
     factura = _new_pending_factura()
     # Add a cedular line item to exercise the full mapping.
@@ -266,16 +265,18 @@ def test_rebuild_factura_create_preserves_all_fields():
         }
     ]
 
-    data = outbox._rebuild_factura_create(factura)
+    payload = facturapi_service.build_facturapi_payload_from_factura(factura)
 
-    assert len(data.line_items) == 1
-    li = data.line_items[0]
-    assert li.product_key == "81112100"
-    assert li.unit_price == Decimal("3999.0")
-    assert li.isr_retention == Decimal("0.0125")
-    assert li.iva_retention == Decimal("0.106667")
-    assert li.cedular_rate == Decimal("0.02")
-    assert li.cedular_label == "Cedular GTO"
+    assert len(payload["items"]) == 1
+    product = payload["items"][0]["product"]
+    assert product["product_key"] == "81112100"
+    assert product["price"] == 3999.0
+    assert {"type": "ISR", "rate": 0.0125, "withholding": True} in product["taxes"]
+    assert {"type": "IVA", "rate": 0.106667, "withholding": True} in product["taxes"]
+    assert product["local_taxes"] == [
+        {"type": "Cedular GTO", "rate": 0.02, "withholding": True}
+    ]
+    assert payload["customer"]["tax_id"] == factura.customer_rfc
 
 
 @pytest.mark.asyncio
@@ -338,3 +339,77 @@ async def test_stamp_pending_factura_sets_attempted_at(monkeypatch):
     assert factura.stamp_attempted_at is None
     await outbox.stamp_pending_factura(_NoOpDB(), factura)
     assert factura.stamp_attempted_at is not None
+
+
+@pytest.mark.asyncio
+async def test_process_pending_facturas_posts_batch_concurrently(monkeypatch):
+    """A worker pass sends the claimed batch to FacturAPI concurrently and
+    still records every outcome on the row."""
+
+    facturas = [_new_pending_factura(), _new_pending_factura()]
+    in_flight = 0
+    peak = 0
+
+    async def _fake_create_invoice(payload):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return {"id": f"fac_{payload['idempotency_key']}", "status": "valid"}
+
+    monkeypatch.setattr(facturapi_service, "create_invoice", _fake_create_invoice)
+
+    class _BatchDB(_NoOpDB):
+        def __init__(self):
+            super().__init__()
+            self._results = [facturas, []]
+
+        async def execute(self, _stmt):
+            rows = self._results.pop(0)
+            return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: rows))
+
+    db = _BatchDB()
+    stats = await outbox.process_pending_facturas_once(db)
+
+    assert peak == 2
+    assert stats["facturas_stamped"] == 2
+    assert [f.status for f in facturas] == ["valid", "valid"]
+    assert db.committed is True
+
+
+@pytest.mark.asyncio
+async def test_process_pending_facturas_records_one_failure_in_batch(monkeypatch):
+    """One POST raising inside the gather doesn't sink the batch: the other
+    row still stamps and the failing row gets its retry bookkeeping."""
+
+    ok, failing = _new_pending_factura(), _new_pending_factura()
+
+    async def _fake_create_invoice(payload):
+        await asyncio.sleep(0)
+        if payload["idempotency_key"] == str(failing.id):
+            raise RuntimeError("connection reset by peer")
+        return {"id": f"fac_{payload['idempotency_key']}", "status": "valid"}
+
+    monkeypatch.setattr(facturapi_service, "create_invoice", _fake_create_invoice)
+
+    class _BatchDB(_NoOpDB):
+        def __init__(self):
+            super().__init__()
+            self._results = [[ok, failing], []]
+
+        async def execute(self, _stmt):
+            rows = self._results.pop(0)
+            return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: rows))
+
+    db = _BatchDB()
+    stats = await outbox.process_pending_facturas_once(db)
+
+    assert stats["facturas_stamped"] == 1
+    assert stats["facturas_retried"] == 1
+    assert ok.status == "valid"
+    assert failing.status == "pending_stamp"
+    assert failing.stamp_retry_count == 1
+    assert failing.last_stamp_error == "connection reset by peer"
+    assert failing.next_retry_at is not None
+    assert db.committed is True
@@ -14,7 +14,7 @@ inserts a matching row — so this bug can never silently regress.
 from __future__ import annotations
 
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 
 import pytest
@@ -315,6 +315,79 @@ async def test_reconciliation_syncs_cancellation():
     assert factura.cancelled_at is not None
 
 
+def _cancelling_factura(updated_at: datetime) -> Factura:
+    return Factura(
+        id=uuid.uuid4(),
+        facturapi_id="fac_cancelling",
+        cfdi_uuid="UUID-CANCELLING-0001",
+        customer_name="Cliente Demo",
+        customer_rfc="XAXX010101000",
+        use="G03",
+        payment_form="28",
+        payment_method="PUE",
+        subtotal=Decimal("100.00"),
+        tax=Decimal("16.00"),
+        isr_retention=Decimal("0.00"),
+        iva_retention=Decimal("0.00"),
+        local_retention=Decimal("0.00"),
+        total=Decimal("116.00"),
+        currency="MXN",
+        status="cancelling",
+        cancellation_status="pending",
+        created_at=updated_at,
+        updated_at=updated_at,
+    )
+
+
+def _cancelling_payload(cancellation_status: str) -> dict:
+    return {
+        **_f4_fixture(),
+        "id": "fac_cancelling",
+        "uuid": "UUID-CANCELLING-0001",
+        "status": "valid",
+        "cancellation_status": cancellation_status,
+    }
+
+
+@pytest.mark.asyncio
+async def test_reconciliation_restores_stale_cancelling_row():
+    """A background cancellation whose task died leaves the row
+    ``cancelling``; once FacturAPI shows nothing pending it is valid again."""
+    factura = _cancelling_factura(datetime.now(timezone.utc) - timedelta(hours=1))
+    db = _ReconDB(seed=[factura])
+    stats = {
+        "fetched": 0, "adopted": 0, "healed": 0, "cancelled_synced": 0,
+        "cancel_reverted": 0, "matched": 0, "skipped": 0, "failed": 0,
+    }
+
+    await reconciliation._adopt_or_heal(db, _cancelling_payload("none"), stats)
+
+    assert stats["cancel_reverted"] == 1
+    assert factura.status == "valid"
+    assert factura.cancellation_status is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("age", "cancellation_status"),
+    [(timedelta(minutes=1), "none"), (timedelta(hours=1), "pending")],
+)
+async def test_reconciliation_leaves_in_flight_cancellation(age, cancellation_status):
+    """A fresh claim, or one SAT still has pending (receiver acceptance),
+    is left alone."""
+    factura = _cancelling_factura(datetime.now(timezone.utc) - age)
+    db = _ReconDB(seed=[factura])
+    stats = {
+        "fetched": 0, "adopted": 0, "healed": 0, "cancelled_synced": 0,
+        "cancel_reverted": 0, "matched": 0, "skipped": 0, "failed": 0,
+    }
+
+    await reconciliation._adopt_or_heal(db, _cancelling_payload(cancellation_status), stats)
+
+    assert stats["matched"] == 1
+    assert factura.status == "cancelling"
+
+
 @pytest.mark.asyncio
 async def test_reconciliation_matched_row_is_no_op():
     """If the local row is already valid and FacturAPI agrees, nothing
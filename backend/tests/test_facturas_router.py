@@ -52,6 +52,9 @@ class _FakeDB:
     async def execute(self, _query):
         return _FakeResult(self.factura)
 
+    async def get(self, _model, _id):
+        return self.factura
+
     async def delete(self, _obj):
         self.deleted = True
 
@@ -173,6 +176,9 @@ class _CreateFakeDB:
     async def execute(self, _query):
         return _FakeResult(None)
 
+    async def get(self, _model, _id, **_kwargs):
+        return None
+
     async def flush(self):
         return None
 
@@ -336,9 +342,13 @@ def test_stamp_factura_clears_existing_facturapi_id():
 
 
 def test_download_pdf_draft_with_facturapi_id_succeeds(monkeypatch):
-    async def _fake_download_pdf(facturapi_id):
+    async def _chunks():
+        yield b"%PDF-1.4 "
+        yield b"fake"
+
+    async def _fake_download_pdf(facturapi_id, **_kwargs):
         assert facturapi_id == "fac_draft_xyz"
-        return b"%PDF-1.4 fake"
+        return _chunks()
 
     monkeypatch.setattr(facturapi, "download_pdf", _fake_download_pdf)
 
@@ -351,11 +361,11 @@ def test_download_pdf_draft_with_facturapi_id_succeeds(monkeypatch):
 
     assert response.status_code == 200
     assert response.headers["content-type"] == "application/pdf"
-    assert response.content.startswith(b"%PDF-")
+    assert response.content == b"%PDF-1.4 fake"
 
 
 def test_download_pdf_draft_without_facturapi_id_returns_400(monkeypatch):
-    async def _fake_download_pdf(_facturapi_id):
+    async def _fake_download_pdf(_facturapi_id, **_kwargs):
         raise AssertionError("must not call Facturapi when no facturapi_id")
 
     monkeypatch.setattr(facturapi, "download_pdf", _fake_download_pdf)
@@ -405,3 +415,135 @@ def test_delete_local_only_draft_does_not_call_facturapi(monkeypatch):
 
     assert response.status_code == 204
     assert fake_db.deleted is True
+
+
+def test_get_valid_factura_is_served_from_cache_until_cancelled(monkeypatch):
+    async def _fake_cancel_invoice(*_args, **_kwargs):
+        return {"cancellation_status": "accepted"}
+
+    monkeypatch.setattr(facturapi, "cancel_invoice", _fake_cancel_invoice)
+    factura = _build_factura(status="valid")
+    fake_db = _FakeDB(factura)
+    gets = {"count": 0}
+    original_get = fake_db.get
+
+    async def _counting_get(model, ident):
+        gets["count"] += 1
+        return await original_get(model, ident)
+
+    fake_db.get = _counting_get
+    client = _build_test_client(fake_db)
+
+    assert client.get(f"/facturas/{factura.id}").json()["status"] == "valid"
+    assert client.get(f"/facturas/{factura.id}").json()["status"] == "valid"
+    assert gets["count"] == 1
+
+    client.delete(f"/facturas/{factura.id}")
+    assert client.get(f"/facturas/{factura.id}").json()["status"] == "cancelled"
+
+
+def test_factura_cache_invalidation_waits_for_commit():
+    from sqlalchemy.orm import Session
+
+    from src.facturas import cache as factura_cache
+
+    factura = _build_factura(status="valid")
+    factura_cache.remember(factura)
+    session = Session()
+    session.begin()
+
+    factura_cache.invalidate_on_commit(session, factura.id)
+    # A read before the writer commits must still see the entry...
+    assert factura_cache.get(factura.id) is not None
+
+    session.commit()
+    # ...and the committed write drops it.
+    assert factura_cache.get(factura.id) is None
+
+
+def test_background_cancel_returns_202_and_finishes_after_response(monkeypatch):
+    import src.facturas.router as facturas_router_module
+
+    cancel_calls: list[tuple[str, str]] = []
+
+    async def _fake_cancel_invoice(facturapi_id, motive):
+        cancel_calls.append((facturapi_id, motive))
+        return {"cancellation_status": "accepted"}
+
+    monkeypatch.setattr(facturapi, "cancel_invoice", _fake_cancel_invoice)
+    factura = _build_factura(status="valid")
+    fake_db = _FakeDB(factura)
+
+    class _Session:
+        async def __aenter__(self):
+            return fake_db
+
+        async def __aexit__(self, *_exc):
+            return False
+
+    async def _commit():
+        return None
+
+    fake_db.commit = _commit
+    monkeypatch.setattr(facturas_router_module, "async_session", _Session)
+    client = _build_test_client(fake_db)
+
+    response = client.delete(f"/facturas/{factura.id}", params={"background": "true"})
+
+    assert response.status_code == 202
+    assert response.json()["status"] == "cancelling"
+    assert response.json()["cancellation_status"] == "pending"
+    # TestClient runs background tasks before returning.
+    assert cancel_calls == [("fac_test_123", "02")]
+    assert factura.status == "cancelled"
+    assert factura.cancellation_status == "accepted"
+
+
+def test_background_cancel_failure_keeps_factura_valid(monkeypatch):
+    import src.facturas.router as facturas_router_module
+
+    async def _failing_cancel_invoice(_facturapi_id, _motive):
+        raise RuntimeError("SAT unavailable")
+
+    monkeypatch.setattr(facturapi, "cancel_invoice", _failing_cancel_invoice)
+    factura = _build_factura(status="valid")
+    fake_db = _FakeDB(factura)
+
+    class _Session:
+        async def __aenter__(self):
+            return fake_db
+
+        async def __aexit__(self, *_exc):
+            return False
+
+    async def _commit():
+        return None
+
+    fake_db.commit = _commit
+    monkeypatch.setattr(facturas_router_module, "async_session", _Session)
+    client = _build_test_client(fake_db)
+
+    response = client.delete(f"/facturas/{factura.id}", params={"background": "true"})
+
+    assert response.status_code == 202
+    assert factura.status == "valid"
+    assert factura.cancellation_status == "rejected"
+    assert factura.cancelled_at is None
+
+
+@pytest.mark.parametrize("status", ["pending_stamp", "stamp_failed"])
+def test_background_cancel_rejects_unstamped_factura(monkeypatch, status):
+    async def _fake_cancel_invoice(*_args, **_kwargs):
+        raise AssertionError("must not call Facturapi for an unstamped factura")
+
+    monkeypatch.setattr(facturapi, "cancel_invoice", _fake_cancel_invoice)
+    factura = _build_factura(status=status)
+    factura.facturapi_id = None
+    fake_db = _FakeDB(factura)
+    client = _build_test_client(fake_db)
+
+    response = client.delete(f"/facturas/{factura.id}", params={"background": "true"})
+
+    assert response.status_code == 409
+    assert factura.status == status
+    assert factura.cancellation_status is None
@@ -84,3 +84,91 @@ def test_income_key_for_payment_event_handles_payment_intent_and_refund() -> Non
 
     assert _income_key_for_payment_event(payment_event) == "pi:pi_1"
     assert _income_key_for_payment_event(refund_event) == "refund:ch_1"
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_income_chunks_rows() -> None:
+    from src.finances.bulk import bulk_insert_income
+
+    class _FakeDB:
+        def __init__(self) -> None:
+            self.batches: list[int] = []
+
+        async def execute(self, stmt, params):
+            self.batches.append(len(params))
+
+    db = _FakeDB()
+    rows = [{"stripe_payment_id": f"pi:{i}"} for i in range(5)]
+    assert await bulk_insert_income(db, rows, chunk=2) == 5
+    assert db.batches == [2, 2, 1]
+
+    empty = _FakeDB()
+    assert await bulk_insert_income(empty, []) == 0
+    assert empty.batches == []
+
+
+@pytest.mark.asyncio
+async def test_fx_cache_reads_latest_rate_once_until_invalidated() -> None:
+    from src.finances import fx_cache
+
+    class _Result:
+        def __init__(self, value):
+            self._value = value
+
+        def scalar_one_or_none(self):
+            return self._value
+
+    class _FakeDB:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        async def execute(self, stmt, params):
+            self.calls += 1
+            return _Result(Decimal("17.50"))
+
+    fx_cache.invalidate()
+    db = _FakeDB()
+    assert await fx_cache.latest_rate(db, "USD", "MXN") == Decimal("17.50")
+    assert await fx_cache.latest_rate(db, "USD", "MXN") == Decimal("17.50")
+    assert db.calls == 1
+
+    fx_cache.invalidate()
+    await fx_cache.latest_rate(db, "USD", "MXN")
+    assert db.calls == 2
+    fx_cache.invalidate()
+
+
+def test_fx_cache_invalidation_waits_for_commit() -> None:
+    from sqlalchemy.orm import Session
+
+    from src.finances import fx_cache
+
+    fx_cache.invalidate()
+    fx_cache._cache.set(("USD", "MXN"), Decimal("17.50"))
+    session = Session()
+    session.begin()
+
+    fx_cache.invalidate_on_commit(session)
+    # Readers keep the old rate until the new row is committed...
+    assert fx_cache._cache.get(("USD", "MXN")) == Decimal("17.50")
+
+    session.commit()
+    # ...and the commit clears it.
+    assert fx_cache._cache.get(("USD", "MXN")) is None
+
+
+def test_current_rate_cache_cleared_only_after_commit() -> None:
+    from sqlalchemy.orm import Session
+
+    from src.finances import router as finances_router
+
+    cached = object()
+    finances_router._current_rate_cache.set("USD:MXN", cached)
+    session = Session()
+    session.begin()
+
+    finances_router._clear_current_rate_on_commit(session)
+    assert finances_router._current_rate_cache.get("USD:MXN") is cached
+
+    session.commit()
+    assert finances_router._current_rate_cache.get("USD:MXN") is None
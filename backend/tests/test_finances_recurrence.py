@@ -0,0 +1,182 @@
+import json
+from decimal import Decimal
+
+import pytest
+
+from src.finances.recurrence import (
+    extract_income_recurrence,
+    income_monthly_equivalent,
+    normalize_income_recurrence_payload,
+)
+
+
+@pytest.mark.parametrize(
+    ("metadata", "is_recurring", "expected"),
+    [
+        (None, True, ("monthly", None)),
+        ({}, False, ("one_time", None)),
+        ({"recurrence_type": " Custom ", "custom_interval_months": "3"}, True, ("custom", 3)),
+        ({"recurrence_type": "custom", "custom_interval_months": 0}, True, ("custom", 1)),
+        ({"recurrence_type": "custom", "custom_interval_months": 6.0}, True, ("custom", 6)),
+        ({"recurrence_type": "custom", "custom_interval_months": "+3"}, True, ("custom", 3)),
+        ({"recurrence_type": "custom", "custom_interval_months": "3.0"}, True, ("custom", 1)),
+        ({"recurrence_type": "weekly"}, True, ("monthly", None)),
+        ({"recurrence_type": ["monthly"]}, False, ("one_time", None)),
+    ],
+)
+def test_extract_income_recurrence(metadata, is_recurring, expected) -> None:
+    assert extract_income_recurrence(metadata, is_recurring) == expected
+
+
+def test_income_monthly_equivalent_rounds_to_cents() -> None:
+    assert income_monthly_equivalent(Decimal("100"), "one_time", None) == Decimal("0.00")
+    assert income_monthly_equivalent(Decimal("100"), "custom", 3) == Decimal("33.33")
+    assert income_monthly_equivalent(Decimal("99.995"), "monthly", None) == Decimal("100.00")
+
+
+def test_normalize_keeps_existing_custom_interval() -> None:
+    existing = {"recurrence_type": "custom", "custom_interval_months": 6}
+    assert normalize_income_recurrence_payload(
+        recurrence_type=None,
+        custom_interval_months=None,
+        is_recurring=None,
+        existing_metadata=existing,
+        existing_is_recurring=True,
+    ) == ("custom", 6, True)
+    assert normalize_income_recurrence_payload(
+        recurrence_type="custom",
+        custom_interval_months=None,
+        is_recurring=None,
+        existing_metadata=existing,
+        existing_is_recurring=True,
+    ) == ("custom", 6, True)
+
+
+def test_normalize_without_existing_defaults_interval() -> None:
+    assert normalize_income_recurrence_payload(
+        recurrence_type="custom", custom_interval_months=None, is_recurring=None
+    ) == ("custom", 1, True)
+    assert normalize_income_recurrence_payload(
+        recurrence_type=None, custom_interval_months=None, is_recurring=None
+    ) == ("one_time", None, False)
+
+
+# Metadata shapes the SQL twins must read exactly like the Python helpers.
+_SQL_PARITY_CASES = [
+    ({}, True),
+    ({}, False),
+    ({"recurrence_type": " Custom ", "custom_interval_months": "3"}, True),
+    ({"recurrence_type": "custom", "custom_interval_months": 6.0}, True),
+    ({"recurrence_type": "custom", "custom_interval_months": 6.7}, True),
+    ({"recurrence_type": "custom", "custom_interval_months": "+3"}, True),
+    ({"recurrence_type": "custom", "custom_interval_months": " 4\n"}, True),
+    ({"recurrence_type": "custom", "custom_interval_months": "3.0"}, True),
+    ({"recurrence_type": "custom", "custom_interval_months": "abc"}, True),
+    ({"recurrence_type": "custom", "custom_interval_months": 0}, True),
+    ({"recurrence_type": "custom", "custom_interval_months": -2}, True),
+    ({"recurrence_type": "custom", "custom_interval_months": True}, True),
+    ({"recurrence_type": "custom", "custom_interval_months": None}, True),
+    ({"recurrence_type": "custom"}, False),
+    ({"recurrence_type": "custom", "custom_interval_months": 7}, False),
+    ({"recurrence_type": "Monthly\t"}, False),
+    ({"recurrence_type": "weekly"}, True),
+    ({"recurrence_type": ["monthly"]}, False),
+    ({"recurrence_type": None}, True),
+    ({"recurrence_type": "one_time"}, True),
+]
+
+
+@pytest.mark.asyncio
+async def test_sql_twins_match_python_helpers() -> None:
+    """income_recurrence_sql, income_monthly_equivalent_sql and the stored
+    monthly_amount_usd expression must agree with extract_income_recurrence
+    + income_monthly_equivalent. Runs against the dev Postgres; skipped when
+    it isn't reachable."""
+    import sqlalchemy as sa
+    from sqlalchemy.dialects.postgresql import JSONB
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import NullPool
+
+    from src.common.config import settings
+    from src.finances.models import INCOME_MONTHLY_AMOUNT_USD_SQL
+    from src.finances.recurrence import income_monthly_equivalent_sql, income_recurrence_sql
+
+    engine = create_async_engine(settings.database_url, poolclass=NullPool)
+    try:
+        conn = await engine.connect()
+    except (OSError, sa.exc.DBAPIError) as exc:
+        await engine.dispose()
+        pytest.skip(f"Postgres not reachable: {exc}")
+
+    amount = Decimal("100.00")
+    try:
+        for metadata, is_recurring in _SQL_PARITY_CASES:
+            row = sa.select(
+                sa.literal(amount, sa.Numeric(12, 2)).label("amount_usd"),
+                sa.cast(sa.literal(json.dumps(metadata)), JSONB).label("metadata_json"),
+                sa.literal(is_recurring).label("is_recurring"),
+            ).subquery()
+            recurrence_type, interval = income_recurrence_sql(row.c.metadata_json, row.c.is_recurring)
+            result = await conn.execute(
+                sa.select(
+                    recurrence_type,
+                    interval,
+                    income_monthly_equivalent_sql(row.c.amount_usd, row.c.metadata_json, row.c.is_recurring),
+                    sa.literal_column(f"({INCOME_MONTHLY_AMOUNT_USD_SQL})"),
+                ).select_from(row)
+            )
+
+            expected_type, expected_interval = extract_income_recurrence(metadata, is_recurring)
+            expected_monthly = income_monthly_equivalent(amount, expected_type, expected_interval)
+            assert tuple(result.one()) == (
+                expected_type,
+                expected_interval,
+                expected_monthly,
+                expected_monthly,
+            ), (metadata, is_recurring)
+    finally:
+        await conn.close()
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_recurrence_filter_matches_returned_type() -> None:
+    """Filtering ``GET /finances/income`` on the recurrence_type a row is
+    listed with must include that row, and only that type may match it.
+    Runs against the dev Postgres; skipped when it isn't reachable."""
+    import sqlalchemy as sa
+    from sqlalchemy.dialects.postgresql import JSONB
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import NullPool
+
+    from src.common.config import settings
+    from src.finances.recurrence import ALLOWED_RECURRENCE_TYPES, income_recurrence_filter_sql
+
+    engine = create_async_engine(settings.database_url, poolclass=NullPool)
+    try:
+        conn = await engine.connect()
+    except (OSError, sa.exc.DBAPIError) as exc:
+        await engine.dispose()
+        pytest.skip(f"Postgres not reachable: {exc}")
+
+    try:
+        for metadata, is_recurring in _SQL_PARITY_CASES:
+            row = sa.select(
+                sa.cast(sa.literal(json.dumps(metadata)), JSONB).label("metadata_json"),
+                sa.literal(is_recurring).label("is_recurring"),
+            ).subquery()
+            matched = set()
+            for recurrence_type in sorted(ALLOWED_RECURRENCE_TYPES):
+                result = await conn.execute(
+                    sa.select(
+                        income_recurrence_filter_sql(row.c.metadata_json, row.c.is_recurring, recurrence_type)
+                    ).select_from(row)
+                )
+                if result.scalar_one():
+                    matched.add(recurrence_type)
+
+            expected_type, _ = extract_income_recurrence(metadata, is_recurring)
+            assert matched == {expected_type}, (metadata, is_recurring)
+    finally:
+        await conn.close()
+        await engine.dispose()
@@ -10,6 +10,8 @@ from src.eva_platform.supabase_client import (
     SupabaseInvalidPayloadError,
     SupabaseUpstreamUnavailableError,
     _is_duplicate_user_error,
+    _next_backoff,
+    _retry_after_seconds,
     map_supabase_error_to_http,
 )
 
@@ -83,3 +85,73 @@ def test_request_with_retries_raises_upstream_unavailable_on_transport_failure()
                 "https://example.com/auth/v1/admin/users",
             )
         )
+
+
+def test_retry_after_seconds_parses_delta_and_http_date():
+    req = httpx.Request("GET", "https://example.com")
+    assert _retry_after_seconds(httpx.Response(429, headers={"Retry-After": "2"}, request=req)) == 2.0
+    past = httpx.Response(503, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, request=req)
+    assert _retry_after_seconds(past) == 0.0
+    assert _retry_after_seconds(httpx.Response(429, headers={"Retry-After": "soon"}, request=req)) is None
+    assert _retry_after_seconds(httpx.Response(429, request=req)) is None
+
+
+def test_next_backoff_stays_within_decorrelated_bounds():
+    for prev in (0.0, 0.1, 1.0, 10.0):
+        delay = _next_backoff(prev)
+        assert 0.1 <= delay <= 5.0
+
+
+def test_paginated_lookup_walks_waves_until_match(monkeypatch):
+    from src.eva_platform import supabase_client
+
+    requested_pages: list[int] = []
+
+    class _PagedClient:
+        async def request(self, method: str, url: str, **kwargs):
+            page = kwargs["params"]["page"]
+            requested_pages.append(page)
+            if page == 10:
+                users = [{"id": "match-id", "email": "Owner@Example.com"}]
+            elif page > 10:
+                users = []
+            else:
+                users = [{"id": f"{page}-{i}", "email": f"u{page}-{i}@example.com"} for i in range(50)]
+            return httpx.Response(200, json={"users": users}, request=httpx.Request(method, url))
+
+    monkeypatch.setattr(supabase_client.settings, "supabase_url", "https://example.supabase.co")
+    monkeypatch.setattr(supabase_client.settings, "supabase_service_role_key", "service-role")
+    monkeypatch.setattr(SupabaseAdminClient, "_get_client", classmethod(lambda cls: _PagedClient()))
+    supabase_client._reset_config_cache()
+
+    try:
+        user = asyncio.run(SupabaseAdminClient._lookup_user_by_email_paginated("owner@example.com"))
+    finally:
+        supabase_client._reset_config_cache()
+
+    assert user is not None and user["id"] == "match-id"
+    assert max(requested_pages) <= 16
+
+
+def test_reset_config_cache_switches_service_role_key_on_next_request(monkeypatch):
+    from src.eva_platform import supabase_client
+
+    sent_keys: list[str] = []
+
+    class _RecordingClient:
+        async def request(self, method: str, url: str, **kwargs):
+            sent_keys.append(kwargs["headers"]["apikey"])
+            return httpx.Response(200, json={}, request=httpx.Request(method, url))
+
+    client = _RecordingClient()
+    monkeypatch.setattr(supabase_client.settings, "supabase_service_role_key", "old-key")
+    supabase_client._reset_config_cache()
+    try:
+        asyncio.run(SupabaseAdminClient._request_with_retries(client, "GET", "https://example.com/x"))
+        monkeypatch.setattr(supabase_client.settings, "supabase_service_role_key", "new-key")
+        supabase_client._reset_config_cache()
+        asyncio.run(SupabaseAdminClient._request_with_retries(client, "GET", "https://example.com/x"))
+    finally:
+        supabase_client._reset_config_cache()
+
+    assert sent_keys == ["old-key", "new-key"]
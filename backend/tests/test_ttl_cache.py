@@ -0,0 +1,35 @@
+from src.common import ttl_cache
+from src.common.ttl_cache import TTLCache
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(ttl_cache.time, "monotonic", lambda: now[0])
+    cache: TTLCache[str, int] = TTLCache(maxsize=4, ttl=10)
+
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=1)
+    now[0] = 105.0
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert "b" not in cache
+
+
+def test_ttl_cache_distinguishes_cached_none_from_miss():
+    cache: TTLCache[str, int | None] = TTLCache(maxsize=4, ttl=10)
+    sentinel = object()
+    cache.set("absent", None)
+
+    assert cache.get("absent", sentinel) is None
+    assert cache.get("unknown", sentinel) is sentinel
+
+
+def test_ttl_cache_evicts_oldest_when_full():
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+
+    assert "a" not in cache
+    assert cache.get("b") == 2 and cache.get("c") == 3